@@ -5,6 +5,7 @@ from datetime import timedelta
 from datetime import timezone
 
 import mailtrap as mt
+from mailtrap.email_logs_export import export_email_logs
 from mailtrap.models.email_logs import EmailLogsListFilters
 from mailtrap.models.email_logs import filter_ci_equal
 from mailtrap.models.email_logs import filter_string_equal
@@ -48,6 +49,18 @@ def get_message(message_id: str):
     return email_logs_api.get_by_id(message_id)
 
 
+def export_email_logs_to_csv(path: str) -> int:
+    """Stream all email logs from the last 2 days into a CSV file."""
+    since = datetime.now(timezone.utc) - timedelta(days=2)
+    filters = EmailLogsListFilters(sent_after=since.isoformat().replace("+00:00", "Z"))
+    return export_email_logs(
+        email_logs_api.iter_messages(filters=filters),
+        path,
+        output_format="csv",
+        custom_variable_keys=["user_id"],
+    )
+
+
 if __name__ == "__main__":
     # List first page
     response = list_email_logs()
@@ -1,6 +1,7 @@
 import mailtrap as mt
 from mailtrap.models.stats import SendingStatGroup
 from mailtrap.models.stats import SendingStats
+from mailtrap.models.stats import SendingStatsSnapshot
 from mailtrap.models.stats import StatsFilterParams
 
 API_TOKEN = "YOUR_API_TOKEN"
@@ -57,6 +58,11 @@ def get_stats_by_domain_with_filters(account_id: int) -> list[SendingStatGroup]:
     return stats_api.by_domain(account_id=account_id, params=params)
 
 
+def get_stats_snapshot(account_id: int) -> SendingStatsSnapshot:
+    params = StatsFilterParams(start_date="2026-01-01", end_date="2026-01-31")
+    return stats_api.snapshot(account_id=account_id, params=params)
+
+
 if __name__ == "__main__":
     print(get_stats(ACCOUNT_ID))
     print(get_stats_by_domain(ACCOUNT_ID))
@@ -65,3 +71,4 @@ if __name__ == "__main__":
     print(get_stats_by_date(ACCOUNT_ID))
     print(get_stats_with_filters(ACCOUNT_ID))
     print(get_stats_by_domain_with_filters(ACCOUNT_ID))
+    print(get_stats_snapshot(ACCOUNT_ID))
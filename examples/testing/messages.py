@@ -1,9 +1,11 @@
+from typing import Any
 from typing import Optional
 
 import mailtrap as mt
 from mailtrap.models.messages import AnalysisReport
 from mailtrap.models.messages import EmailMessage
 from mailtrap.models.messages import ForwardedMessage
+from mailtrap.models.messages import MessageArtifact
 from mailtrap.models.messages import SpamReport
 
 API_TOKEN = "YOUR_API_TOKEN"
@@ -77,6 +79,12 @@ def get_mail_headers(inbox_id: int, message_id: str) -> str:
     return messages_api.get_mail_headers(inbox_id=inbox_id, message_id=message_id)
 
 
+def get_messages_in_bulk(
+    messages: list[tuple[int, int]], artifacts: list[MessageArtifact]
+) -> dict[tuple[int, int], dict[MessageArtifact, Any]]:
+    return messages_api.get_bulk(messages=messages, artifacts=artifacts)
+
+
 if __name__ == "__main__":
     messages = list_messages(inbox_id=INBOX_ID)
     print(messages)
@@ -118,3 +126,9 @@ if __name__ == "__main__":
 
         headers = get_mail_headers(inbox_id=INBOX_ID, message_id=msg_id)
         print(headers)
+
+        bulk = get_messages_in_bulk(
+            messages=[(INBOX_ID, message.id) for message in messages],
+            artifacts=["text", "html", "spam_report"],
+        )
+        print(bulk)
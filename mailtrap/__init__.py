@@ -1,46 +1,148 @@
-from .client import BATCH_SEND_ENDPOINT_RESPONSE
-from .client import SEND_ENDPOINT_RESPONSE
-from .client import MailtrapClient
-from .exceptions import APIError
-from .exceptions import AuthorizationError
-from .exceptions import ClientConfigurationError
-from .exceptions import MailtrapError
-from .models.accounts import AccountAccessFilterParams
-from .models.api_tokens import ApiTokenResource
-from .models.api_tokens import CreateApiTokenParams
-from .models.contacts import ContactEventParams
-from .models.contacts import ContactExportFilter
-from .models.contacts import ContactListParams
-from .models.contacts import CreateContactExportParams
-from .models.contacts import CreateContactFieldParams
-from .models.contacts import CreateContactParams
-from .models.contacts import ImportContactParams
-from .models.contacts import UpdateContactFieldParams
-from .models.contacts import UpdateContactParams
-from .models.email_logs import EmailLogMessage
-from .models.email_logs import EmailLogsListFilters
-from .models.email_logs import EmailLogsListResponse
-from .models.inboxes import CreateInboxParams
-from .models.inboxes import UpdateInboxParams
-from .models.mail import Address
-from .models.mail import Attachment
-from .models.mail import BaseMail
-from .models.mail import BatchEmailRequest
-from .models.mail import BatchMail
-from .models.mail import BatchMailFromTemplate
-from .models.mail import BatchSendEmailParams
-from .models.mail import Disposition
-from .models.mail import Mail
-from .models.mail import MailFromTemplate
-from .models.messages import UpdateEmailMessageParams
-from .models.organizations import CreateSubAccountParams
-from .models.permissions import PermissionResourceParams
-from .models.projects import ProjectParams
-from .models.sending_domains import CreateSendingDomainParams
-from .models.sending_domains import SendSetupInstructionsParams
-from .models.stats import StatsFilterParams
-from .models.templates import CreateEmailTemplateParams
-from .models.templates import UpdateEmailTemplateParams
-from .models.webhooks import CreateWebhookParams
-from .models.webhooks import UpdateWebhookParams
-from .webhooks import verify_signature
+"""
+Mailtrap API client.
+
+Public names are imported from their modules on first access (PEP 562), so
+that e.g. `from mailtrap import MailtrapClient, Mail` only imports the sending
+models instead of building the pydantic schemas of every API up front.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from .cache import MessageCache
+    from .cache import ResponseCache
+    from .client import BATCH_SEND_ENDPOINT_RESPONSE
+    from .client import SEND_ENDPOINT_RESPONSE
+    from .client import MailtrapClient
+    from .client import WarmupReport
+    from .exceptions import APIError
+    from .exceptions import AuthorizationError
+    from .exceptions import ClientConfigurationError
+    from .exceptions import MailtrapError
+    from .instrumentation import Instrumentation
+    from .instrumentation import OpenTelemetryInstrumentation
+    from .instrumentation import PrometheusInstrumentation
+    from .models.accounts import AccountAccessFilterParams
+    from .models.api_tokens import ApiTokenResource
+    from .models.api_tokens import CreateApiTokenParams
+    from .models.contacts import ContactEventParams
+    from .models.contacts import ContactExportFilter
+    from .models.contacts import ContactListParams
+    from .models.contacts import CreateContactExportParams
+    from .models.contacts import CreateContactFieldParams
+    from .models.contacts import CreateContactParams
+    from .models.contacts import ImportContactParams
+    from .models.contacts import UpdateContactFieldParams
+    from .models.contacts import UpdateContactParams
+    from .models.email_logs import EmailLogMessage
+    from .models.email_logs import EmailLogsListFilters
+    from .models.email_logs import EmailLogsListResponse
+    from .models.inboxes import CreateInboxParams
+    from .models.inboxes import UpdateInboxParams
+    from .models.mail import Address
+    from .models.mail import Attachment
+    from .models.mail import BaseMail
+    from .models.mail import BatchEmailRequest
+    from .models.mail import BatchMail
+    from .models.mail import BatchMailFromTemplate
+    from .models.mail import BatchSendEmailParams
+    from .models.mail import Disposition
+    from .models.mail import Mail
+    from .models.mail import MailFromTemplate
+    from .models.messages import UpdateEmailMessageParams
+    from .models.organizations import CreateSubAccountParams
+    from .models.permissions import PermissionResourceParams
+    from .models.projects import ProjectParams
+    from .models.sending_domains import CreateSendingDomainParams
+    from .models.sending_domains import SendSetupInstructionsParams
+    from .models.stats import StatsFilterParams
+    from .models.templates import CreateEmailTemplateParams
+    from .models.templates import UpdateEmailTemplateParams
+    from .models.webhooks import CreateWebhookParams
+    from .models.webhooks import UpdateWebhookParams
+    from .transport import RecordingTransport
+    from .transport import ReplayTransport
+    from .webhooks import verify_signature
+
+# Public name -> module (relative to this package) defining it
+_LAZY_IMPORTS = {
+    "MessageCache": ".cache",
+    "ResponseCache": ".cache",
+    "BATCH_SEND_ENDPOINT_RESPONSE": ".client",
+    "SEND_ENDPOINT_RESPONSE": ".client",
+    "MailtrapClient": ".client",
+    "WarmupReport": ".client",
+    "APIError": ".exceptions",
+    "AuthorizationError": ".exceptions",
+    "ClientConfigurationError": ".exceptions",
+    "MailtrapError": ".exceptions",
+    "Instrumentation": ".instrumentation",
+    "OpenTelemetryInstrumentation": ".instrumentation",
+    "PrometheusInstrumentation": ".instrumentation",
+    "AccountAccessFilterParams": ".models.accounts",
+    "ApiTokenResource": ".models.api_tokens",
+    "CreateApiTokenParams": ".models.api_tokens",
+    "ContactEventParams": ".models.contacts",
+    "ContactExportFilter": ".models.contacts",
+    "ContactListParams": ".models.contacts",
+    "CreateContactExportParams": ".models.contacts",
+    "CreateContactFieldParams": ".models.contacts",
+    "CreateContactParams": ".models.contacts",
+    "ImportContactParams": ".models.contacts",
+    "UpdateContactFieldParams": ".models.contacts",
+    "UpdateContactParams": ".models.contacts",
+    "EmailLogMessage": ".models.email_logs",
+    "EmailLogsListFilters": ".models.email_logs",
+    "EmailLogsListResponse": ".models.email_logs",
+    "CreateInboxParams": ".models.inboxes",
+    "UpdateInboxParams": ".models.inboxes",
+    "Address": ".models.mail",
+    "Attachment": ".models.mail",
+    "BaseMail": ".models.mail",
+    "BatchEmailRequest": ".models.mail",
+    "BatchMail": ".models.mail",
+    "BatchMailFromTemplate": ".models.mail",
+    "BatchSendEmailParams": ".models.mail",
+    "Disposition": ".models.mail",
+    "Mail": ".models.mail",
+    "MailFromTemplate": ".models.mail",
+    "UpdateEmailMessageParams": ".models.messages",
+    "CreateSubAccountParams": ".models.organizations",
+    "PermissionResourceParams": ".models.permissions",
+    "ProjectParams": ".models.projects",
+    "CreateSendingDomainParams": ".models.sending_domains",
+    "SendSetupInstructionsParams": ".models.sending_domains",
+    "StatsFilterParams": ".models.stats",
+    "CreateEmailTemplateParams": ".models.templates",
+    "UpdateEmailTemplateParams": ".models.templates",
+    "CreateWebhookParams": ".models.webhooks",
+    "UpdateWebhookParams": ".models.webhooks",
+    "RecordingTransport": ".transport",
+    "ReplayTransport": ".transport",
+    "verify_signature": ".webhooks",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        # Submodules stay reachable as attributes, e.g. `mailtrap.models`
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r}"
+            ) from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
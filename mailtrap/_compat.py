@@ -0,0 +1,44 @@
+"""Loaders of optional dependencies and fork handling shared by the package."""
+
+import importlib
+import os
+import weakref
+from types import ModuleType
+from typing import Optional
+from typing import Protocol
+
+
+class _ForkSensitive(Protocol):
+    def _reset_after_fork(self) -> None: ...
+
+
+_fork_sensitive: "weakref.WeakSet[_ForkSensitive]" = weakref.WeakSet()
+
+
+def optional_module(name: str) -> Optional[ModuleType]:
+    """Import `name`, or return None when it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+def optional_numpy() -> Optional[ModuleType]:
+    return optional_module("numpy")
+
+
+def reset_after_fork(obj: _ForkSensitive) -> None:
+    """
+    Call `obj._reset_after_fork()` in the child of every fork, for as long as
+    `obj` is alive, to replace locks, pools and sockets inherited from the parent.
+    """
+    _fork_sensitive.add(obj)
+
+
+def _reset_all_after_fork() -> None:
+    for obj in list(_fork_sensitive):
+        obj._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows, which has no fork
+    os.register_at_fork(after_in_child=_reset_all_after_fork)
@@ -0,0 +1,76 @@
+"""Thread pool shared by the concurrent helpers (bulk fetches, downloads, snapshots)."""
+
+import threading
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+from typing import TypeVar
+
+from mailtrap._compat import reset_after_fork
+from mailtrap.config import SHARED_POOL_MAX_WORKERS
+
+T = TypeVar("T")
+
+
+class _SharedExecutor:
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def get(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=SHARED_POOL_MAX_WORKERS, thread_name_prefix="mailtrap"
+                )
+            return self._executor
+
+    def _reset_after_fork(self) -> None:
+        # The pool's threads do not exist in a forked child
+        self._executor = None
+        self._lock = threading.Lock()
+
+
+_shared_executor = _SharedExecutor()
+
+
+def shared_executor() -> ThreadPoolExecutor:
+    """
+    The process-wide pool, created on first use. Its threads are started on
+    demand, so an idle pool costs nothing.
+    """
+    return _shared_executor.get()
+
+
+def run_concurrently(
+    calls: Iterable[Callable[[], T]],
+    max_workers: int,
+    executor: Optional[Executor] = None,
+) -> list[T]:
+    """
+    Run `calls` on `executor` (the shared pool by default) with at most
+    `max_workers` of them in flight, and return their results in order.
+
+    The first exception is raised as soon as it is reached: calls that have
+    not started yet are cancelled and the remaining ones are never submitted.
+    """
+    if executor is None:
+        executor = shared_executor()
+    results: list[T] = []
+    pending: deque[Future[T]] = deque()
+    try:
+        for call in calls:
+            pending.append(executor.submit(call))
+            if len(pending) >= max_workers:
+                results.append(pending.popleft().result())
+        while pending:
+            results.append(pending.popleft().result())
+    finally:
+        for future in pending:
+            future.cancel()
+    return results
@@ -3,10 +3,23 @@ from mailtrap.http import HttpClient
 
 
 class EmailLogsBaseApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
+    def __init__(
+        self,
+        client: HttpClient,
+        account_id: str,
+        trusted_parsing: bool = False,
+        lazy_events: bool = False,
+    ) -> None:
         self._account_id = account_id
         self._client = client
+        self._trusted_parsing = trusted_parsing
+        self._lazy_events = lazy_events
 
     @property
     def email_logs(self) -> EmailLogsApi:
-        return EmailLogsApi(client=self._client, account_id=self._account_id)
+        return EmailLogsApi(
+            client=self._client,
+            account_id=self._account_id,
+            trusted_parsing=self._trusted_parsing,
+            lazy_events=self._lazy_events,
+        )
@@ -1,5 +1,15 @@
+import os
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from typing import IO
 from typing import Optional
+from typing import Union
 
+from mailtrap._concurrency import run_concurrently
+from mailtrap.config import DEFAULT_CHUNK_SIZE
+from mailtrap.config import DEFAULT_MAX_WORKERS
 from mailtrap.http import HttpClient
 from mailtrap.models.attachments import Attachment
 
@@ -28,6 +38,108 @@ class AttachmentsApi:
         response = self._client.get(self._api_path(inbox_id, message_id, attachment_id))
         return Attachment(**response)
 
+    def stream(
+        self,
+        inbox_id: int,
+        message_id: int,
+        attachment_id: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[bytes]:
+        """Iterate over the attachment content in byte chunks without buffering it."""
+        return self._client.stream(
+            self._download_path(inbox_id, message_id, attachment_id),
+            chunk_size=chunk_size,
+        )
+
+    def download(
+        self,
+        inbox_id: int,
+        message_id: int,
+        attachment_id: int,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream the attachment content to a file path or binary file object.
+        Returns the number of bytes written.
+        """
+        return self._client.download(
+            self._download_path(inbox_id, message_id, attachment_id),
+            destination,
+            chunk_size=chunk_size,
+        )
+
+    def download_all(
+        self,
+        inbox_id: int,
+        message_id: int,
+        directory: Union[str, "os.PathLike[str]"],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None,
+    ) -> dict[int, Path]:
+        """
+        Download all attachments of a message concurrently, on the thread pool
+        shared by the client's bulk helpers or on `executor`. On the first
+        error the downloads that have not started yet are cancelled.
+
+        Every attachment is stored as `<directory>/<attachment_id>/<filename>`,
+        or `.../attachment_<attachment_id>` when the filename has no usable
+        last component (e.g. "" or "..").
+        The directory doubles as a cache: attachments whose file already exists
+        with the size reported by the API are not downloaded again, so the same
+        directory can be shared across messages and test runs.
+
+        Args:
+            inbox_id (int): ID of the inbox the message belongs to.
+            message_id (int): ID of the message.
+            directory (Union[str, os.PathLike[str]]): Cache directory.
+            max_workers (int): Maximum number of downloads in flight.
+            executor (Optional[Executor]): Executor to run the downloads on.
+
+        Returns:
+            dict[int, Path]: Local file paths keyed by attachment ID.
+        """
+        attachments = self.get_list(inbox_id, message_id)
+        paths = {
+            attachment.id: self._cached_path(directory, attachment)
+            for attachment in attachments
+        }
+        missing = [
+            attachment
+            for attachment in attachments
+            if not self._is_cached(paths[attachment.id], attachment)
+        ]
+        if not missing:
+            return paths
+
+        def fetch(attachment: Attachment) -> int:
+            path = paths[attachment.id]
+            path.parent.mkdir(parents=True, exist_ok=True)
+            return self.download(inbox_id, message_id, attachment.id, path)
+
+        run_concurrently(
+            (partial(fetch, attachment) for attachment in missing), max_workers, executor
+        )
+        return paths
+
+    @staticmethod
+    def _cached_path(
+        directory: Union[str, "os.PathLike[str]"], attachment: Attachment
+    ) -> Path:
+        # The name comes from the server: keep its last component only, and never
+        # one that points at the attachment directory itself or its parent
+        filename = os.path.basename(attachment.filename.replace("\\", "/"))
+        if filename in ("", ".", ".."):
+            filename = f"attachment_{attachment.id}"
+        return Path(directory) / str(attachment.id) / filename
+
+    @staticmethod
+    def _is_cached(path: Path, attachment: Attachment) -> bool:
+        return path.is_file() and path.stat().st_size == attachment.attachment_size
+
+    def _download_path(self, inbox_id: int, message_id: int, attachment_id: int) -> str:
+        return f"{self._api_path(inbox_id, message_id, attachment_id)}/download"
+
     def _api_path(
         self,
         inbox_id: int,
@@ -1,17 +1,35 @@
 """Email Logs API resource - list and get email sending logs."""
 
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from typing import Optional
+from typing import Union
+from urllib.parse import urlencode
 
+from mailtrap._concurrency import shared_executor
+from mailtrap.config import DEFAULT_MAX_WORKERS
 from mailtrap.http import HttpClient
+from mailtrap.models.email_logs import EmailLogHydrationResult
 from mailtrap.models.email_logs import EmailLogMessage
 from mailtrap.models.email_logs import EmailLogsListFilters
 from mailtrap.models.email_logs import EmailLogsListResponse
 
 
 class EmailLogsApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
+    def __init__(
+        self,
+        client: HttpClient,
+        account_id: str,
+        trusted_parsing: bool = False,
+        lazy_events: bool = False,
+    ) -> None:
         self._account_id = account_id
         self._client = client
+        self._trusted_parsing = trusted_parsing
+        self._lazy_events = lazy_events
 
     def get_list(
         self,
@@ -23,22 +41,49 @@ class EmailLogsApi:
         Use search_after with next_page_cursor from the previous response for
         the next page.
         """
-        params: dict[str, object] = {}
-        if filters is not None:
-            params.update(filters.to_params())
+        query = [filters.query_string] if filters is not None else []
         if search_after is not None:
-            params["search_after"] = search_after
-        response = self._client.get(self._api_path(), params=params or None)
+            query.append(urlencode({"search_after": search_after}))
+        response = self._client.get(
+            self._api_path(), params="&".join(filter(None, query)) or None
+        )
         if not isinstance(response, dict):
             response = {}
         raw_messages = response.get("messages", [])
-        messages = [EmailLogMessage.from_api(msg) for msg in raw_messages]
+        messages = EmailLogMessage.from_api_list(
+            raw_messages, trusted=self._trusted_parsing, lazy_events=self._lazy_events
+        )
         return EmailLogsListResponse(
             messages=messages,
             total_count=response.get("total_count", 0),
             next_page_cursor=response.get("next_page_cursor"),
         )
 
+    def iter_pages(
+        self,
+        filters: Optional[EmailLogsListFilters] = None,
+        search_after: Optional[str] = None,
+    ) -> Iterator[EmailLogsListResponse]:
+        """
+        Iterate over all pages of email logs, following next_page_cursor.
+        Start from search_after to resume an interrupted iteration.
+        """
+        while True:
+            page = self.get_list(filters=filters, search_after=search_after)
+            yield page
+            if not page.next_page_cursor or not page.messages:
+                return
+            search_after = page.next_page_cursor
+
+    def iter_messages(
+        self,
+        filters: Optional[EmailLogsListFilters] = None,
+        search_after: Optional[str] = None,
+    ) -> Iterator[EmailLogMessage]:
+        """Iterate over email log messages of all pages, newest first."""
+        for page in self.iter_pages(filters=filters, search_after=search_after):
+            yield from page.messages
+
     def get_by_id(self, sending_message_id: str) -> EmailLogMessage:
         """Get a single email log message by its UUID."""
         response = self._client.get(self._api_path(sending_message_id))
@@ -48,7 +93,55 @@ class EmailLogsApi:
                 f"{sending_message_id!r}: expected a JSON object, got "
                 f"{type(response).__name__}: {response!r}"
             )
-        return EmailLogMessage.from_api(response)
+        return EmailLogMessage.from_api(
+            response, trusted=self._trusted_parsing, lazy_events=self._lazy_events
+        )
+
+    def hydrate(
+        self,
+        messages: Union[EmailLogsListResponse, Iterable[Union[EmailLogMessage, str]]],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None,
+    ) -> Iterator[EmailLogHydrationResult]:
+        """
+        Fetch full details (events, raw_message_url) for many messages.
+
+        Accepts a list page, or any iterable of summaries or message ids (e.g.
+        iter_messages()), which is consumed lazily with at most `max_workers`
+        messages queued ahead. Up to `max_workers` requests run concurrently,
+        on the thread pool shared by the client's bulk helpers or on
+        `executor`, and results are yielded in input order. A failed request
+        does not stop the iteration: its result carries the exception in `error`.
+        Closing the iterator early cancels the requests that have not started.
+        """
+        if isinstance(messages, EmailLogsListResponse):
+            messages = messages.messages
+        message_ids = (
+            message if isinstance(message, str) else message.message_id
+            for message in messages
+        )
+
+        def fetch(message_id: str) -> EmailLogHydrationResult:
+            try:
+                return EmailLogHydrationResult(
+                    message_id=message_id, message=self.get_by_id(message_id)
+                )
+            except Exception as exc:
+                return EmailLogHydrationResult(message_id=message_id, error=exc)
+
+        if executor is None:
+            executor = shared_executor()
+        pending: deque[Future[EmailLogHydrationResult]] = deque()
+        try:
+            for message_id in message_ids:
+                pending.append(executor.submit(fetch, message_id))
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
 
     def _api_path(self, sending_message_id: Optional[str] = None) -> str:
         path = f"/api/accounts/{self._account_id}/email_logs"
@@ -1,20 +1,63 @@
+import json
+import os
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from email.message import Message
+from email.parser import BytesFeedParser
+from functools import partial
+from typing import IO
 from typing import Any
 from typing import Optional
+from typing import Union
 from typing import cast
 
+from mailtrap._concurrency import run_concurrently
+from mailtrap.cache import MessageCache
+from mailtrap.config import DEFAULT_CHUNK_SIZE
+from mailtrap.config import DEFAULT_MAX_WORKERS
 from mailtrap.http import HttpClient
 from mailtrap.models.messages import AnalysisReport
 from mailtrap.models.messages import AnalysisReportResponse
 from mailtrap.models.messages import EmailMessage
 from mailtrap.models.messages import ForwardedMessage
+from mailtrap.models.messages import MessageArtifact
 from mailtrap.models.messages import SpamReport
 from mailtrap.models.messages import UpdateEmailMessageParams
 
+_ARTIFACT_PATHS: dict[str, str] = {
+    "html": "body.html",
+    "html_source": "body.htmlsource",
+    "text": "body.txt",
+    "raw": "body.raw",
+    "eml": "body.eml",
+    "headers": "mail_headers",
+    "spam_report": "spam_report",
+    "html_analysis": "analyze",
+}
+
+_ARTIFACT_GETTERS: dict[str, str] = {
+    "html": "get_html_message",
+    "html_source": "get_html_source",
+    "text": "get_text_message",
+    "raw": "get_raw_message",
+    "eml": "get_message_as_eml",
+    "headers": "get_mail_headers",
+    "spam_report": "get_spam_report",
+    "html_analysis": "get_html_analysis",
+}
+
 
 class MessagesApi:
-    def __init__(self, client: HttpClient, account_id: str) -> None:
+    def __init__(
+        self,
+        client: HttpClient,
+        account_id: str,
+        cache: Optional[MessageCache] = None,
+    ) -> None:
         self._account_id = account_id
         self._client = client
+        self._cache = cache
 
     def show_message(self, inbox_id: int, message_id: int) -> EmailMessage:
         """Get email message by ID."""
@@ -99,52 +142,175 @@ class MessagesApi:
 
     def get_spam_report(self, inbox_id: int, message_id: int) -> SpamReport:
         """Get a brief spam report by message ID."""
-        response = self._client.get(f"{self._api_path(inbox_id, message_id)}/spam_report")
+        response = self._get_artifact(inbox_id, message_id, "spam_report")
         return SpamReport(**response["report"])
 
     def get_html_analysis(self, inbox_id: int, message_id: int) -> AnalysisReport:
         """Get a brief HTML report by message ID."""
-        response = self._client.get(f"{self._api_path(inbox_id, message_id)}/analyze")
+        response = self._get_artifact(inbox_id, message_id, "html_analysis")
         return AnalysisReportResponse(**response).report
 
     def get_text_message(self, inbox_id: int, message_id: int) -> str:
         """Get text email body, if it exists."""
-        return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.txt")
-        )
+        return cast(str, self._get_artifact(inbox_id, message_id, "text"))
 
     def get_raw_message(self, inbox_id: int, message_id: int) -> str:
         """Get raw email body."""
-        return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.raw")
-        )
+        return cast(str, self._get_artifact(inbox_id, message_id, "raw"))
 
     def get_html_source(self, inbox_id: int, message_id: int) -> str:
         """Get HTML source of email."""
-        return cast(
-            str,
-            self._client.get(f"{self._api_path(inbox_id, message_id)}/body.htmlsource"),
-        )
+        return cast(str, self._get_artifact(inbox_id, message_id, "html_source"))
 
     def get_html_message(self, inbox_id: int, message_id: int) -> str:
         """Get formatted HTML email body. Not applicable for plain text emails."""
-        return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.html")
-        )
+        return cast(str, self._get_artifact(inbox_id, message_id, "html"))
 
     def get_message_as_eml(self, inbox_id: int, message_id: int) -> str:
         """Get email message in .eml format."""
-        return cast(
-            str, self._client.get(f"{self._api_path(inbox_id, message_id)}/body.eml")
+        return cast(str, self._get_artifact(inbox_id, message_id, "eml"))
+
+    def stream_raw_message(
+        self, inbox_id: int, message_id: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """Iterate over the raw email body in byte chunks without buffering it."""
+        return self._client.stream(
+            f"{self._api_path(inbox_id, message_id)}/body.raw", chunk_size=chunk_size
+        )
+
+    def download_raw_message(
+        self,
+        inbox_id: int,
+        message_id: int,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream the raw email body to a file path or binary file object.
+        Returns the number of bytes written.
+        """
+        return self._client.download(
+            f"{self._api_path(inbox_id, message_id)}/body.raw",
+            destination,
+            chunk_size=chunk_size,
         )
 
+    def download_message_as_eml(
+        self,
+        inbox_id: int,
+        message_id: int,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream the email message in .eml format to a file path or binary file object.
+        Returns the number of bytes written.
+        """
+        return self._client.download(
+            f"{self._api_path(inbox_id, message_id)}/body.eml",
+            destination,
+            chunk_size=chunk_size,
+        )
+
+    def parse_raw_message(
+        self, inbox_id: int, message_id: int, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> Message:
+        """
+        Parse the raw email body incrementally with the stdlib `email` feed parser,
+        feeding it chunks as they arrive instead of a fully decoded string.
+        """
+        parser = BytesFeedParser()
+        for chunk in self.stream_raw_message(inbox_id, message_id, chunk_size):
+            parser.feed(chunk)
+        return parser.close()
+
     def get_mail_headers(self, inbox_id: int, message_id: int) -> dict[str, Any]:
         """Get mail headers of a message."""
-        response = self._client.get(
-            f"{self._api_path(inbox_id, message_id)}/mail_headers"
-        )
+        response = self._get_artifact(inbox_id, message_id, "headers")
         return cast(dict[str, Any], response["headers"])
 
+    def get_bulk(
+        self,
+        messages: Iterable[tuple[int, int]],
+        artifacts: Iterable[MessageArtifact],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        executor: Optional[Executor] = None,
+    ) -> dict[tuple[int, int], dict[MessageArtifact, Any]]:
+        """
+        Fetch several artifacts of many messages concurrently.
+
+        All `(inbox_id, message_id)` x `artifact` requests run on the thread
+        pool shared by the client's bulk helpers, or on `executor`. On the
+        first error the requests that have not started yet are cancelled.
+
+        Args:
+            messages (Iterable[tuple[int, int]]): `(inbox_id, message_id)` pairs.
+            artifacts (Iterable[MessageArtifact]):
+                Artifacts to fetch for every message: `"html"`, `"html_source"`,
+                `"text"`, `"raw"`, `"eml"`, `"headers"`, `"spam_report"` or
+                `"html_analysis"`.
+            max_workers (int): Maximum number of requests in flight.
+            executor (Optional[Executor]): Executor to run the requests on.
+
+        Returns:
+            dict[tuple[int, int], dict[MessageArtifact, Any]]:
+                Results keyed by `(inbox_id, message_id)` and then by artifact,
+                holding the same values the single-message getters return.
+
+        Raises:
+            ValueError: If an unknown artifact is requested.
+            APIError: The first error raised by any of the underlying requests.
+        """
+        pairs = list(dict.fromkeys(messages))
+        wanted = list(dict.fromkeys(artifacts))
+        unknown = [artifact for artifact in wanted if artifact not in _ARTIFACT_GETTERS]
+        if unknown:
+            raise ValueError(f"Unknown message artifacts: {', '.join(unknown)}")
+
+        results: dict[tuple[int, int], dict[MessageArtifact, Any]] = {
+            pair: {} for pair in pairs
+        }
+        if not pairs or not wanted:
+            return results
+
+        requests = [(pair, artifact) for pair in pairs for artifact in wanted]
+        values = run_concurrently(
+            (
+                partial(getattr(self, _ARTIFACT_GETTERS[artifact]), *pair)
+                for pair, artifact in requests
+            ),
+            max_workers,
+            executor,
+        )
+        for (pair, artifact), value in zip(requests, values):
+            results[pair][artifact] = value
+        return results
+
+    def _get_artifact(
+        self, inbox_id: int, message_id: int, artifact: MessageArtifact
+    ) -> Any:
+        """
+        Fetch an immutable message artifact, consulting the message cache if any.
+        Cached entries hold the JSON-encoded response exactly as it was received.
+        """
+        path = f"{self._api_path(inbox_id, message_id)}/{_ARTIFACT_PATHS[artifact]}"
+        if self._cache is None:
+            return self._client.get(path)
+
+        cached = self._cache.get(self._account_id, inbox_id, message_id, artifact)
+        if cached is not None:
+            return json.loads(cached)
+
+        response = self._client.get(path)
+        self._cache.set(
+            self._account_id,
+            inbox_id,
+            message_id,
+            artifact,
+            json.dumps(response).encode("utf-8"),
+        )
+        return response
+
     def _api_path(self, inbox_id: int, message_id: Optional[int] = None) -> str:
         path = f"/api/accounts/{self._account_id}/inboxes/{inbox_id}/messages"
         if message_id:
@@ -1,13 +1,22 @@
+import json
+from concurrent.futures import Executor
+from functools import partial
+from typing import Any
 from typing import Literal
+from typing import Optional
 
+from mailtrap._concurrency import run_concurrently
+from mailtrap.cache import ResponseCache
 from mailtrap.http import HttpClient
 from mailtrap.models.stats import SendingStatGroup
 from mailtrap.models.stats import SendingStats
+from mailtrap.models.stats import SendingStatsColumns
+from mailtrap.models.stats import SendingStatsSnapshot
 from mailtrap.models.stats import StatsFilterParams
 
 GroupKey = Literal["domains", "categories", "email_service_providers", "date"]
 
-_GROUP_KEYS = {
+_GROUP_KEYS: dict[GroupKey, str] = {
     "domains": "sending_domain_id",
     "categories": "category",
     "email_service_providers": "email_service_provider",
@@ -16,15 +25,13 @@ _GROUP_KEYS = {
 
 
 class StatsApi:
-    def __init__(self, client: HttpClient) -> None:
+    def __init__(self, client: HttpClient, cache: Optional[ResponseCache] = None) -> None:
         self._client = client
+        self._cache = cache
 
     def get(self, account_id: int, params: StatsFilterParams) -> SendingStats:
         """Get aggregated sending stats."""
-        response = self._client.get(
-            self._base_path(account_id),
-            params=params.api_query_params,
-        )
+        response = self._fetch(account_id, None, params)
         return SendingStats(**response)
 
     def by_domain(
@@ -51,12 +58,63 @@ class StatsApi:
         """Get sending stats grouped by date."""
         return self._grouped_stats(account_id, "date", params)
 
+    def grouped_columns(
+        self,
+        account_id: int,
+        group: GroupKey,
+        params: StatsFilterParams,
+        use_numpy: Optional[bool] = None,
+    ) -> SendingStatsColumns:
+        """
+        Get grouped sending stats as typed metric columns aligned with the group
+        values, instead of a list of `SendingStatGroup` objects. Suited to long
+        `date` series and many domains; NumPy arrays are used when available
+        (or when `use_numpy=True`), `array.array` otherwise.
+        """
+        response = self._fetch(account_id, group, params)
+        return SendingStatsColumns.from_api(
+            _GROUP_KEYS[group], response, use_numpy=use_numpy
+        )
+
+    def snapshot(
+        self,
+        account_id: int,
+        params: StatsFilterParams,
+        max_workers: int = 5,
+        executor: Optional[Executor] = None,
+    ) -> SendingStatsSnapshot:
+        """
+        Get aggregated stats together with every grouping (domains, categories,
+        email service providers and date). All five requests are issued
+        concurrently, so the latency is roughly that of the slowest one. They
+        run on the thread pool shared by the client's bulk helpers, or on
+        `executor`.
+        """
+        groups: list[Optional[GroupKey]] = [None, *_GROUP_KEYS]
+        responses = run_concurrently(
+            (partial(self._fetch, account_id, group, params) for group in groups),
+            max_workers,
+            executor,
+        )
+        by_group = {
+            group: self._parse_groups(group, response)
+            for group, response in zip(_GROUP_KEYS, responses[1:])
+        }
+        return SendingStatsSnapshot(
+            stats=SendingStats(**responses[0]),
+            domains=by_group["domains"],
+            categories=by_group["categories"],
+            email_service_providers=by_group["email_service_providers"],
+            date=by_group["date"],
+        )
+
     def _grouped_stats(
         self, account_id: int, group: GroupKey, params: StatsFilterParams
     ) -> list[SendingStatGroup]:
-        response = self._client.get(
-            f"{self._base_path(account_id)}/{group}", params=params.api_query_params
-        )
+        return self._parse_groups(group, self._fetch(account_id, group, params))
+
+    @staticmethod
+    def _parse_groups(group: GroupKey, response: Any) -> list[SendingStatGroup]:
         group_key = _GROUP_KEYS[group]
 
         return [
@@ -68,6 +126,34 @@ class StatsApi:
             for item in response
         ]
 
+    def _fetch(
+        self, account_id: int, group: Optional[GroupKey], params: StatsFilterParams
+    ) -> Any:
+        """
+        Request stats, going through the response cache when one is configured.
+        Cache keys are built from the account, the grouping and the filter params
+        normalized so that field and list item order do not matter.
+        """
+        path = self._base_path(account_id)
+        if group is not None:
+            path = f"{path}/{group}"
+        query_params = params.api_query_params
+        if self._cache is None:
+            return self._client.get(path, params=query_params)
+
+        normalized = {
+            key: sorted(value, key=str) if isinstance(value, list) else value
+            for key, value in query_params.items()
+        }
+        key = f"stats:{account_id}:{group or 'total'}:" + json.dumps(
+            normalized, sort_keys=True
+        )
+        cached = self._cache.get_or_fetch(
+            key,
+            lambda: json.dumps(self._client.get(path, params=query_params)).encode(),
+        )
+        return json.loads(cached)
+
     @staticmethod
     def _base_path(account_id: int) -> str:
         return f"/api/accounts/{account_id}/stats"
@@ -1,5 +1,11 @@
+from collections import deque
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from concurrent.futures import Future
 from typing import Optional
 
+from mailtrap._concurrency import shared_executor
 from mailtrap.http import HttpClient
 from mailtrap.models.mail import BaseMail
 from mailtrap.models.mail import SendingMailResponse
@@ -34,3 +40,40 @@ class SendingApi:
         """
         response = self._client.post(self._get_api_url("/api/batch"), json=mail.api_data)
         return BatchSendResponse(**response)
+
+    def batch_send_many(
+        self,
+        batches: Iterable[BatchSendEmailParams],
+        executor: Optional[Executor] = None,
+        encode_ahead: int = 2,
+    ) -> Iterator[BatchSendResponse]:
+        """
+        Batch send many batches (e.g. chunks of up to 500 messages) in order.
+
+        `batches` is consumed lazily. The request bodies of up to `encode_ahead`
+        upcoming batches are encoded in `executor` (the thread pool shared by
+        the bulk helpers by default) while the current request is in flight.
+        Encoding a batch of 500 messages takes a millisecond or two, so this
+        barely shortens the total time. A failed request raises and stops the
+        iteration; the batches yielded before it were sent.
+        """
+        if executor is None:
+            executor = shared_executor()
+        path = self._get_api_url("/api/batch")
+        pending: deque[Future[bytes]] = deque()
+        try:
+            for mail in batches:
+                pending.append(executor.submit(_encode, mail))
+                if len(pending) > encode_ahead:
+                    response = self._client.post(path, data=pending.popleft().result())
+                    yield BatchSendResponse(**response)
+            while pending:
+                response = self._client.post(path, data=pending.popleft().result())
+                yield BatchSendResponse(**response)
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _encode(mail: BatchSendEmailParams) -> bytes:
+    return mail.api_json
@@ -4,16 +4,22 @@ from mailtrap.api.resources.attachments import AttachmentsApi
 from mailtrap.api.resources.inboxes import InboxesApi
 from mailtrap.api.resources.messages import MessagesApi
 from mailtrap.api.resources.projects import ProjectsApi
+from mailtrap.cache import MessageCache
 from mailtrap.http import HttpClient
 
 
 class TestingApi:
     def __init__(
-        self, client: HttpClient, account_id: str, inbox_id: Optional[str] = None
+        self,
+        client: HttpClient,
+        account_id: str,
+        inbox_id: Optional[str] = None,
+        message_cache: Optional[MessageCache] = None,
     ) -> None:
         self._account_id = account_id
         self._inbox_id = inbox_id
         self._client = client
+        self._message_cache = message_cache
 
     @property
     def projects(self) -> ProjectsApi:
@@ -25,7 +31,11 @@ class TestingApi:
 
     @property
     def messages(self) -> MessagesApi:
-        return MessagesApi(account_id=self._account_id, client=self._client)
+        return MessagesApi(
+            account_id=self._account_id,
+            client=self._client,
+            cache=self._message_cache,
+        )
 
     @property
     def attachments(self) -> AttachmentsApi:
@@ -0,0 +1,355 @@
+"""Size-bounded caches for API responses that do not change once created.
+
+Entries are opaque ``bytes`` addressed by string keys. :class:`MemoryCache` and
+:class:`DiskCache` both implement the :class:`CacheBackend` protocol and evict
+the least recently used entries once their byte budget is exceeded.
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+from typing import Protocol
+from typing import Union
+
+from mailtrap._compat import reset_after_fork
+
+DEFAULT_MEMORY_CACHE_SIZE = 64 * 1024 * 1024  # in bytes
+DEFAULT_DISK_CACHE_SIZE = 1024 * 1024 * 1024  # in bytes
+DEFAULT_RESPONSE_CACHE_TTL = 60  # in seconds
+
+# Disk entries start with the expiry timestamp (0 means "never expires").
+_DISK_HEADER = struct.Struct(">d")
+
+
+class CacheBackend(Protocol):
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None: ...
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    coalesced: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class MemoryCache:
+    """Thread-safe in-process LRU cache bounded by the total size of its values."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_CACHE_SIZE) -> None:
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[bytes, Optional[float]]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and _is_expired(entry[1]):
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry[0]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        if len(value) > self.max_bytes:
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = (value, expires_at)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked
+        self._lock = threading.Lock()
+
+    def _pop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+
+class DiskCache:
+    """
+    LRU cache persisted as one file per entry in `directory`.
+
+    Recency is tracked through file modification times, so the cache survives
+    process restarts and can be shared by processes on the same host.
+    """
+
+    def __init__(
+        self,
+        directory: Union[str, "os.PathLike[str]"],
+        max_bytes: int = DEFAULT_DISK_CACHE_SIZE,
+    ) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.RLock()
+        reset_after_fork(self)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(path.stat().st_size for path in self._entry_paths())
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            data = b""
+
+        if len(data) >= _DISK_HEADER.size:
+            (expires_at,) = _DISK_HEADER.unpack_from(data)
+            if expires_at and _is_expired(expires_at):
+                self._remove(path)
+                data = b""
+
+        with self._lock:
+            if len(data) < _DISK_HEADER.size:
+                self.stats.misses += 1
+                return None
+            self.stats.hits += 1
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        header_size = _DISK_HEADER.size
+        return data[header_size:]
+
+    def set(self, key: str, value: bytes, ttl: Optional[float] = None) -> None:
+        data = _DISK_HEADER.pack(time.time() + ttl if ttl is not None else 0.0) + value
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            with self._lock:
+                self._remove(path)
+                os.replace(temp_path, path)
+                self._size += len(data)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        if self._size > self.max_bytes:
+            with self._lock:
+                self._evict()
+
+    def clear(self) -> None:
+        for path in self._entry_paths():
+            self._remove(path)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self._entry_paths():
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        for _, path in sorted(entries):
+            if self._size <= self.max_bytes:
+                break
+            self._remove(path)
+            self.stats.evictions += 1
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except OSError:
+                return
+            self._size -= size
+
+    def _entry_paths(self) -> list[Path]:
+        return list(self.directory.glob("*.entry"))
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.RLock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.entry"
+
+
+class MessageCache:
+    """
+    Two-level cache of immutable sandbox message artifacts.
+
+    Entries are looked up in memory first and then on disk (when a `directory`
+    is configured); disk hits are promoted back into memory.
+    """
+
+    def __init__(
+        self,
+        max_memory_bytes: int = DEFAULT_MEMORY_CACHE_SIZE,
+        directory: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_disk_bytes: int = DEFAULT_DISK_CACHE_SIZE,
+    ) -> None:
+        self.memory = MemoryCache(max_memory_bytes)
+        self.disk = DiskCache(directory, max_disk_bytes) if directory else None
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def get(
+        self, account_id: str, inbox_id: int, message_id: int, artifact: str
+    ) -> Optional[bytes]:
+        key = self._key(account_id, inbox_id, message_id, artifact)
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.set(key, value)
+        with self._lock:
+            if value is None:
+                self.stats.misses += 1
+            else:
+                self.stats.hits += 1
+        return value
+
+    def set(
+        self,
+        account_id: str,
+        inbox_id: int,
+        message_id: int,
+        artifact: str,
+        value: bytes,
+    ) -> None:
+        key = self._key(account_id, inbox_id, message_id, artifact)
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def _reset_after_fork(self) -> None:
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(account_id: str, inbox_id: int, message_id: int, artifact: str) -> str:
+        return f"{account_id}/{inbox_id}/{message_id}/{artifact}"
+
+
+class ResponseCache:
+    """
+    TTL cache for API responses with request coalescing.
+
+    Concurrent lookups of the same missing key are coalesced into a single
+    `fetch` call (single-flight); the other callers wait for its result. Pass a
+    shared `backend` (e.g. a :class:`DiskCache` on a shared volume or an adapter
+    for Redis/memcached implementing :class:`CacheBackend`) so that several
+    processes reuse each other's responses within the TTL window.
+
+    Only stored responses are shared between processes: coalescing works
+    within one process, so N processes missing the same key at the same time
+    still make N fetches.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESPONSE_CACHE_TTL,
+        backend: Optional[CacheBackend] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.backend: CacheBackend = backend if backend is not None else MemoryCache()
+        self.stats = CacheStats()
+        self._in_flight: dict[str, Future[bytes]] = {}
+        self._lock = threading.Lock()
+        reset_after_fork(self)
+
+    def get_or_fetch(self, key: str, fetch: Callable[[], bytes]) -> bytes:
+        value = self.backend.get(key)
+        if value is not None:
+            with self._lock:
+                self.stats.hits += 1
+            return value
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                # A leader may have finished since the lookup above: it stores
+                # the value before leaving `_in_flight`, which it does under
+                # this lock
+                value = self.backend.get(key)
+                if value is not None:
+                    self.stats.hits += 1
+                    return value
+            is_leader = flight is None
+            if flight is None:
+                flight = self._in_flight[key] = Future()
+                self.stats.misses += 1
+            else:
+                self.stats.coalesced += 1
+
+        if not is_leader:
+            return flight.result()
+
+        try:
+            value = fetch()
+            self.backend.set(key, value, ttl=self.ttl)
+        except BaseException as exc:
+            flight.set_exception(exc)
+            raise
+        else:
+            flight.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def _reset_after_fork(self) -> None:
+        # The fetching threads do not exist in a forked child, so their
+        # flights would never finish
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+
+def _is_expired(expires_at: Optional[float]) -> bool:
+    return expires_at is not None and expires_at <= time.time()
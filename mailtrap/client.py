@@ -1,40 +1,92 @@
 import importlib.metadata
+import threading
+import time
 import warnings
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
 from typing import Optional
 from typing import Union
 from typing import cast
 
 from pydantic import TypeAdapter
+from pydantic.dataclasses import is_pydantic_dataclass
+from pydantic.dataclasses import rebuild_dataclass
+from requests.adapters import BaseAdapter
 
-from mailtrap.api.contacts import ContactsBaseApi
-from mailtrap.api.email_logs import EmailLogsBaseApi
-from mailtrap.api.general import GeneralApi
-from mailtrap.api.organizations import OrganizationsBaseApi
-from mailtrap.api.resources.stats import StatsApi
+from mailtrap._compat import reset_after_fork
 from mailtrap.api.sending import SendingApi
-from mailtrap.api.sending_domains import SendingDomainsBaseApi
-from mailtrap.api.suppressions import SuppressionsBaseApi
-from mailtrap.api.templates import EmailTemplatesApi
-from mailtrap.api.testing import TestingApi
-from mailtrap.api.webhooks import WebhooksBaseApi
+from mailtrap.cache import MessageCache
+from mailtrap.cache import ResponseCache
 from mailtrap.config import BULK_HOST
+from mailtrap.config import DEFAULT_POOL_MAXSIZE
 from mailtrap.config import GENERAL_HOST
 from mailtrap.config import SANDBOX_HOST
 from mailtrap.config import SENDING_HOST
 from mailtrap.exceptions import ClientConfigurationError
+from mailtrap.http import HostWarmup
 from mailtrap.http import HttpClient
+from mailtrap.instrumentation import Instrumentation
+from mailtrap.models import mail as mail_models
 from mailtrap.models.mail import BaseMail
 from mailtrap.models.mail import BatchSendResponse
 from mailtrap.models.mail import SendingMailResponse
 from mailtrap.models.mail.batch_mail import BatchSendEmailParams
 
+if TYPE_CHECKING:
+    from mailtrap.api.contacts import ContactsBaseApi
+    from mailtrap.api.email_logs import EmailLogsBaseApi
+    from mailtrap.api.general import GeneralApi
+    from mailtrap.api.organizations import OrganizationsBaseApi
+    from mailtrap.api.resources.stats import StatsApi
+    from mailtrap.api.sending_domains import SendingDomainsBaseApi
+    from mailtrap.api.suppressions import SuppressionsBaseApi
+    from mailtrap.api.templates import EmailTemplatesApi
+    from mailtrap.api.testing import TestingApi
+    from mailtrap.api.webhooks import WebhooksBaseApi
+
 SEND_ENDPOINT_RESPONSE = dict[str, Union[bool, list[str]]]
 BATCH_SEND_ENDPOINT_RESPONSE = dict[
     str, Union[bool, list[str], list[dict[str, Union[bool, list[str]]]]]
 ]
 
 
+@dataclass(frozen=True)
+class WarmupReport:
+    hosts: tuple[HostWarmup, ...]
+    serializers_seconds: float
+    """Time spent building the sending model schemas."""
+    total_seconds: float
+
+
 class MailtrapClient:
+    """
+    Entry point to all Mailtrap APIs.
+
+    A client is safe to share between threads: API objects are stateless, and
+    each host gets one HTTP client whose connection pool (`pool_maxsize`
+    connections) is shared by all threads, each using its own session. Use
+    one client per process and size `pool_maxsize` to the number of sending
+    threads.
+
+    A client is also fork-safe, so it can be created at import time in the
+    master of a prefork server (gunicorn, uWSGI, Celery) or before starting a
+    `multiprocessing` pool: each child process opens its own connections.
+
+    `api_host` overrides the sending host (send, bulk or sandbox) and
+    `general_api_host` the host of all other APIs (email logs, stats,
+    contacts, ...), e.g. to point both at a
+    :class:`~mailtrap.testing.FakeMailtrapServer`.
+
+    With `email_logs_trusted_parsing=True`, email log events are built without
+    per-event validation (see `EmailLogMessage.from_api`), which speeds up
+    parsing of large exports. With `email_logs_lazy_events=True`, event details
+    are only parsed when they are first accessed.
+    """
+
     DEFAULT_HOST = SENDING_HOST
     DEFAULT_PORT = 443
     BULK_HOST = BULK_HOST
@@ -55,101 +107,162 @@ class MailtrapClient:
         inbox_id: Optional[str] = None,
         organization_id: Optional[str] = None,
         user_agent: Optional[str] = None,
+        message_cache: Optional[MessageCache] = None,
+        stats_cache: Optional[ResponseCache] = None,
+        instrumentation: Union[Instrumentation, Sequence[Instrumentation], None] = None,
+        transport: Optional[BaseAdapter] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        email_logs_trusted_parsing: bool = False,
+        email_logs_lazy_events: bool = False,
+        general_api_host: Optional[str] = None,
     ) -> None:
-        self.token = token
+        self._http_clients: dict[str, HttpClient] = {}
+        self._http_clients_lock = threading.Lock()
+        self._token = token
+        self._user_agent = (
+            user_agent if user_agent is not None else self.DEFAULT_USER_AGENT
+        )
         self.api_host = api_host
+        self.general_api_host = general_api_host
         self.api_port = api_port
         self.bulk = bulk
         self.sandbox = sandbox
         self.account_id = account_id
         self.inbox_id = inbox_id
         self.organization_id = organization_id
-        self._user_agent = (
-            user_agent if user_agent is not None else self.DEFAULT_USER_AGENT
-        )
+        self.message_cache = message_cache
+        self.stats_cache = stats_cache
+        self.instrumentation = instrumentation
+        self.transport = transport
+        self.pool_maxsize = pool_maxsize
+        self.email_logs_trusted_parsing = email_logs_trusted_parsing
+        self.email_logs_lazy_events = email_logs_lazy_events
+        reset_after_fork(self)
 
         self._validate_itself()
 
     @property
-    def general_api(self) -> GeneralApi:
+    def token(self) -> str:
+        return self._token
+
+    @token.setter
+    def token(self, token: str) -> None:
+        self._token = token
+        self._update_headers()
+
+    @property
+    def user_agent(self) -> str:
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, user_agent: str) -> None:
+        self._user_agent = user_agent
+        self._update_headers()
+
+    @property
+    def general_api(self) -> "GeneralApi":
+        from mailtrap.api.general import GeneralApi
+
         return GeneralApi(
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def testing_api(self) -> TestingApi:
+    def testing_api(self) -> "TestingApi":
         self._validate_account_id()
+        from mailtrap.api.testing import TestingApi
+
         return TestingApi(
             account_id=cast(str, self.account_id),
             inbox_id=self.inbox_id,
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
+            message_cache=self.message_cache,
         )
 
     @property
-    def email_templates_api(self) -> EmailTemplatesApi:
+    def email_templates_api(self) -> "EmailTemplatesApi":
         self._validate_account_id("Email Templates API")
+        from mailtrap.api.templates import EmailTemplatesApi
+
         return EmailTemplatesApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def contacts_api(self) -> ContactsBaseApi:
+    def contacts_api(self) -> "ContactsBaseApi":
         self._validate_account_id("Contacts API")
+        from mailtrap.api.contacts import ContactsBaseApi
+
         return ContactsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def suppressions_api(self) -> SuppressionsBaseApi:
+    def suppressions_api(self) -> "SuppressionsBaseApi":
         self._validate_account_id("Suppressions API")
+        from mailtrap.api.suppressions import SuppressionsBaseApi
+
         return SuppressionsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def sending_domains_api(self) -> SendingDomainsBaseApi:
+    def sending_domains_api(self) -> "SendingDomainsBaseApi":
         self._validate_account_id("Sending Domains API")
+        from mailtrap.api.sending_domains import SendingDomainsBaseApi
+
         return SendingDomainsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def email_logs_api(self) -> EmailLogsBaseApi:
+    def email_logs_api(self) -> "EmailLogsBaseApi":
         self._validate_account_id("Email Logs API")
+        from mailtrap.api.email_logs import EmailLogsBaseApi
+
         return EmailLogsBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
+            trusted_parsing=self.email_logs_trusted_parsing,
+            lazy_events=self.email_logs_lazy_events,
         )
 
     @property
-    def organizations_api(self) -> OrganizationsBaseApi:
+    def organizations_api(self) -> "OrganizationsBaseApi":
         self._validate_organization_id("Organizations API")
+        from mailtrap.api.organizations import OrganizationsBaseApi
+
         return OrganizationsBaseApi(
             organization_id=cast(str, self.organization_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
-    def webhooks_api(self) -> WebhooksBaseApi:
+    def webhooks_api(self) -> "WebhooksBaseApi":
         self._validate_account_id("Webhooks API")
+        from mailtrap.api.webhooks import WebhooksBaseApi
+
         return WebhooksBaseApi(
             account_id=cast(str, self.account_id),
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
         )
 
     @property
     def sending_api(self) -> SendingApi:
-        http_client = HttpClient(host=self._sending_api_host, headers=self.headers)
+        http_client = self._http_client(self._sending_api_host)
         return SendingApi(client=http_client, inbox_id=self.inbox_id)
 
     @property
-    def stats_api(self) -> StatsApi:
+    def stats_api(self) -> "StatsApi":
+        from mailtrap.api.resources.stats import StatsApi
+
         return StatsApi(
-            client=HttpClient(host=GENERAL_HOST, headers=self.headers),
+            client=self._http_client(self._general_api_host),
+            cache=self.stats_cache,
         )
 
     def send(self, mail: BaseMail) -> SEND_ENDPOINT_RESPONSE:
@@ -166,6 +279,59 @@ class MailtrapClient:
             TypeAdapter(BatchSendResponse).dump_python(batch_sending_response),
         )
 
+    def batch_send_many(
+        self,
+        batches: Iterable[BatchSendEmailParams],
+        executor: Optional[Executor] = None,
+        encode_ahead: int = 2,
+    ) -> Iterator[BATCH_SEND_ENDPOINT_RESPONSE]:
+        """
+        Batch send many batches in order. See `SendingApi.batch_send_many()`.
+        """
+        batch_responses = self.sending_api.batch_send_many(
+            batches, executor=executor, encode_ahead=encode_ahead
+        )
+        for batch_sending_response in batch_responses:
+            yield cast(
+                BATCH_SEND_ENDPOINT_RESPONSE,
+                TypeAdapter[BatchSendResponse](BatchSendResponse).dump_python(
+                    batch_sending_response
+                ),
+            )
+
+    def warmup(self, hosts: Optional[Sequence[str]] = None) -> WarmupReport:
+        """
+        Prepare the client for its first request, e.g. during the init phase of
+        a serverless function: resolve DNS and open one pooled TLS connection
+        per host, and build the schemas of the sending models.
+
+        Connections are kept by the client, so keep one client per process.
+
+        Args:
+            hosts (Optional[Sequence[str]]): Hosts to connect to, e.g.
+                `[mailtrap.config.GENERAL_HOST]`. Defaults to the sending host
+                of the client (send, bulk or sandbox).
+
+        Returns:
+            WarmupReport: Time taken by each step.
+        """
+        started = time.perf_counter()
+        host_warmups = tuple(
+            self._http_client(host).warmup()
+            for host in (hosts if hosts is not None else [self._sending_api_host])
+        )
+        serializers_started = time.perf_counter()
+        for name in mail_models.__all__:
+            model = getattr(mail_models, name)
+            if is_pydantic_dataclass(model):
+                rebuild_dataclass(model)
+        finished = time.perf_counter()
+        return WarmupReport(
+            hosts=host_warmups,
+            serializers_seconds=finished - serializers_started,
+            total_seconds=finished - started,
+        )
+
     @property
     def base_url(self) -> str:
         warnings.warn(
@@ -195,6 +361,37 @@ class MailtrapClient:
             "User-Agent": self._user_agent,
         }
 
+    def _http_client(self, host: str) -> HttpClient:
+        # One HttpClient (and connection pool) per host, reused by all APIs
+        with self._http_clients_lock:
+            http_client = self._http_clients.get(host)
+            if http_client is None:
+                http_client = self._http_clients[host] = HttpClient(
+                    host=host,
+                    headers=self.headers,
+                    instrumentation=self.instrumentation,
+                    transport=self.transport,
+                    pool_maxsize=self.pool_maxsize,
+                )
+            return http_client
+
+    def _update_headers(self) -> None:
+        # HTTP clients (and the APIs holding them) send the new headers from
+        # their next request on
+        headers = self.headers
+        with self._http_clients_lock:
+            for http_client in self._http_clients.values():
+                http_client.set_headers(headers)
+
+    def _reset_after_fork(self) -> None:
+        # Another thread may have held the lock when the process forked; the
+        # HTTP clients themselves reset their own sessions and pools
+        self._http_clients_lock = threading.Lock()
+
+    @property
+    def _general_api_host(self) -> str:
+        return self.general_api_host or GENERAL_HOST
+
     @property
     def _sending_api_host(self) -> str:
         if self.api_host:
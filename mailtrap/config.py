@@ -4,3 +4,7 @@ SANDBOX_HOST = "sandbox.api.mailtrap.io"
 SENDING_HOST = "send.api.mailtrap.io"
 
 DEFAULT_REQUEST_TIMEOUT = 30  # in seconds
+DEFAULT_CHUNK_SIZE = 64 * 1024  # in bytes, for streamed downloads
+DEFAULT_MAX_WORKERS = 8  # concurrent requests for bulk helpers
+DEFAULT_POOL_MAXSIZE = 10  # pooled connections per host, shared by all threads
+SHARED_POOL_MAX_WORKERS = 32  # threads of the pool shared by bulk helpers
@@ -0,0 +1,277 @@
+"""Group-by aggregation of email log streams into sending stats.
+
+:class:`EmailLogsAggregator` consumes
+:class:`~mailtrap.models.email_logs.EmailLogMessage` objects (e.g. from
+:meth:`~mailtrap.api.resources.email_logs.EmailLogsApi.iter_messages` or
+:meth:`~mailtrap.api.resources.email_logs.EmailLogsApi.hydrate`) in a single pass
+and computes the `SendingStats` counts and rates per group, over dimensions the
+stats API does not offer, such as `custom_variables` keys.
+"""
+
+import itertools
+from array import array
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from typing import Any
+from typing import Optional
+
+from mailtrap._compat import optional_numpy
+from mailtrap.models.email_logs import EmailLogMessage
+from mailtrap.models.stats import SENDING_STATS_COUNT_FIELDS
+from mailtrap.models.stats import SENDING_STATS_RATE_FIELDS
+from mailtrap.models.stats import SendingStats
+
+DEFAULT_AGGREGATION_BATCH_SIZE = 10_000
+
+GroupKey = tuple[Any, ...]
+
+_MESSAGE_FIELDS = {
+    "message_id": "message_id",
+    "status": "status",
+    "subject": "subject",
+    "from": "from_",
+    "to": "to",
+    "client_ip": "client_ip",
+    "category": "category",
+    "sending_stream": "sending_stream",
+    "sending_domain_id": "sending_domain_id",
+    "template_id": "template_id",
+}
+
+
+class EmailLogsAggregation:
+    """
+    Aggregated stats in columnar form, one entry per group.
+
+    `keys` holds the group keys (tuples aligned with `group_by`) and `columns`
+    maps `messages_count` and every `SendingStats` metric to an array aligned
+    with `keys`: `numpy.ndarray` when NumPy is used, `array.array` otherwise.
+    """
+
+    def __init__(
+        self,
+        group_by: tuple[str, ...],
+        keys: list[GroupKey],
+        columns: dict[str, Any],
+    ) -> None:
+        self.group_by = group_by
+        self.keys = keys
+        self.columns = columns
+        self._positions = {key: index for index, key in enumerate(keys)}
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, metric: str) -> Any:
+        return self.columns[metric]
+
+    def stats(self, *key: Any) -> SendingStats:
+        """Get the stats of a single group, e.g. `stats("Welcome", "pro")`."""
+        index = self._positions[key]
+        metrics: dict[str, Any] = {
+            field: int(self.columns[field][index]) for field in SENDING_STATS_COUNT_FIELDS
+        }
+        for field in SENDING_STATS_RATE_FIELDS:
+            metrics[field] = float(self.columns[field][index])
+        return SendingStats(**metrics)
+
+    def rows(self) -> list[dict[str, Any]]:
+        """One dict per group with the group fields, `messages_count` and metrics."""
+        columns = {name: column.tolist() for name, column in self.columns.items()}
+        return [
+            {
+                **dict(zip(self.group_by, key)),
+                **{name: values[index] for name, values in columns.items()},
+            }
+            for index, key in enumerate(self.keys)
+        ]
+
+
+class EmailLogsAggregator:
+    """
+    Incremental group-by over email log messages.
+
+    `group_by` fields can be message fields (`category`, `status`, `from`,
+    `sending_domain_id`, ...), `sent_date` (the date part of `sent_at`),
+    `email_service_provider` (taken from delivery/bounce event details, so it
+    requires messages fetched with `get_by_id`/`hydrate`) and
+    ``custom_variables.<key>``.
+
+    Per message, `delivery` counts `delivered` status, `bounce` counts
+    `not_delivered` status, `open`/`click` count messages opened/clicked at
+    least once and `spam` counts messages with a spam event. Delivery and
+    bounce rates are relative to all messages of the group, open, click and
+    spam rates to the delivered ones.
+
+    `spam` and `email_service_provider` come from events, which only detailed
+    messages (`get_by_id`/`hydrate`) carry. Summaries from list pages
+    (`get_list`/`iter_messages`) have no events, so for them `spam_count` is
+    always 0 and `email_service_provider` is None; hydrate the messages first
+    when these matter.
+
+    Messages are consumed in batches of `batch_size`; each batch is mapped to
+    group indexes and accumulated with `numpy.bincount` when NumPy is
+    available (or `use_numpy=True`), with plain Python loops otherwise.
+    """
+
+    def __init__(
+        self,
+        group_by: Sequence[str],
+        use_numpy: Optional[bool] = None,
+        batch_size: int = DEFAULT_AGGREGATION_BATCH_SIZE,
+    ) -> None:
+        self.group_by = tuple(group_by)
+        self._getters = [_key_getter(field) for field in self.group_by]
+        self._batch_size = batch_size
+        self._numpy = optional_numpy() if use_numpy is not False else None
+        if use_numpy and self._numpy is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+        self._positions: dict[GroupKey, int] = {}
+        self._keys: list[GroupKey] = []
+        self._totals: dict[str, Any] = {
+            field: (
+                self._numpy.zeros(0, dtype=self._numpy.int64)
+                if self._numpy
+                else array("q")
+            )
+            for field in ("messages_count", *SENDING_STATS_COUNT_FIELDS)
+        }
+
+    def update(self, messages: Iterable[EmailLogMessage]) -> "EmailLogsAggregator":
+        iterator = iter(messages)
+        while True:
+            batch = list(itertools.islice(iterator, self._batch_size))
+            if not batch:
+                return self
+            self._add_batch(batch)
+
+    def result(self) -> EmailLogsAggregation:
+        counts = {field: self._copy(column) for field, column in self._totals.items()}
+        messages_count = counts["messages_count"]
+        delivery_count = counts["delivery_count"]
+        rates = {
+            "delivery_rate": self._ratio(delivery_count, messages_count),
+            "bounce_rate": self._ratio(counts["bounce_count"], messages_count),
+            "open_rate": self._ratio(counts["open_count"], delivery_count),
+            "click_rate": self._ratio(counts["click_count"], delivery_count),
+            "spam_rate": self._ratio(counts["spam_count"], delivery_count),
+        }
+        columns: dict[str, Any] = {"messages_count": messages_count}
+        for count_field, rate_field in zip(
+            SENDING_STATS_COUNT_FIELDS, SENDING_STATS_RATE_FIELDS
+        ):
+            columns[count_field] = counts[count_field]
+            columns[rate_field] = rates[rate_field]
+        return EmailLogsAggregation(self.group_by, list(self._keys), columns)
+
+    def _add_batch(self, batch: list[EmailLogMessage]) -> None:
+        indexes = [self._index(message) for message in batch]
+        flags: dict[str, list[bool]] = {
+            "messages_count": [True] * len(batch),
+            "delivery_count": [message.status == "delivered" for message in batch],
+            "bounce_count": [message.status == "not_delivered" for message in batch],
+            "open_count": [message.opens_count > 0 for message in batch],
+            "click_count": [message.clicks_count > 0 for message in batch],
+            "spam_count": [
+                any(event.event_type == "spam" for event in message.events)
+                for message in batch
+            ],
+        }
+
+        groups = len(self._keys)
+        numpy = self._numpy
+        if numpy is not None:
+            positions = numpy.array(indexes, dtype=numpy.intp)
+            for field, values in flags.items():
+                column = self._totals[field]
+                if len(column) < groups:
+                    column = numpy.concatenate(
+                        (column, numpy.zeros(groups - len(column), dtype=numpy.int64))
+                    )
+                mask = numpy.array(values, dtype=bool)
+                column += numpy.bincount(positions[mask], minlength=groups)
+                self._totals[field] = column
+            return
+
+        for field, values in flags.items():
+            column = self._totals[field]
+            column.extend(itertools.repeat(0, groups - len(column)))
+            for index, value in zip(indexes, values):
+                column[index] += value
+
+    def _index(self, message: EmailLogMessage) -> int:
+        key = tuple(getter(message) for getter in self._getters)
+        index = self._positions.get(key)
+        if index is None:
+            index = self._positions[key] = len(self._keys)
+            self._keys.append(key)
+        return index
+
+    def _ratio(self, numerators: Any, denominators: Any) -> Any:
+        numpy = self._numpy
+        if numpy is not None:
+            result = numpy.zeros(len(numerators), dtype=numpy.float64)
+            numpy.divide(numerators, denominators, out=result, where=denominators > 0)
+            return result
+        return array(
+            "d",
+            (n / d if d else 0.0 for n, d in zip(numerators, denominators)),
+        )
+
+    def _copy(self, column: Any) -> Any:
+        if self._numpy is not None:
+            return column.astype(self._numpy.int64)
+        return array("q", column)
+
+
+def aggregate_email_logs(
+    messages: Iterable[EmailLogMessage],
+    group_by: Sequence[str],
+    use_numpy: Optional[bool] = None,
+    batch_size: int = DEFAULT_AGGREGATION_BATCH_SIZE,
+) -> EmailLogsAggregation:
+    """
+    Aggregate email log messages into per-group sending stats in one pass.
+
+    Args:
+        messages (Iterable[EmailLogMessage]): Messages to aggregate.
+        group_by (Sequence[str]): Grouping fields, e.g.
+            `["category", "custom_variables.plan"]`.
+        use_numpy (Optional[bool]): Force (True) or disable (False) NumPy
+            accumulation; by default it is used when installed.
+        batch_size (int): Number of messages accumulated at once.
+
+    Returns:
+        EmailLogsAggregation: Stats per group, in order of first appearance.
+    """
+    aggregator = EmailLogsAggregator(group_by, use_numpy=use_numpy, batch_size=batch_size)
+    return aggregator.update(messages).result()
+
+
+def _key_getter(field: str) -> Callable[[EmailLogMessage], Any]:
+    if field.startswith("custom_variables."):
+        key = field.partition(".")[2]
+        return lambda message: _hashable(message.custom_variables.get(key))
+    if field == "sent_date":
+        return lambda message: message.sent_at[:10]
+    if field == "email_service_provider":
+        return _email_service_provider
+    attribute = _MESSAGE_FIELDS.get(field)
+    if attribute is None:
+        raise ValueError(f"Cannot group email logs by {field!r}")
+    return lambda message: getattr(message, attribute)
+
+
+def _email_service_provider(message: EmailLogMessage) -> Optional[str]:
+    for event in message.events:
+        provider = getattr(event.details, "email_service_provider", None)
+        if provider:
+            return str(provider)
+    return None
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (dict, list)):
+        return repr(value)
+    return value
@@ -0,0 +1,279 @@
+"""Streaming export of email logs to NDJSON, CSV and Parquet.
+
+The writers consume any iterable of
+:class:`~mailtrap.models.email_logs.EmailLogMessage` (typically
+:meth:`~mailtrap.api.resources.email_logs.EmailLogsApi.iter_messages`) and write
+it in batches of `batch_size` rows, so memory use does not grow with the size
+of the export. Every message becomes one flat row: `custom_variables` keys are
+spread into ``custom_variables.<key>`` columns and `events` are summarized into
+counters and per-event-type timestamps.
+
+Parquet output requires the optional ``pyarrow`` package.
+"""
+
+import csv
+import importlib
+import itertools
+import json
+import os
+from abc import ABC
+from abc import abstractmethod
+from collections.abc import Iterable
+from collections.abc import Sequence
+from types import TracebackType
+from typing import IO
+from typing import Any
+from typing import Literal
+from typing import Optional
+from typing import Union
+
+from mailtrap._compat import optional_module
+from mailtrap.models.email_logs import EmailLogMessage
+
+DEFAULT_EXPORT_BATCH_SIZE = 1000
+
+EmailLogsExportFormat = Literal["ndjson", "csv", "parquet"]
+
+EVENT_TYPES = (
+    "delivery",
+    "open",
+    "click",
+    "soft_bounce",
+    "bounce",
+    "spam",
+    "unsubscribe",
+    "suspension",
+    "reject",
+)
+
+# Message field -> column, in column order
+_MESSAGE_COLUMNS = {
+    "message_id": "message_id",
+    "status": "status",
+    "subject": "subject",
+    "from_": "from",
+    "to": "to",
+    "sent_at": "sent_at",
+    "client_ip": "client_ip",
+    "category": "category",
+    "sending_stream": "sending_stream",
+    "sending_domain_id": "sending_domain_id",
+    "template_id": "template_id",
+    "opens_count": "opens_count",
+    "clicks_count": "clicks_count",
+    "raw_message_url": "raw_message_url",
+}
+
+_INTEGER_COLUMNS = frozenset(
+    ("sending_domain_id", "template_id", "opens_count", "clicks_count", "events_count")
+)
+
+
+class EmailLogsWriter(ABC):
+    """
+    Base class of the streaming writers.
+
+    Columns are fixed when the writer is created, so that CSV headers and the
+    Parquet schema can be written before the first row. Values of
+    `custom_variable_keys` get their own ``custom_variables.<key>`` column;
+    any other custom variables are kept as a JSON object in the
+    ``custom_variables`` column.
+    """
+
+    def __init__(self, custom_variable_keys: Sequence[str] = ()) -> None:
+        self.custom_variable_keys = tuple(custom_variable_keys)
+        self.columns: list[str] = [
+            *_MESSAGE_COLUMNS.values(),
+            *(f"custom_variables.{key}" for key in self.custom_variable_keys),
+            "custom_variables",
+            "template_variables",
+            "events_count",
+            "last_event_type",
+            "last_event_at",
+            *(f"{event_type}_at" for event_type in EVENT_TYPES),
+        ]
+        self.rows_written = 0
+
+    def row(self, message: EmailLogMessage) -> dict[str, Any]:
+        """Flatten one message into a row keyed by column name."""
+        row = {
+            column: getattr(message, field) for field, column in _MESSAGE_COLUMNS.items()
+        }
+
+        custom_variables = dict(message.custom_variables)
+        for key in self.custom_variable_keys:
+            row[f"custom_variables.{key}"] = _text(custom_variables.pop(key, None))
+        row["custom_variables"] = _json_or_none(custom_variables)
+        row["template_variables"] = _json_or_none(message.template_variables)
+
+        events = message.events
+        row["events_count"] = len(events)
+        row["last_event_type"] = events[-1].event_type if events else None
+        row["last_event_at"] = events[-1].created_at if events else None
+        for event_type in EVENT_TYPES:
+            row[f"{event_type}_at"] = None
+        for event in events:
+            column = f"{event.event_type}_at"
+            if column in row and row[column] is None:
+                row[column] = event.created_at
+        return row
+
+    def write(
+        self,
+        messages: Iterable[EmailLogMessage],
+        batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+    ) -> int:
+        """Write all `messages` in batches; returns the number of rows written."""
+        written = 0
+        iterator = iter(messages)
+        while True:
+            batch = [
+                self.row(message) for message in itertools.islice(iterator, batch_size)
+            ]
+            if not batch:
+                return written
+            self.write_rows(batch)
+            self.rows_written += len(batch)
+            written += len(batch)
+
+    @abstractmethod
+    def write_rows(self, rows: list[dict[str, Any]]) -> None:
+        """Write one batch of rows built by :meth:`row`."""
+
+    def close(self) -> None:
+        pass
+
+    def __enter__(self) -> "EmailLogsWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class NdjsonEmailLogsWriter(EmailLogsWriter):
+    """Writes one JSON object per line to a text file object."""
+
+    def __init__(self, file: IO[str], custom_variable_keys: Sequence[str] = ()) -> None:
+        super().__init__(custom_variable_keys)
+        self._file = file
+
+    def write_rows(self, rows: list[dict[str, Any]]) -> None:
+        self._file.write(
+            "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows)
+        )
+
+
+class CsvEmailLogsWriter(EmailLogsWriter):
+    """Writes a header row followed by one CSV row per message."""
+
+    def __init__(self, file: IO[str], custom_variable_keys: Sequence[str] = ()) -> None:
+        super().__init__(custom_variable_keys)
+        self._writer = csv.DictWriter(file, fieldnames=self.columns)
+        self._writer.writeheader()
+
+    def write_rows(self, rows: list[dict[str, Any]]) -> None:
+        self._writer.writerows(rows)
+
+
+class ParquetEmailLogsWriter(EmailLogsWriter):
+    """Writes every batch as one Parquet row group. Requires ``pyarrow``."""
+
+    def __init__(
+        self,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        custom_variable_keys: Sequence[str] = (),
+    ) -> None:
+        super().__init__(custom_variable_keys)
+        pyarrow = optional_module("pyarrow")
+        if pyarrow is None:
+            raise ImportError("pyarrow is required for Parquet export")
+        parquet = importlib.import_module("pyarrow.parquet")
+        self._pyarrow = pyarrow
+        self.schema = pyarrow.schema(
+            [
+                (
+                    column,
+                    pyarrow.int64() if column in _INTEGER_COLUMNS else pyarrow.string(),
+                )
+                for column in self.columns
+            ]
+        )
+        self._writer = parquet.ParquetWriter(destination, self.schema)
+
+    def write_rows(self, rows: list[dict[str, Any]]) -> None:
+        table = self._pyarrow.Table.from_pylist(rows, schema=self.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+def export_email_logs(
+    messages: Iterable[EmailLogMessage],
+    destination: Union[str, "os.PathLike[str]", IO[Any]],
+    output_format: EmailLogsExportFormat = "ndjson",
+    custom_variable_keys: Sequence[str] = (),
+    batch_size: int = DEFAULT_EXPORT_BATCH_SIZE,
+) -> int:
+    """
+    Stream email log messages into a file.
+
+    Args:
+        messages (Iterable[EmailLogMessage]): Messages to export, e.g.
+            `EmailLogsApi.iter_messages(filters)`.
+        destination (Union[str, os.PathLike[str], IO[Any]]): File path, or an
+            open file object (text for NDJSON/CSV, binary for Parquet).
+        output_format (EmailLogsExportFormat): "ndjson", "csv" or "parquet".
+        custom_variable_keys (Sequence[str]): Custom variables exported as
+            separate columns.
+        batch_size (int): Number of rows buffered per write (and per Parquet
+            row group).
+
+    Returns:
+        int: The number of exported messages.
+    """
+    if output_format == "parquet":
+        with ParquetEmailLogsWriter(destination, custom_variable_keys) as writer:
+            return writer.write(messages, batch_size=batch_size)
+    if output_format not in ("ndjson", "csv"):
+        raise ValueError(f"Unsupported export format {output_format!r}")
+
+    if isinstance(destination, (str, os.PathLike)):
+        with open(destination, "w", encoding="utf-8", newline="") as file:
+            return _write_text(
+                messages, file, output_format, custom_variable_keys, batch_size
+            )
+    return _write_text(
+        messages, destination, output_format, custom_variable_keys, batch_size
+    )
+
+
+def _write_text(
+    messages: Iterable[EmailLogMessage],
+    file: IO[str],
+    output_format: EmailLogsExportFormat,
+    custom_variable_keys: Sequence[str],
+    batch_size: int,
+) -> int:
+    writer: EmailLogsWriter
+    if output_format == "csv":
+        writer = CsvEmailLogsWriter(file, custom_variable_keys)
+    else:
+        writer = NdjsonEmailLogsWriter(file, custom_variable_keys)
+    with writer:
+        return writer.write(messages, batch_size=batch_size)
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, separators=(",", ":"))
+
+
+def _json_or_none(value: dict[str, Any]) -> Optional[str]:
+    return json.dumps(value, separators=(",", ":")) if value else None
@@ -0,0 +1,294 @@
+"""Local SQLite mirror of email logs with indexed, offline filtering.
+
+:class:`EmailLogsIndex` incrementally copies email log summaries returned by
+:meth:`~mailtrap.api.resources.email_logs.EmailLogsApi.get_list` into SQLite and
+answers :class:`~mailtrap.models.email_logs.EmailLogsListFilters` queries
+locally, using the same filter vocabulary (``filter_ci_contain``,
+``filter_status_equal``, ...) as the API.
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Mapping
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.models.email_logs import EmailLogMessage
+from mailtrap.models.email_logs import EmailLogsListFilters
+
+DEFAULT_RESYNC_WINDOW = timedelta(hours=1)
+
+_TIMESTAMP = re.compile(
+    r"(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?",
+    re.IGNORECASE,
+)
+
+# API filter field -> indexed column
+_COLUMNS = {
+    "to": "to_address",
+    "from": "from_address",
+    "subject": "subject",
+    "status": "status",
+    "clicks_count": "clicks_count",
+    "opens_count": "opens_count",
+    "client_ip": "client_ip",
+    "category": "category",
+    "sending_domain_id": "sending_domain_id",
+    "sending_stream": "sending_stream",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS email_logs (
+    message_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    subject TEXT,
+    from_address TEXT NOT NULL,
+    to_address TEXT NOT NULL,
+    sent_at TEXT NOT NULL,
+    client_ip TEXT,
+    category TEXT,
+    sending_stream TEXT NOT NULL,
+    sending_domain_id INTEGER NOT NULL,
+    opens_count INTEGER NOT NULL,
+    clicks_count INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS email_logs_to ON email_logs (to_address);
+CREATE INDEX IF NOT EXISTS email_logs_status ON email_logs (status);
+CREATE INDEX IF NOT EXISTS email_logs_category ON email_logs (category);
+CREATE INDEX IF NOT EXISTS email_logs_domain ON email_logs (sending_domain_id);
+CREATE INDEX IF NOT EXISTS email_logs_sent_at ON email_logs (sent_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+class EmailLogsIndex:
+    """
+    Incrementally synced local copy of email log summaries for one account.
+
+    Each :meth:`sync` only requests logs sent after the newest stored one
+    (minus `resync_window`, so that recent status and counter changes are picked
+    up). The pagination cursor is checkpointed after every page, so an
+    interrupted sync resumes where it stopped.
+
+    `sent_at` is indexed as a fixed-width UTC timestamp, so that ordering and
+    `sent_after`/`sent_before` filters compare times rather than strings with
+    different precisions or offsets.
+    """
+
+    def __init__(
+        self,
+        email_logs_api: EmailLogsApi,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+        resync_window: timedelta = DEFAULT_RESYNC_WINDOW,
+    ) -> None:
+        self._email_logs_api = email_logs_api
+        self._resync_window = resync_window
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def sync(self, sent_after: Optional[str] = None) -> int:
+        """
+        Fetch new email logs into the index.
+
+        Args:
+            sent_after (Optional[str]): Lower bound (ISO 8601) used when the index
+                is empty. Ignored once logs have been synced.
+
+        Returns:
+            int: The number of messages fetched.
+        """
+        state = self._state()
+        cursor = state.get("cursor")
+        if cursor is None:
+            latest = self._latest_sent_at()
+            bound = self._shift(latest, -self._resync_window) if latest else sent_after
+        else:
+            bound = state.get("sent_after")
+        self._set_state(sent_after=bound, cursor=cursor)
+
+        fetched = 0
+        pages = self._email_logs_api.iter_pages(
+            filters=EmailLogsListFilters(sent_after=bound), search_after=cursor
+        )
+        for page in pages:
+            self._upsert(page.messages, cursor=page.next_page_cursor)
+            fetched += len(page.messages)
+
+        self._set_state(sent_after=None, cursor=None)
+        return fetched
+
+    def query(
+        self,
+        filters: Optional[EmailLogsListFilters] = None,
+        limit: Optional[int] = None,
+    ) -> list[EmailLogMessage]:
+        """
+        Run an email logs filter against the local index, newest first.
+
+        Filters on fields that list responses do not carry (`events`,
+        `sending_ip`, `recipient_mx`, `email_service_provider*`) raise
+        `ValueError`.
+        """
+        conditions: list[str] = []
+        args: list[Any] = []
+        if filters is not None:
+            if filters.sent_after is not None:
+                conditions.append("sent_at > ?")
+                args.append(_normalize_timestamp(filters.sent_after))
+            if filters.sent_before is not None:
+                conditions.append("sent_at < ?")
+                args.append(_normalize_timestamp(filters.sent_before))
+            for field, spec in filters.spec_items():
+                condition, condition_args = _condition(field, spec)
+                conditions.append(condition)
+                args.extend(condition_args)
+
+        sql = "SELECT data FROM email_logs"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY sent_at DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            args.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+        return [EmailLogMessage.from_api(json.loads(row[0])) for row in rows]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return int(
+                self._connection.execute("SELECT count(*) FROM email_logs").fetchone()[0]
+            )
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _upsert(self, messages: list[EmailLogMessage], cursor: Optional[str]) -> None:
+        rows = [
+            (
+                message.message_id,
+                message.status,
+                message.subject,
+                message.from_,
+                message.to,
+                _normalize_timestamp(message.sent_at),
+                message.client_ip,
+                message.category,
+                message.sending_stream,
+                message.sending_domain_id,
+                message.opens_count,
+                message.clicks_count,
+                message.model_dump_json(by_alias=True),
+            )
+            for message in messages
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO email_logs VALUES "
+                "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO sync_state VALUES ('cursor', ?)", (cursor,)
+            )
+
+    def _latest_sent_at(self) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute("SELECT max(sent_at) FROM email_logs")
+            return row.fetchone()[0]  # type: ignore[no-any-return]
+
+    def _state(self) -> dict[str, Optional[str]]:
+        with self._lock:
+            rows = self._connection.execute("SELECT key, value FROM sync_state")
+            return dict(rows.fetchall())
+
+    def _set_state(self, sent_after: Optional[str], cursor: Optional[str]) -> None:
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO sync_state VALUES (?, ?)",
+                [("sent_after", sent_after), ("cursor", cursor)],
+            )
+
+    @staticmethod
+    def _shift(timestamp: str, delta: timedelta) -> str:
+        try:
+            parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return timestamp
+        return (parsed + delta).isoformat().replace("+00:00", "Z")
+
+
+def _normalize_timestamp(timestamp: str) -> str:
+    """
+    ISO 8601 timestamp as UTC with microseconds (`2026-01-01T10:00:00.000000Z`),
+    whose text order is its time order. Timestamps without an offset are taken
+    as UTC; anything else (e.g. a bare date) is returned unchanged.
+    """
+    match = _TIMESTAMP.fullmatch(timestamp.strip())
+    if match is None:
+        return timestamp
+    day, time_of_day, fraction, offset = match.groups()
+    if offset is None or offset.upper() == "Z":
+        offset = "+00:00"
+    elif ":" not in offset:
+        offset = f"{offset[:3]}:{offset[3:]}"
+    microseconds = (fraction or "")[:6].ljust(6, "0")
+    parsed = datetime.fromisoformat(f"{day}T{time_of_day}.{microseconds}{offset}")
+    return parsed.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+
+def _condition(field: str, spec: Mapping[str, Any]) -> tuple[str, list[Any]]:
+    """Translate one API filter spec into an SQL condition and its arguments."""
+    column = _COLUMNS.get(field)
+    if column is None:
+        raise ValueError(f"Filtering by {field!r} is not supported locally")
+
+    operator = spec.get("operator")
+    value = spec.get("value")
+    values = list(value) if isinstance(value, (list, tuple)) else [value]
+    placeholders = ", ".join("?" for _ in values)
+
+    if operator == "empty":
+        return f"({column} IS NULL OR {column} = '')", []
+    if operator == "not_empty":
+        return f"({column} IS NOT NULL AND {column} != '')", []
+    if operator == "equal":
+        return f"{column} IN ({placeholders})", values
+    if operator == "not_equal":
+        return f"({column} IS NULL OR {column} NOT IN ({placeholders}))", values
+    if operator == "ci_equal":
+        return f"lower({column}) IN ({placeholders})", [str(v).lower() for v in values]
+    if operator == "ci_not_equal":
+        return (
+            f"({column} IS NULL OR lower({column}) NOT IN ({placeholders}))",
+            [str(v).lower() for v in values],
+        )
+    if operator in ("ci_contain", "ci_not_contain"):
+        pattern = _like_pattern(str(value))
+        if operator == "ci_contain":
+            return f"lower({column}) LIKE ? ESCAPE '\\'", [pattern]
+        return f"({column} IS NULL OR lower({column}) NOT LIKE ? ESCAPE '\\')", [pattern]
+    if operator == "greater_than":
+        return f"{column} > ?", [value]
+    if operator == "less_than":
+        return f"{column} < ?", [value]
+    raise ValueError(f"Unsupported filter operator {operator!r} for {field!r}")
+
+
+def _like_pattern(value: str) -> str:
+    escaped = value.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
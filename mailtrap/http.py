@@ -1,52 +1,249 @@
+import os
+import socket
+import threading
+import time
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass
 from json import JSONDecodeError
+from types import TracebackType
+from typing import IO
 from typing import Any
 from typing import NoReturn
 from typing import Optional
+from typing import Union
+from urllib.parse import urlsplit
 
 from requests import Response
 from requests import Session
+from requests.adapters import DEFAULT_POOLBLOCK
+from requests.adapters import DEFAULT_POOLSIZE
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
 
+from mailtrap._compat import reset_after_fork
+from mailtrap.config import DEFAULT_CHUNK_SIZE
+from mailtrap.config import DEFAULT_POOL_MAXSIZE
 from mailtrap.config import DEFAULT_REQUEST_TIMEOUT
 from mailtrap.exceptions import APIError
 from mailtrap.exceptions import AuthorizationError
+from mailtrap.instrumentation import Instrumentation
+from mailtrap.instrumentation import request_end
+from mailtrap.instrumentation import request_start
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+@dataclass(frozen=True)
+class HostWarmup:
+    host: str
+    addresses: tuple[str, ...]
+    dns_seconds: Optional[float]
+    connect_seconds: Optional[float]
+    """
+    Time of the warmup request, mostly the TCP + TLS handshake; None (as
+    `dns_seconds`) for skipped transports.
+    """
 
 
 class HttpClient:
+    """
+    Thread-safe: every thread gets its own `requests.Session` (which is not
+    safe to share), while all sessions share one transport adapter and with
+    it one connection pool of up to `pool_maxsize` connections per host.
+
+    Fork-safe: in a forked child (prefork servers, `multiprocessing`) the
+    sessions and connection pools inherited from the parent are replaced by
+    new ones, so a client created before the fork never shares sockets with
+    its parent. Custom transports are only reset if they are `HTTPAdapter`s.
+    """
+
     def __init__(
         self,
         host: str,
         headers: Optional[dict[str, str]] = None,
         timeout: int = DEFAULT_REQUEST_TIMEOUT,
+        instrumentation: Union[Instrumentation, Sequence[Instrumentation], None] = None,
+        transport: Optional[BaseAdapter] = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
     ):
         self._host = host
-        self._session = Session()
-        self._session.headers.update(headers or {})
+        self._headers = dict(headers or {})
+        # e.g. mailtrap.transport.RecordingTransport / ReplayTransport
+        self._transport = (
+            transport if transport is not None else HTTPAdapter(pool_maxsize=pool_maxsize)
+        )
+        self._local = threading.local()
+        reset_after_fork(self)
         self._timeout = timeout
+        if isinstance(instrumentation, Instrumentation):
+            instrumentation = (instrumentation,)
+        self._instrumentation = tuple(instrumentation or ())
 
-    def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.get(
-            self._url(path), params=params, timeout=self._timeout
-        )
-        return self._process_response(response)
+    def get(self, path: str, params: Optional[Union[dict[str, Any], str]] = None) -> Any:
+        return self._process_response(self._request("GET", path, params=params))
 
-    def post(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.post(self._url(path), json=json, timeout=self._timeout)
+    def post(
+        self,
+        path: str,
+        json: Optional[dict[str, Any]] = None,
+        data: Optional[bytes] = None,
+    ) -> Any:
+        """POST `json`, or `data`: a body that is already encoded as JSON."""
+        if data is not None:
+            response = self._request("POST", path, data=data, headers=_JSON_HEADERS)
+        else:
+            response = self._request("POST", path, json=json)
         return self._process_response(response)
 
     def put(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.put(self._url(path), json=json, timeout=self._timeout)
-        return self._process_response(response)
+        return self._process_response(self._request("PUT", path, json=json))
 
     def patch(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
-        response = self._session.patch(self._url(path), json=json, timeout=self._timeout)
-        return self._process_response(response)
+        return self._process_response(self._request("PATCH", path, json=json))
 
     def delete(self, path: str) -> Any:
-        response = self._session.delete(self._url(path), timeout=self._timeout)
-        return self._process_response(response)
+        return self._process_response(self._request("DELETE", path))
+
+    def stream(
+        self,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> "ResponseStream":
+        """
+        GET `path` and iterate over the raw response body in chunks.
+
+        The status is checked before the iterator is returned, so API errors are
+        raised eagerly. The body is never buffered or decoded as a whole; the
+        connection is released once the iterator is exhausted or closed, when
+        it is used as a context manager, or when it is dropped unread.
+        """
+        span = self._start_span("GET", path)
+        response = self._send("GET", path, span, params=params, stream=True)
+        if not response.ok:
+            with response:
+                if span is not None:
+                    span.finish(response, len(response.content))
+                self._handle_failed_response(response)
+        return ResponseStream(response, chunk_size, span)
+
+    def download(
+        self,
+        path: str,
+        destination: Union[str, "os.PathLike[str]", IO[bytes]],
+        params: Optional[dict[str, Any]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """
+        Stream the response body of `path` into a file path or binary file object.
+
+        When a path is given, the body is written to a temporary `.part` file that
+        is renamed into place only after the download completes.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        with self.stream(path, params=params, chunk_size=chunk_size) as chunks:
+            if not isinstance(destination, (str, os.PathLike)):
+                return self._write_chunks(chunks, destination)
+
+            partial_path = f"{os.fspath(destination)}.part"
+            try:
+                with open(partial_path, "wb") as file:
+                    written = self._write_chunks(chunks, file)
+                os.replace(partial_path, destination)
+            finally:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+            return written
+
+    @property
+    def _session(self) -> Session:
+        session: Optional[Session] = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = Session()
+            session.mount("https://", self._transport)
+            session.mount("http://", self._transport)
+        return session
+
+    def _reset_after_fork(self) -> None:
+        self._local = threading.local()
+        transport = self._transport
+        if isinstance(transport, HTTPAdapter):
+            # New pools with the adapter's own settings. The inherited ones are
+            # dropped without being closed or cleared: their sockets belong to
+            # the parent, and their locks may be held by threads of the parent
+            transport.init_poolmanager(
+                getattr(transport, "_pool_connections", DEFAULT_POOLSIZE),
+                getattr(transport, "_pool_maxsize", DEFAULT_POOLSIZE),
+                block=getattr(transport, "_pool_block", DEFAULT_POOLBLOCK),
+            )
+            transport.proxy_manager = {}
+
+    def warmup(self) -> HostWarmup:
+        """
+        Resolve the host and open one pooled connection to it with a `HEAD /`
+        request, so that the next request reuses an established connection.
+        The response status is ignored. Transports other than `HTTPAdapter`
+        (e.g. replay) have no connections to open and are skipped.
+        """
+        url = self._url("/")
+        if not isinstance(self._session.get_adapter(url), HTTPAdapter):
+            return HostWarmup(self._host, (), None, None)
+        parts = urlsplit(url)
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+
+        started = time.perf_counter()
+        addresses = tuple(
+            dict.fromkeys(
+                str(info[4][0])
+                for info in socket.getaddrinfo(
+                    parts.hostname, port, type=socket.SOCK_STREAM
+                )
+            )
+        )
+        resolved = time.perf_counter()
+        self._session.head(url, timeout=self._timeout, allow_redirects=False).close()
+        return HostWarmup(
+            self._host, addresses, resolved - started, time.perf_counter() - resolved
+        )
+
+    def set_headers(self, headers: dict[str, str]) -> None:
+        """Replace the headers sent with every request, from the next request on."""
+        self._headers = dict(headers)
+
+    def _request(self, method: str, path: str, **kwargs: Any) -> Response:
+        span = self._start_span(method, path)
+        response = self._send(method, path, span, **kwargs)
+        if span is not None:
+            span.finish(response, len(response.content))
+        return response
+
+    def _send(
+        self, method: str, path: str, span: Optional["_RequestSpan"], **kwargs: Any
+    ) -> Response:
+        # Headers are read per request, so set_headers() reaches every thread
+        extra_headers = kwargs.pop("headers", None)
+        headers = {**self._headers, **extra_headers} if extra_headers else self._headers
+        try:
+            return self._session.request(
+                method, self._url(path), headers=headers, timeout=self._timeout, **kwargs
+            )
+        except Exception as exc:
+            if span is not None:
+                span.finish(None, 0, exc)
+            raise
+
+    def _start_span(self, method: str, path: str) -> Optional["_RequestSpan"]:
+        if not self._instrumentation:
+            return None
+        return _RequestSpan(self._instrumentation, method, self._host, path)
 
     def _url(self, path: str) -> str:
-        return f"https://{self._host}/{path.lstrip('/')}"
+        # Hosts may carry a scheme, e.g. "http://localhost:8080" for local servers
+        base = self._host if "://" in self._host else f"https://{self._host}"
+        return f"{base.rstrip('/')}/{path.lstrip('/')}"
 
     def _process_response(self, response: Response) -> Any:
         if not response.ok:
@@ -60,6 +257,14 @@ class HttpClient:
         except (JSONDecodeError, ValueError):
             return response.text
 
+    @staticmethod
+    def _write_chunks(chunks: Iterator[bytes], file: IO[bytes]) -> int:
+        written = 0
+        for chunk in chunks:
+            file.write(chunk)
+            written += len(chunk)
+        return written
+
     def _handle_failed_response(self, response: Response) -> NoReturn:
         status_code = response.status_code
 
@@ -104,3 +309,94 @@ class HttpClient:
             return flatten_errors(data["error"])
 
         return ["Unknown error"]
+
+
+class ResponseStream(Iterator[bytes]):
+    """
+    Chunks of a streamed response body, returned by `HttpClient.stream()`.
+
+    The response is closed, and its connection returned to the pool, once the
+    chunks are exhausted, on `close()` (also when used as a context manager),
+    or when the stream is garbage-collected, even if it was never iterated.
+    """
+
+    def __init__(
+        self, response: Response, chunk_size: int, span: Optional["_RequestSpan"] = None
+    ) -> None:
+        self._response = response
+        self._chunks = response.iter_content(chunk_size=chunk_size)
+        self._span = span
+        self._received = 0
+        self._closed = False
+
+    def __next__(self) -> bytes:
+        if self._closed:
+            raise StopIteration
+        try:
+            chunk: bytes = next(self._chunks)
+        except StopIteration:
+            self._finish(None)
+            raise
+        except Exception as exc:
+            self._finish(exc)
+            raise
+        self._received += len(chunk)
+        return chunk
+
+    def close(self) -> None:
+        self._finish(None)
+
+    def __enter__(self) -> "ResponseStream":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def _finish(self, error: Optional[BaseException]) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._response.close()
+        if self._span is not None:
+            self._span.finish(self._response, self._received, error)
+
+
+class _RequestSpan:
+    """Start/end event bookkeeping of one instrumented request."""
+
+    def __init__(
+        self,
+        instrumentation: tuple[Instrumentation, ...],
+        method: str,
+        host: str,
+        path: str,
+    ) -> None:
+        self._instrumentation = instrumentation
+        self._start = request_start(method, host, path)
+        self._contexts = [hook.on_request_start(self._start) for hook in instrumentation]
+
+    def finish(
+        self,
+        response: Optional[Response],
+        bytes_in: int,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        body = response.request.body if response is not None else None
+        event = request_end(
+            self._start,
+            status=response.status_code if response is not None else None,
+            bytes_out=len(body) if body else 0,
+            bytes_in=bytes_in,
+            elapsed=response.elapsed if response is not None else None,
+            error=error,
+        )
+        for hook, context in zip(self._instrumentation, self._contexts):
+            hook.on_request_end(event, context)
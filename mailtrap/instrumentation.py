@@ -0,0 +1,238 @@
+"""Request instrumentation hooks for :class:`~mailtrap.http.HttpClient`.
+
+An :class:`Instrumentation` receives a :class:`RequestStart` event before every
+request and a :class:`RequestEnd` event once the response has been read (or
+the request failed). Paths are reported in templated form
+(``/api/accounts/{id}/email_logs``) so they can be used as low-cardinality
+metric labels.
+
+:class:`PrometheusInstrumentation` and :class:`OpenTelemetryInstrumentation`
+adapt the events to ``prometheus_client`` histograms and OpenTelemetry client
+spans; both packages are optional. Clients without instrumentation skip event
+creation entirely.
+"""
+
+import functools
+import re
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from typing import Optional
+
+from mailtrap._compat import optional_module
+
+DEFAULT_DURATION_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+DEFAULT_SIZE_BUCKETS = tuple(float(4**exponent) for exponent in range(4, 14))
+
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+
+@dataclass(frozen=True)
+class RequestStart:
+    method: str
+    host: str
+    path: str
+    """Templated path, e.g. `/api/accounts/{id}/email_logs`."""
+    started_at: float
+    """`time.perf_counter()` value when the request was started."""
+
+
+@dataclass(frozen=True)
+class RequestEnd:
+    method: str
+    host: str
+    path: str
+    status: Optional[int]
+    """HTTP status code, or None if no response was received."""
+    bytes_out: int
+    bytes_in: int
+    duration: float
+    """Seconds from the start of the request until the body was read."""
+    server_time: Optional[float]
+    """Seconds until the response headers arrived (connect + TLS + server time)."""
+    error: Optional[BaseException] = None
+
+    @property
+    def error_class(self) -> Optional[str]:
+        """Exception class name, or `http_<status>` for non-2xx responses."""
+        if self.error is not None:
+            return type(self.error).__name__
+        if self.status is not None and self.status >= 400:
+            return f"http_{self.status}"
+        return None
+
+
+class Instrumentation:
+    """
+    Base class for request hooks. `on_request_start` may return any context
+    object; it is passed back to `on_request_end` of the same request.
+    """
+
+    def on_request_start(self, event: RequestStart) -> Any:
+        return None
+
+    def on_request_end(self, event: RequestEnd, context: Any) -> None:
+        pass
+
+
+class PrometheusInstrumentation(Instrumentation):
+    """
+    Records request durations and response sizes in Prometheus histograms and
+    failures in a counter, labelled by method, templated path and status.
+
+    Metrics are created with ``prometheus_client`` unless objects with the same
+    interface (`labels(...).observe()`/`.inc()`) are passed in.
+    """
+
+    def __init__(
+        self,
+        namespace: str = "mailtrap_client",
+        registry: Any = None,
+        duration_histogram: Any = None,
+        size_histogram: Any = None,
+        error_counter: Any = None,
+    ) -> None:
+        if duration_histogram is None or size_histogram is None or error_counter is None:
+            prometheus = optional_module("prometheus_client")
+            if prometheus is None:
+                raise ImportError("prometheus_client is required for Prometheus metrics")
+            registry_kwargs = {"registry": registry} if registry is not None else {}
+            labels = ("method", "path", "status")
+            if duration_histogram is None:
+                duration_histogram = prometheus.Histogram(
+                    "request_duration_seconds",
+                    "Mailtrap API request duration",
+                    labels,
+                    namespace=namespace,
+                    buckets=DEFAULT_DURATION_BUCKETS,
+                    **registry_kwargs,
+                )
+            if size_histogram is None:
+                size_histogram = prometheus.Histogram(
+                    "response_size_bytes",
+                    "Mailtrap API response body size",
+                    labels,
+                    namespace=namespace,
+                    buckets=DEFAULT_SIZE_BUCKETS,
+                    **registry_kwargs,
+                )
+            if error_counter is None:
+                error_counter = prometheus.Counter(
+                    "request_errors",
+                    "Failed Mailtrap API requests",
+                    ("method", "path", "error_class"),
+                    namespace=namespace,
+                    **registry_kwargs,
+                )
+        self.duration_histogram = duration_histogram
+        self.size_histogram = size_histogram
+        self.error_counter = error_counter
+
+    def on_request_end(self, event: RequestEnd, context: Any) -> None:
+        status = str(event.status) if event.status is not None else "none"
+        self.duration_histogram.labels(event.method, event.path, status).observe(
+            event.duration
+        )
+        self.size_histogram.labels(event.method, event.path, status).observe(
+            event.bytes_in
+        )
+        error_class = event.error_class
+        if error_class is not None:
+            self.error_counter.labels(event.method, event.path, error_class).inc()
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """
+    Wraps every request in an OpenTelemetry client span named
+    `<METHOD> <templated path>` with the HTTP semantic-convention attributes.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:
+        self._trace = optional_module("opentelemetry.trace")
+        if tracer is None:
+            if self._trace is None:
+                raise ImportError("opentelemetry-api is required for tracing")
+            tracer = self._trace.get_tracer("mailtrap")
+        self.tracer = tracer
+
+    def on_request_start(self, event: RequestStart) -> Any:
+        kwargs = {"kind": self._trace.SpanKind.CLIENT} if self._trace else {}
+        return self.tracer.start_span(
+            f"{event.method} {event.path}",
+            attributes={
+                "http.request.method": event.method,
+                "url.template": event.path,
+                "server.address": event.host,
+            },
+            **kwargs,
+        )
+
+    def on_request_end(self, event: RequestEnd, context: Any) -> None:
+        span = context
+        if event.status is not None:
+            span.set_attribute("http.response.status_code", event.status)
+        span.set_attribute("http.request.body.size", event.bytes_out)
+        span.set_attribute("http.response.body.size", event.bytes_in)
+        error_class = event.error_class
+        if error_class is not None:
+            span.set_attribute("error.type", error_class)
+            if event.error is not None:
+                span.record_exception(event.error)
+            if self._trace is not None:
+                span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+        span.end()
+
+
+@functools.lru_cache(maxsize=1024)
+def template_path(path: str) -> str:
+    """Replace numeric and UUID path segments with `{id}`."""
+    segments = path.split("?", 1)[0].split("/")
+    return "/".join(
+        "{id}" if _ID_SEGMENT.match(segment) else segment for segment in segments
+    )
+
+
+def request_start(method: str, host: str, path: str) -> RequestStart:
+    return RequestStart(
+        method=method,
+        host=host,
+        path=template_path(path),
+        started_at=time.perf_counter(),
+    )
+
+
+def request_end(
+    start: RequestStart,
+    status: Optional[int],
+    bytes_out: int,
+    bytes_in: int,
+    elapsed: Optional[timedelta],
+    error: Optional[BaseException] = None,
+) -> RequestEnd:
+    return RequestEnd(
+        method=start.method,
+        host=start.host,
+        path=start.path,
+        status=status,
+        bytes_out=bytes_out,
+        bytes_in=bytes_in,
+        duration=time.perf_counter() - start.started_at,
+        server_time=elapsed.total_seconds() if elapsed is not None else None,
+        error=error,
+    )
@@ -2,9 +2,9 @@ from typing import Optional
 from typing import Union
 
 from pydantic import Field
-from pydantic.dataclasses import dataclass
 
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -1,8 +1,7 @@
 from datetime import datetime
 from typing import Optional
 
-from pydantic.dataclasses import dataclass
-
+from mailtrap.models.common import dataclass
 from mailtrap.models.mail.attachment import Disposition
 
 
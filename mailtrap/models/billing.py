@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic.dataclasses import dataclass
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -1,12 +1,52 @@
+import dataclasses
+from collections.abc import Callable
 from typing import Any
+from typing import Optional
 from typing import TypeVar
 from typing import Union
 from typing import cast
+from typing import overload
 
+from pydantic import ConfigDict
+from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import TypeAdapter
-from pydantic.dataclasses import dataclass
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from typing_extensions import dataclass_transform
 
 T = TypeVar("T", bound="RequestParams")
+_C = TypeVar("_C")
+
+
+@overload
+def dataclass(
+    cls: None = None, /, *, config: Optional[ConfigDict] = None, **kwargs: Any
+) -> Callable[[type[_C]], type[_C]]: ...
+
+
+@overload
+def dataclass(
+    cls: type[_C], /, *, config: Optional[ConfigDict] = None, **kwargs: Any
+) -> type[_C]: ...
+
+
+@dataclass_transform(field_specifiers=(dataclasses.field, Field, PrivateAttr))
+def dataclass(
+    cls: Optional[type[_C]] = None,
+    /,
+    *,
+    config: Optional[ConfigDict] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    `pydantic.dataclasses.dataclass` with `defer_build`: the validation and
+    serialization schemas are built when a model is first used, not when its
+    module is imported, so processes only pay for the models they touch.
+    """
+    decorator = pydantic_dataclass(
+        config=ConfigDict(**(config or {}), defer_build=True), **kwargs
+    )
+    return decorator if cls is None else decorator(cls)
 
 
 @dataclass
@@ -18,6 +58,13 @@ class RequestParams:
             TypeAdapter(type(self)).dump_python(self, by_alias=True, exclude_none=True),
         )
 
+    @property
+    def api_json(self: T) -> bytes:
+        """`api_data` encoded as a JSON request body, without the dict in between."""
+        return TypeAdapter[T](type(self)).dump_json(
+            self, by_alias=True, exclude_none=True
+        )
+
     @property
     def api_query_params(self: T) -> dict[str, Any]:
         result: dict[str, Any] = {}
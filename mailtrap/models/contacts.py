@@ -3,9 +3,8 @@ from typing import Any
 from typing import Optional
 from typing import Union
 
-from pydantic.dataclasses import dataclass
-
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 @dataclass
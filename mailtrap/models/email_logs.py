@@ -1,14 +1,23 @@
 """Models for Email Logs API (list, get message, filters)."""
 
+import dataclasses
+import functools
+from collections.abc import Iterable
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 from typing import Literal
 from typing import Optional
 from typing import Union
+from typing import cast
+from urllib.parse import urlencode
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
-from pydantic.dataclasses import dataclass
+from pydantic import TypeAdapter
+
+from mailtrap.models.common import dataclass
 
 # --- Event details (for get-by-id) ---
 
@@ -76,6 +85,19 @@ class MessageEvent:
     ] = None
 
 
+_EVENT_DETAILS_TYPES: dict[str, type[Any]] = {
+    "delivery": EventDetailsDelivery,
+    "open": EventDetailsOpen,
+    "click": EventDetailsClick,
+    "soft_bounce": EventDetailsBounce,
+    "bounce": EventDetailsBounce,
+    "spam": EventDetailsSpam,
+    "unsubscribe": EventDetailsUnsubscribe,
+    "suspension": EventDetailsReject,
+    "reject": EventDetailsReject,
+}
+
+
 def _parse_event_details(
     event_type: str,
     data: Optional[dict[str, Any]],
@@ -94,21 +116,10 @@ def _parse_event_details(
     """Build the correct EventDetails* from event_type and raw details dict."""
     if data is None:
         return None
-    if event_type == "delivery":
-        return EventDetailsDelivery(**data)
-    if event_type == "open":
-        return EventDetailsOpen(**data)
-    if event_type == "click":
-        return EventDetailsClick(**data)
-    if event_type in ("soft_bounce", "bounce"):
-        return EventDetailsBounce(**data)
-    if event_type == "spam":
-        return EventDetailsSpam(**data)
-    if event_type == "unsubscribe":
-        return EventDetailsUnsubscribe(**data)
-    if event_type in ("suspension", "reject"):
-        return EventDetailsReject(**data)
-    return data
+    details_type = _EVENT_DETAILS_TYPES.get(event_type)
+    if details_type is None:
+        return data
+    return details_type(**data)  # type: ignore[no-any-return]
 
 
 def _parse_message_event(event_dict: dict[str, Any]) -> MessageEvent:
@@ -123,13 +134,104 @@ def _parse_message_event(event_dict: dict[str, Any]) -> MessageEvent:
     )
 
 
+_FIELD_DEFAULTS: dict[type[Any], tuple[tuple[str, Any], ...]] = {}
+
+
+def _field_defaults(cls: type[Any]) -> tuple[tuple[str, Any], ...]:
+    defaults = _FIELD_DEFAULTS.get(cls)
+    if defaults is None:
+        defaults = _FIELD_DEFAULTS[cls] = tuple(
+            (field.name, field.default) for field in dataclasses.fields(cls)
+        )
+    return defaults
+
+
+def _construct(cls: type[Any], data: dict[str, Any]) -> Any:
+    """Create a dataclass instance from trusted data, skipping validation."""
+    instance = object.__new__(cls)
+    instance.__dict__.update(
+        {name: data.get(name, default) for name, default in _field_defaults(cls)}
+    )
+    return instance
+
+
+def _construct_message_event(event_dict: dict[str, Any]) -> MessageEvent:
+    """Trusted counterpart of _parse_message_event: no per-event validation."""
+    event_type = event_dict["event_type"]
+    details = event_dict.get("details")
+    details_type = _EVENT_DETAILS_TYPES.get(event_type)
+    if details is not None and details_type is not None:
+        details = _construct(details_type, details)
+    return cast(
+        MessageEvent,
+        _construct(
+            MessageEvent,
+            {
+                "event_type": event_type,
+                "created_at": event_dict["created_at"],
+                "details": details,
+            },
+        ),
+    )
+
+
+class LazyMessageEvent(MessageEvent):
+    """
+    MessageEvent that keeps the raw details dict from the API and builds the
+    typed EventDetails* only when `details` is first accessed.
+    """
+
+    def __init__(
+        self,
+        event_type: str,
+        created_at: str,
+        raw_details: Optional[dict[str, Any]] = None,
+        trusted: bool = False,
+    ) -> None:
+        self.__dict__.update(
+            event_type=event_type,
+            created_at=created_at,
+            _raw_details=raw_details,
+            _trusted=trusted,
+        )
+
+    @property
+    def details(self) -> Any:
+        state = self.__dict__
+        if "_details" not in state:
+            raw_details = state["_raw_details"]
+            details_type = _EVENT_DETAILS_TYPES.get(self.event_type)
+            if raw_details is not None and details_type is not None and state["_trusted"]:
+                state["_details"] = _construct(details_type, raw_details)
+            else:
+                state["_details"] = _parse_event_details(self.event_type, raw_details)
+        return state["_details"]
+
+    @details.setter
+    def details(self, value: Any) -> None:
+        self.__dict__["_details"] = value
+
+    @property
+    def is_parsed(self) -> bool:
+        return "_details" in self.__dict__
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MessageEvent):
+            return NotImplemented
+        return (self.event_type, self.created_at, self.details) == (
+            other.event_type,
+            other.created_at,
+            other.details,
+        )
+
+
 class EmailLogMessage(BaseModel):
     """
     Email log message. Used for both list and get-by-id; from list response
     only summary fields are set, raw_message_url and events are empty.
     """
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     message_id: str
     status: Literal["delivered", "not_delivered", "enqueued", "opted_out"]
@@ -150,18 +252,70 @@ class EmailLogMessage(BaseModel):
     events: list[MessageEvent] = Field(default_factory=list)
 
     @classmethod
-    def from_api(cls, data: dict[str, Any]) -> "EmailLogMessage":
-        """Build from API response (handles 'from' alias and None for events/vars)."""
+    def from_api(
+        cls, data: dict[str, Any], trusted: bool = False, lazy_events: bool = False
+    ) -> "EmailLogMessage":
+        """
+        Build from API response (handles 'from' alias and None for events/vars).
+
+        With `trusted=True`, events and their details are constructed without
+        per-event validation; the message fields themselves are still validated.
+        Use it for bulk exports of data coming straight from the API.
+
+        With `lazy_events=True`, events are returned as `LazyMessageEvent`
+        objects that keep the raw details dict and parse it on first access.
+        """
+        return cls(**cls._api_payload(data, trusted, lazy_events))
+
+    @classmethod
+    def from_api_list(
+        cls,
+        items: Iterable[dict[str, Any]],
+        trusted: bool = False,
+        lazy_events: bool = False,
+    ) -> list["EmailLogMessage"]:
+        """Build a whole page of messages with a single compiled validator call."""
+        payloads = [cls._api_payload(item, trusted, lazy_events) for item in items]
+        return _message_list_adapter().validate_python(payloads)
+
+    @staticmethod
+    def _api_payload(
+        data: dict[str, Any], trusted: bool, lazy_events: bool
+    ) -> dict[str, Any]:
         payload = dict(data)
-        if payload.get("events") is None:
+        events = payload.get("events")
+        if events is None:
             payload["events"] = []
+        elif lazy_events:
+            payload["events"] = [
+                LazyMessageEvent(
+                    e["event_type"], e["created_at"], e.get("details"), trusted
+                )
+                for e in events
+            ]
+        elif trusted:
+            payload["events"] = [_construct_message_event(e) for e in events]
         else:
-            payload["events"] = [_parse_message_event(e) for e in payload["events"]]
+            payload["events"] = [_parse_message_event(e) for e in events]
         if payload.get("custom_variables") is None:
             payload["custom_variables"] = {}
         if payload.get("template_variables") is None:
             payload["template_variables"] = {}
-        return cls(**payload)
+        return payload
+
+
+@functools.lru_cache(maxsize=None)
+def _message_list_adapter() -> TypeAdapter[list[EmailLogMessage]]:
+    return TypeAdapter(list[EmailLogMessage])
+
+
+@dataclass(config=ConfigDict(arbitrary_types_allowed=True))
+class EmailLogHydrationResult:
+    """Outcome of fetching full details for one message; `error` is set on failure."""
+
+    message_id: str
+    message: Optional[EmailLogMessage] = None
+    error: Optional[Exception] = None
 
 
 @dataclass
@@ -294,14 +448,58 @@ def filter_string_not_empty() -> dict[str, Any]:
 # --- Email logs list filters (top-level) ---
 
 
+# Python attribute -> API filter key (from_ -> "from"), in serialization order
+_FILTER_SPEC_FIELDS = (
+    ("to", "to"),
+    ("from_", "from"),
+    ("subject", "subject"),
+    ("status", "status"),
+    ("events", "events"),
+    ("clicks_count", "clicks_count"),
+    ("opens_count", "opens_count"),
+    ("client_ip", "client_ip"),
+    ("sending_ip", "sending_ip"),
+    ("email_service_provider_response", "email_service_provider_response"),
+    ("email_service_provider", "email_service_provider"),
+    ("recipient_mx", "recipient_mx"),
+    ("category", "category"),
+    ("sending_domain_id", "sending_domain_id"),
+    ("sending_stream", "sending_stream"),
+)
+
+
 class EmailLogsListFilters:
     """
     Filters for listing email logs. Pass to email_logs.get_list(filters=...).
     All fields are optional. Date range: sent_after, sent_before (ISO 8601).
     Other fields are filter specs: {"operator": "...", "value": ...} or
     {"operator": "empty"}.
+
+    Filters are deeply immutable and hashable, so they can be used as cache
+    keys: specs are copied on creation into read-only mappings, with lists
+    turned into tuples. Use `replace()` to derive modified filters. The
+    encoded query string is built once and reused for every page request.
     """
 
+    sent_after: Optional[str]
+    sent_before: Optional[str]
+    to: Optional[Mapping[str, Any]]
+    from_: Optional[Mapping[str, Any]]
+    subject: Optional[Mapping[str, Any]]
+    status: Optional[Mapping[str, Any]]
+    events: Optional[Mapping[str, Any]]
+    clicks_count: Optional[Mapping[str, Any]]
+    opens_count: Optional[Mapping[str, Any]]
+    client_ip: Optional[Mapping[str, Any]]
+    sending_ip: Optional[Mapping[str, Any]]
+    email_service_provider_response: Optional[Mapping[str, Any]]
+    email_service_provider: Optional[Mapping[str, Any]]
+    recipient_mx: Optional[Mapping[str, Any]]
+    category: Optional[Mapping[str, Any]]
+    sending_domain_id: Optional[Mapping[str, Any]]
+    sending_stream: Optional[Mapping[str, Any]]
+    _key: tuple[Any, ...]
+
     def __init__(
         self,
         *,
@@ -323,23 +521,47 @@ class EmailLogsListFilters:
         sending_domain_id: Optional[dict[str, Any]] = None,
         sending_stream: Optional[dict[str, Any]] = None,
     ) -> None:
-        self.sent_after = sent_after
-        self.sent_before = sent_before
-        self.to = to
-        self.from_ = from_
-        self.subject = subject
-        self.status = status
-        self.events = events
-        self.clicks_count = clicks_count
-        self.opens_count = opens_count
-        self.client_ip = client_ip
-        self.sending_ip = sending_ip
-        self.email_service_provider_response = email_service_provider_response
-        self.email_service_provider = email_service_provider
-        self.recipient_mx = recipient_mx
-        self.category = category
-        self.sending_domain_id = sending_domain_id
-        self.sending_stream = sending_stream
+        fields = dict(locals())
+        del fields["self"]
+        for name, value in fields.items():
+            object.__setattr__(self, name, _deep_freeze(value))
+        object.__setattr__(self, "_key", _freeze(fields))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EmailLogsListFilters):
+            return NotImplemented
+        return bool(self._key == other._key)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self._fields().items()
+            if value is not None
+        )
+        return f"{type(self).__name__}({fields})"
+
+    def replace(self, **changes: Any) -> "EmailLogsListFilters":
+        """Return new filters with the given fields replaced."""
+        return type(self)(**{**self._fields(), **changes})
+
+    def spec_items(self) -> list[tuple[str, Mapping[str, Any]]]:
+        """Set filter specs as (API field name, spec) pairs, e.g. ("from", {...})."""
+        spec_keys = [(key, getattr(self, name)) for name, key in _FILTER_SPEC_FIELDS]
+        return [(key, spec) for key, spec in spec_keys if spec is not None]
+
+    @functools.cached_property
+    def query_string(self) -> str:
+        """URL-encoded `to_params()`, computed once per filters instance."""
+        return urlencode(self.to_params(), doseq=True)
 
     def to_params(self) -> dict[str, Any]:
         """Serialize to query params: filters[key] and filters[key][operator]."""
@@ -349,35 +571,40 @@ class EmailLogsListFilters:
         if self.sent_before is not None:
             params["filters[sent_before]"] = self.sent_before
 
-        # Map Python-friendly name to API key (from_ -> "from")
-        spec_keys = [
-            ("to", self.to),
-            ("from", self.from_),
-            ("subject", self.subject),
-            ("status", self.status),
-            ("events", self.events),
-            ("clicks_count", self.clicks_count),
-            ("opens_count", self.opens_count),
-            ("client_ip", self.client_ip),
-            ("sending_ip", self.sending_ip),
-            ("email_service_provider_response", self.email_service_provider_response),
-            ("email_service_provider", self.email_service_provider),
-            ("recipient_mx", self.recipient_mx),
-            ("category", self.category),
-            ("sending_domain_id", self.sending_domain_id),
-            ("sending_stream", self.sending_stream),
-        ]
-        for key, spec in spec_keys:
-            if spec is None:
-                continue
+        for key, spec in self.spec_items():
             prefix = f"filters[{key}]"
             if "operator" in spec:
                 params[f"{prefix}[operator]"] = spec["operator"]
             if "value" in spec:
                 val = spec["value"]
-                if isinstance(val, list):
+                if isinstance(val, tuple):
                     # requests serializes list as key=v1&key=v2
-                    params[f"{prefix}[value][]"] = val
+                    params[f"{prefix}[value][]"] = list(val)
                 else:
                     params[f"{prefix}[value]"] = val
         return params
+
+    def _fields(self) -> dict[str, Any]:
+        return {
+            "sent_after": self.sent_after,
+            "sent_before": self.sent_before,
+            **{name: getattr(self, name) for name, _ in _FILTER_SPEC_FIELDS},
+        }
+
+
+def _deep_freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts/lists: mappings become proxies, lists tuples."""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _deep_freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_deep_freeze(item) for item in value)
+    return value
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable equivalent of nested dicts/lists, used as the filters identity."""
+    if isinstance(value, Mapping):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
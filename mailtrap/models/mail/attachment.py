@@ -4,9 +4,9 @@ from typing import Optional
 from pydantic import Field
 from pydantic import FieldSerializationInfo
 from pydantic import field_serializer
-from pydantic.dataclasses import dataclass
 
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 class Disposition(str, Enum):
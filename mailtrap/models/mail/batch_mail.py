@@ -3,9 +3,9 @@ from typing import Optional
 from typing import Union
 
 from pydantic import Field
-from pydantic.dataclasses import dataclass
 
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 from mailtrap.models.mail.address import Address
 from mailtrap.models.mail.attachment import Attachment
 
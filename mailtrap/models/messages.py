@@ -1,12 +1,13 @@
 from datetime import datetime
 from typing import Any
+from typing import Literal
 from typing import Optional
 from typing import Union
 
 from pydantic import Field
-from pydantic.dataclasses import dataclass
 
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -128,3 +129,15 @@ class AnalysisReportSuccess(AnalysisReport):
 @dataclass
 class AnalysisReportResponse:
     report: Union[AnalysisReportError, AnalysisReportSuccess]
+
+
+MessageArtifact = Literal[
+    "html",
+    "html_source",
+    "text",
+    "raw",
+    "eml",
+    "headers",
+    "spam_report",
+    "html_analysis",
+]
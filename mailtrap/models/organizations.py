@@ -1,6 +1,5 @@
-from pydantic.dataclasses import dataclass
-
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -1,8 +1,7 @@
 from typing import Optional
 
-from pydantic.dataclasses import dataclass
-
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -1,9 +1,28 @@
+from array import array
+from collections.abc import Iterable
+from collections.abc import Mapping
+from typing import Any
 from typing import Optional
 from typing import Union
 
-from pydantic.dataclasses import dataclass
-
+from mailtrap._compat import optional_numpy
 from mailtrap.models.common import RequestParams
+from mailtrap.models.common import dataclass
+
+SENDING_STATS_COUNT_FIELDS = (
+    "delivery_count",
+    "bounce_count",
+    "open_count",
+    "click_count",
+    "spam_count",
+)
+SENDING_STATS_RATE_FIELDS = (
+    "delivery_rate",
+    "bounce_rate",
+    "open_rate",
+    "click_rate",
+    "spam_rate",
+)
 
 
 @dataclass
@@ -27,6 +46,20 @@ class SendingStatGroup:
     stats: SendingStats
 
 
+@dataclass
+class DailySendingStatGroup(SendingStatGroup):
+    date: str
+
+
+@dataclass
+class SendingStatsSnapshot:
+    stats: SendingStats
+    domains: list[SendingStatGroup]
+    categories: list[SendingStatGroup]
+    email_service_providers: list[SendingStatGroup]
+    date: list[SendingStatGroup]
+
+
 @dataclass
 class StatsFilterParams(RequestParams):
     start_date: Optional[str] = None
@@ -35,3 +68,85 @@ class StatsFilterParams(RequestParams):
     sending_streams: Optional[list[str]] = None
     categories: Optional[list[str]] = None
     email_service_providers: Optional[list[str]] = None
+
+
+class SendingStatsColumns:
+    """
+    Grouped sending stats in columnar form.
+
+    `values` holds the group values (domain ids, categories, dates, ...) and
+    `columns` maps each of the ten `SendingStats` metrics to a contiguous typed
+    array aligned with `values`: `numpy.ndarray` (int64 counts, float64 rates)
+    when NumPy is installed, stdlib `array.array` otherwise. Both expose the
+    buffer protocol, so columns can be handed to Arrow/Parquet writers without
+    copying row objects.
+    """
+
+    def __init__(
+        self, name: str, values: list[Union[str, int]], columns: dict[str, Any]
+    ) -> None:
+        self.name = name
+        self.values = values
+        self.columns = columns
+        self._positions: Optional[dict[Union[str, int], int]] = None
+
+    @classmethod
+    def from_api(
+        cls,
+        name: str,
+        items: Iterable[Mapping[str, Any]],
+        use_numpy: Optional[bool] = None,
+    ) -> "SendingStatsColumns":
+        """
+        Build columns straight from grouped stats API items
+        (`{<name>: value, "stats": {...}}`) without creating per-row objects.
+        """
+        items = list(items)
+        stats = [item["stats"] for item in items]
+        numpy = optional_numpy() if use_numpy is not False else None
+        if use_numpy and numpy is None:
+            raise ImportError("NumPy is required for use_numpy=True")
+
+        columns: dict[str, Any] = {}
+        for field in SENDING_STATS_COUNT_FIELDS:
+            column = [row[field] for row in stats]
+            columns[field] = (
+                numpy.array(column, dtype=numpy.int64) if numpy else array("q", column)
+            )
+        for field in SENDING_STATS_RATE_FIELDS:
+            column = [row[field] for row in stats]
+            columns[field] = (
+                numpy.array(column, dtype=numpy.float64) if numpy else array("d", column)
+            )
+        return cls(name, [item[name] for item in items], columns)
+
+    @classmethod
+    def from_groups(
+        cls, groups: list[SendingStatGroup], use_numpy: Optional[bool] = None
+    ) -> "SendingStatsColumns":
+        """Convert an already parsed list of `SendingStatGroup` to columns."""
+        name = groups[0].name if groups else ""
+        items = [{name: group.value, "stats": vars(group.stats)} for group in groups]
+        return cls.from_api(name, items, use_numpy=use_numpy)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, metric: str) -> Any:
+        return self.columns[metric]
+
+    def row(self, value: Union[str, int]) -> SendingStats:
+        """Get the stats of a single group value."""
+        if self._positions is None:
+            self._positions = {item: index for index, item in enumerate(self.values)}
+        index = self._positions[value]
+        metrics: dict[str, Any] = {
+            field: int(self.columns[field][index]) for field in SENDING_STATS_COUNT_FIELDS
+        }
+        for field in SENDING_STATS_RATE_FIELDS:
+            metrics[field] = float(self.columns[field][index])
+        return SendingStats(**metrics)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Columns keyed by name, including the group values; e.g. for pyarrow.table."""
+        return {self.name: self.values, **self.columns}
@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Optional
 from typing import Union
 
-from pydantic.dataclasses import dataclass
+from mailtrap.models.common import dataclass
 
 
 @dataclass
@@ -0,0 +1,270 @@
+"""Local SQLite warehouse of daily sending stats.
+
+:class:`StatsStore` mirrors per-day stats from
+:class:`~mailtrap.api.resources.stats.StatsApi` into SQLite, one row per day and
+group value (domain, category, email service provider). Days that were already
+synced are answered locally; only missing days and the most recent, still
+changing, days are fetched again.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from datetime import date
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from functools import partial
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from mailtrap._concurrency import run_concurrently
+from mailtrap.api.resources.stats import GroupKey
+from mailtrap.api.resources.stats import StatsApi
+from mailtrap.config import DEFAULT_MAX_WORKERS
+from mailtrap.models.stats import SENDING_STATS_COUNT_FIELDS
+from mailtrap.models.stats import SENDING_STATS_RATE_FIELDS
+from mailtrap.models.stats import DailySendingStatGroup
+from mailtrap.models.stats import SendingStatGroup
+from mailtrap.models.stats import SendingStats
+from mailtrap.models.stats import StatsFilterParams
+
+DEFAULT_MUTABLE_DAYS = 3
+DEFAULT_CHUNK_DAYS = 31
+
+_METRIC_FIELDS = SENDING_STATS_COUNT_FIELDS + SENDING_STATS_RATE_FIELDS
+
+_GROUP_METHODS = {
+    "domains": "by_domain",
+    "categories": "by_category",
+    "email_service_providers": "by_email_service_provider",
+}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS daily_stats (
+    account_id INTEGER NOT NULL,
+    grouping TEXT NOT NULL,
+    day TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL,
+    value_type TEXT NOT NULL,
+    {", ".join(f"{field} INTEGER NOT NULL" for field in SENDING_STATS_COUNT_FIELDS)},
+    {", ".join(f"{field} REAL NOT NULL" for field in SENDING_STATS_RATE_FIELDS)},
+    PRIMARY KEY (account_id, grouping, day, value)
+);
+CREATE TABLE IF NOT EXISTS synced_days (
+    account_id INTEGER NOT NULL,
+    grouping TEXT NOT NULL,
+    day TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (account_id, grouping, day)
+);
+"""
+
+
+class StatsStore:
+    """
+    Incrementally synced local copy of daily sending stats for one account.
+
+    `date` stats are backfilled with `by_date` requests over chunks of
+    `chunk_days` days. The other groupings (`domains`, `categories`,
+    `email_service_providers`) have no per-day endpoint, so they are fetched
+    with one request per day. Up to `max_workers` requests run concurrently on
+    the thread pool shared by the client's bulk helpers, or on `executor`;
+    each fetched chunk is saved right away, under the store's lock. On the
+    first error the chunks that have not been fetched yet are cancelled.
+
+    The last `mutable_days` days (in UTC) are refetched on every sync because
+    their stats can still change. `today` returns the current UTC date; pass
+    your own to pin it, e.g. in tests.
+    """
+
+    def __init__(
+        self,
+        stats_api: StatsApi,
+        account_id: int,
+        path: Union[str, "os.PathLike[str]"] = ":memory:",
+        mutable_days: int = DEFAULT_MUTABLE_DAYS,
+        chunk_days: int = DEFAULT_CHUNK_DAYS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        today: Optional[Callable[[], date]] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self._stats_api = stats_api
+        self._account_id = account_id
+        self._mutable_days = mutable_days
+        self._chunk_days = chunk_days
+        self._max_workers = max_workers
+        self._executor = executor
+        self._today = today if today is not None else _utc_today
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.executescript(_SCHEMA)
+
+    def sync(
+        self,
+        start_date: str,
+        end_date: str,
+        groups: Iterable[GroupKey] = ("date",),
+    ) -> int:
+        """
+        Fetch the days between `start_date` and `end_date` (inclusive, ISO dates)
+        that are missing locally or still mutable.
+
+        Returns:
+            int: The number of (group, day) pairs that were fetched.
+        """
+        tasks: list[tuple[GroupKey, list[str]]] = []
+        for group in dict.fromkeys(groups):
+            days = self._days_to_fetch(group, _date_range(start_date, end_date))
+            chunk_days = self._chunk_days if group == "date" else 1
+            tasks.extend((group, chunk) for chunk in _chunks(days, chunk_days))
+        if not tasks:
+            return 0
+
+        run_concurrently(
+            (partial(self._sync_chunk, group, days) for group, days in tasks),
+            self._max_workers,
+            self._executor,
+        )
+
+        return sum(len(days) for _, days in tasks)
+
+    def query(
+        self,
+        start_date: str,
+        end_date: str,
+        group: GroupKey = "date",
+        value: Optional[Union[str, int]] = None,
+    ) -> list[DailySendingStatGroup]:
+        """
+        Answer a per-day stats query from the local store, without API requests.
+        Only days that were synced before are returned.
+        """
+        sql = (
+            f"SELECT day, name, value, value_type, {', '.join(_METRIC_FIELDS)} "
+            "FROM daily_stats "
+            "WHERE account_id = ? AND grouping = ? AND day BETWEEN ? AND ?"
+        )
+        args: list[Any] = [self._account_id, group, start_date, end_date]
+        if value is not None:
+            sql += " AND value = ?"
+            args.append(str(value))
+        sql += " ORDER BY day, value"
+
+        with self._lock:
+            rows = self._connection.execute(sql, args).fetchall()
+
+        return [
+            DailySendingStatGroup(
+                date=day,
+                name=name,
+                value=int(raw_value) if value_type == "int" else raw_value,
+                stats=SendingStats(**dict(zip(_METRIC_FIELDS, metrics))),
+            )
+            for day, name, raw_value, value_type, *metrics in rows
+        ]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _days_to_fetch(self, group: GroupKey, days: list[str]) -> list[str]:
+        mutable_since = (self._today() - timedelta(days=self._mutable_days)).isoformat()
+        if not days:
+            return []
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT day FROM synced_days "
+                "WHERE account_id = ? AND grouping = ? AND day BETWEEN ? AND ?",
+                (self._account_id, group, days[0], days[-1]),
+            ).fetchall()
+        synced = {row[0] for row in rows}
+        return [day for day in days if day not in synced or day >= mutable_since]
+
+    def _sync_chunk(self, group: GroupKey, days: list[str]) -> None:
+        self._save(group, days, self._fetch(group, days))
+
+    def _fetch(
+        self, group: GroupKey, days: list[str]
+    ) -> list[tuple[str, SendingStatGroup]]:
+        params = StatsFilterParams(start_date=days[0], end_date=days[-1])
+        if group == "date":
+            wanted = set(days)
+            return [
+                (str(stat.value), stat)
+                for stat in self._stats_api.by_date(self._account_id, params)
+                if str(stat.value) in wanted
+            ]
+        fetch_group = getattr(self._stats_api, _GROUP_METHODS[group])
+        return [(days[0], stat) for stat in fetch_group(self._account_id, params)]
+
+    def _save(
+        self,
+        group: GroupKey,
+        days: list[str],
+        stats: list[tuple[str, SendingStatGroup]],
+    ) -> None:
+        placeholders = ", ".join("?" for _ in range(len(_METRIC_FIELDS) + 6))
+        rows = [
+            (
+                self._account_id,
+                group,
+                day,
+                stat.name,
+                str(stat.value),
+                "int" if isinstance(stat.value, int) else "str",
+                *(getattr(stat.stats, field) for field in _METRIC_FIELDS),
+            )
+            for day, stat in stats
+        ]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "DELETE FROM daily_stats "
+                "WHERE account_id = ? AND grouping = ? AND day = ?",
+                [(self._account_id, group, day) for day in days],
+            )
+            self._connection.executemany(
+                "INSERT INTO daily_stats (account_id, grouping, day, name, value, "
+                f"value_type, {', '.join(_METRIC_FIELDS)}) VALUES ({placeholders})",
+                rows,
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO synced_days VALUES (?, ?, ?, ?)",
+                [(self._account_id, group, day, time.time()) for day in days],
+            )
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _date_range(start_date: str, end_date: str) -> list[str]:
+    start = date.fromisoformat(start_date)
+    end = date.fromisoformat(end_date)
+    return [
+        (start + timedelta(days=offset)).isoformat()
+        for offset in range((end - start).days + 1)
+    ]
+
+
+def _chunks(days: list[str], size: int) -> list[list[str]]:
+    """Split sorted ISO days into runs of consecutive days of at most `size` days."""
+    chunks: list[list[str]] = []
+    previous: Optional[date] = None
+    for day in days:
+        current = date.fromisoformat(day)
+        if (
+            not chunks
+            or len(chunks[-1]) >= size
+            or previous is None
+            or current - previous != timedelta(days=1)
+        ):
+            chunks.append([])
+        chunks[-1].append(day)
+        previous = current
+    return chunks
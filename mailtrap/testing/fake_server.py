@@ -0,0 +1,791 @@
+"""Local stand-in for the Mailtrap API, for offline tests and load testing.
+
+:class:`FakeMailtrapServer` runs a threaded HTTP/1.1 server on localhost that
+implements a subset of the Mailtrap API with in-memory, deterministic data:
+
+* ``POST /api/send[/<inbox_id>]`` and ``POST /api/batch[/<inbox_id>]``
+* ``GET /api/accounts/<id>/email_logs`` (cursor pagination and filters) and
+  ``GET /api/accounts/<id>/email_logs/<message_id>``
+* ``GET /api/accounts/<id>/suppressions`` and
+  ``DELETE /api/accounts/<id>/suppressions/<suppression_id>``
+* ``POST /api/accounts/<id>/contacts/imports`` and
+  ``GET /api/accounts/<id>/contacts/imports/<import_id>``
+* ``GET /api/accounts/<id>/inboxes/<inbox_id>/messages[/<message_id>[/<artifact>]]``
+
+Latency, server errors and 429 rate limiting can be injected per request, so
+that connection pooling, retries and concurrency can be exercised without
+touching production::
+
+    with FakeMailtrapServer(latency=0.02, rate_limit_rate=0.05) as server:
+        client = mt.MailtrapClient(
+            token="test",
+            account_id="1",
+            api_host=server.host,
+            general_api_host=server.host,
+        )
+        client.send(mail)
+        client.email_logs_api.email_logs.get_list()
+
+The server can also be started standalone with
+``python -m mailtrap.testing.fake_server --port 8025 --latency 0.02``.
+"""
+
+import argparse
+import json
+import random
+import re
+import socket
+import threading
+import time
+import uuid
+from collections import Counter
+from collections import deque
+from collections.abc import Callable
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from types import TracebackType
+from typing import Any
+from typing import Optional
+from typing import Union
+from typing import cast
+from urllib.parse import parse_qs
+from urllib.parse import urlsplit
+
+SANDBOX_MESSAGES_PAGE_SIZE = 30
+SENT_MESSAGES_HISTORY = 1000
+
+_BASE_TIME = datetime(2025, 1, 15, 10, 0, tzinfo=timezone.utc)
+_TEXT_ARTIFACTS = {
+    "body.html": "text/html",
+    "body.htmlsource": "text/plain",
+    "body.txt": "text/plain",
+    "body.raw": "message/rfc822",
+    "body.eml": "message/rfc822",
+}
+
+# Email log fields that can be filtered by; the others (events, sending_ip,
+# ...) are not part of the generated messages
+_EMAIL_LOG_FILTER_FIELDS = frozenset(
+    {
+        "sent_after",
+        "sent_before",
+        "to",
+        "from",
+        "subject",
+        "status",
+        "clicks_count",
+        "opens_count",
+        "client_ip",
+        "category",
+        "sending_domain_id",
+        "sending_stream",
+    }
+)
+_EMAIL_LOG_FILTER_PARAM = re.compile(
+    r"filters\[(\w+)\](?:\[(operator|value)\](?:\[\])?)?"
+)
+
+Payload = Union[dict[str, Any], list[Any], str, None]
+Response = tuple[int, Payload]
+Handler = Callable[..., Response]
+
+
+class FakeMailtrapServer:
+    """
+    In-process fake Mailtrap API server.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on; 0 picks a free port.
+        latency (float): Seconds added to every response.
+        latency_jitter (float): Up to this many extra seconds, chosen randomly.
+        error_rate (float): Share of requests answered with a 500 error.
+        rate_limit_rate (float): Share of requests answered with 429 and a
+            `Retry-After` header.
+        retry_after (int): Value of the `Retry-After` header, in seconds.
+        token (Optional[str]): When set, requests without the matching bearer
+            token get 401.
+        email_logs_count (int): Number of generated email log messages.
+        email_logs_page_size (int): Email log messages per page.
+        suppressions_count (int): Number of generated suppressions.
+        sandbox_messages_count (int): Generated messages per sandbox inbox.
+        seed (Optional[int]): Seed of the generated data and injected faults.
+
+    Latency and fault settings are plain attributes and can be changed while
+    the server is running.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        latency_jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        token: Optional[str] = None,
+        email_logs_count: int = 250,
+        email_logs_page_size: int = 50,
+        suppressions_count: int = 20,
+        sandbox_messages_count: int = 60,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.token = token
+        self.email_logs_page_size = email_logs_page_size
+        self.sandbox_messages_count = sandbox_messages_count
+
+        self.connections = 0
+        self.requests = 0
+        self.statuses: Counter[int] = Counter()
+        self.sent_messages: deque[dict[str, Any]] = deque(maxlen=SENT_MESSAGES_HISTORY)
+        self.sent_count = 0
+
+        self._lock = threading.Lock()
+        self._random = random.Random(seed)
+        self._email_logs = [_email_log(index) for index in range(email_logs_count)]
+        self._email_log_positions = {
+            message["message_id"]: index for index, message in enumerate(self._email_logs)
+        }
+        self._suppressions = {
+            suppression["id"]: suppression
+            for suppression in (
+                _suppression(index) for index in range(suppressions_count)
+            )
+        }
+        self._contact_imports: dict[int, dict[str, Any]] = {}
+        self._routes: list[tuple[str, re.Pattern[str], Handler]] = [
+            ("POST", re.compile(r"/api/send(?:/(\d+))?"), self._send),
+            ("POST", re.compile(r"/api/batch(?:/(\d+))?"), self._batch),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/email_logs"),
+                self._email_logs_list,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/email_logs/([\w-]+)"),
+                self._email_log,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/suppressions"),
+                self._suppressions_list,
+            ),
+            (
+                "DELETE",
+                re.compile(r"/api/accounts/\d+/suppressions/([\w-]+)"),
+                self._suppression_delete,
+            ),
+            (
+                "POST",
+                re.compile(r"/api/accounts/\d+/contacts/imports"),
+                self._contact_import_create,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/contacts/imports/(\d+)"),
+                self._contact_import,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/inboxes/(\d+)/messages"),
+                self._sandbox_messages_list,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/inboxes/(\d+)/messages/(\d+)"),
+                self._sandbox_message,
+            ),
+            (
+                "GET",
+                re.compile(r"/api/accounts/\d+/inboxes/(\d+)/messages/(\d+)/([\w.]+)"),
+                self._sandbox_message_artifact,
+            ),
+        ]
+
+        self._httpd = _HTTPServer((host, port), _RequestHandler)
+        self._httpd.fake = self
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def host(self) -> str:
+        """
+        Base URL to pass as `host`, `api_host` or `general_api_host`, e.g.
+        `http://127.0.0.1:8025`.
+        """
+        address, port = self._httpd.server_address[:2]
+        return f"http://{address!s}:{port}"
+
+    def start(self) -> "FakeMailtrapServer":
+        """Serve requests from a daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                kwargs={"poll_interval": 0.05},  # makes close() return quickly
+                name="fake-mailtrap",
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "FakeMailtrapServer":
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def handle(
+        self,
+        method: str,
+        target: str,
+        headers: dict[str, str],
+        body: bytes,
+    ) -> tuple[Response, dict[str, str]]:
+        """Answer one request; returns `(status, payload)` and extra headers."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.latency_jitter)
+            fault = self._random.random()
+        if delay > 0:
+            time.sleep(delay)
+
+        if self.token is not None and headers.get("authorization") != (
+            f"Bearer {self.token}"
+        ):
+            return (401, {"errors": "Unauthorized"}), {}
+        if fault < self.rate_limit_rate:
+            return (429, {"errors": "Rate limit exceeded"}), {
+                "Retry-After": str(self.retry_after)
+            }
+        if fault < self.rate_limit_rate + self.error_rate:
+            return (500, {"errors": "Internal Server Error"}), {}
+
+        url = urlsplit(target)
+        query = parse_qs(url.query)
+        for route_method, pattern, handler in self._routes:
+            match = pattern.fullmatch(url.path)
+            if match is None:
+                continue
+            if route_method != method:
+                return (405, {"error": "Method Not Allowed"}), {}
+            try:
+                data = json.loads(body) if body else {}
+            except ValueError:
+                return (400, {"errors": "Invalid JSON"}), {}
+            return handler(*match.groups(), query=query, data=data), {}
+        return (404, {"error": "Not Found"}), {}
+
+    def _send(self, inbox_id: Optional[str], query: Any, data: Any) -> Response:
+        errors = _mail_errors(data)
+        if errors:
+            return 400, {"success": False, "errors": errors}
+        return 200, {"success": True, "message_ids": self._record_sent(data)}
+
+    def _batch(self, inbox_id: Optional[str], query: Any, data: Any) -> Response:
+        requests = data.get("requests")
+        if not isinstance(requests, list) or not requests:
+            return 400, {"success": False, "errors": ["requests: must not be empty"]}
+        base = data.get("base") or {}
+        responses = []
+        for request in requests:
+            mail = {**base, **request}
+            errors = _mail_errors(mail)
+            if errors:
+                responses.append({"success": False, "errors": errors})
+            else:
+                responses.append(
+                    {"success": True, "message_ids": self._record_sent(mail)}
+                )
+        return 200, {"success": True, "responses": responses}
+
+    def _record_sent(self, mail: dict[str, Any]) -> list[str]:
+        recipients = [
+            *mail.get("to", []),
+            *mail.get("cc", []),
+            *mail.get("bcc", []),
+        ]
+        with self._lock:
+            self.sent_messages.append(mail)
+            self.sent_count += 1
+        return [str(uuid.uuid4()) for _ in recipients]
+
+    def _email_logs_list(self, query: dict[str, list[str]], data: Any) -> Response:
+        filters = _email_log_filters(query)
+        unsupported = sorted(set(filters) - _EMAIL_LOG_FILTER_FIELDS)
+        if unsupported:
+            return 422, {"errors": {"filters": [f"{unsupported[0]} is not supported"]}}
+        try:
+            matching = [
+                message
+                for message in self._email_logs
+                if _email_log_matches(message, filters)
+            ]
+        except ValueError as exc:
+            return 422, {"errors": {"filters": [str(exc)]}}
+
+        remaining = matching
+        search_after = query.get("search_after")
+        if search_after:
+            position = self._email_log_positions.get(search_after[0])
+            if position is None:
+                return 422, {"errors": {"search_after": ["is invalid"]}}
+            remaining = [
+                message
+                for message in matching
+                if self._email_log_positions[message["message_id"]] > position
+            ]
+        page = remaining[: self.email_logs_page_size]
+        return 200, {
+            "messages": page,
+            "total_count": len(matching),
+            "next_page_cursor": (
+                page[-1]["message_id"] if len(remaining) > len(page) else None
+            ),
+        }
+
+    def _email_log(self, message_id: str, query: Any, data: Any) -> Response:
+        position = self._email_log_positions.get(message_id)
+        if position is None:
+            return 404, {"error": "Not Found"}
+        message = self._email_logs[position]
+        return 200, {**message, "events": _email_log_events(message)}
+
+    def _suppressions_list(self, query: dict[str, list[str]], data: Any) -> Response:
+        emails = query.get("email")
+        with self._lock:
+            suppressions = list(self._suppressions.values())
+        if emails:
+            suppressions = [item for item in suppressions if item["email"] == emails[0]]
+        return 200, suppressions
+
+    def _suppression_delete(self, suppression_id: str, query: Any, data: Any) -> Response:
+        with self._lock:
+            suppression = self._suppressions.pop(suppression_id, None)
+        if suppression is None:
+            return 404, {"error": "Not Found"}
+        return 200, suppression
+
+    def _contact_import_create(self, query: Any, data: Any) -> Response:
+        contacts = data.get("contacts")
+        if not isinstance(contacts, list) or not contacts:
+            return 422, {"errors": {"contacts": ["must not be empty"]}}
+        if len(contacts) > 50_000:
+            return 422, {"errors": {"contacts": ["must contain at most 50000 items"]}}
+        with self._lock:
+            import_id = len(self._contact_imports) + 1
+            self._contact_imports[import_id] = {
+                "id": import_id,
+                "status": "finished",
+                "created_contacts_count": len(contacts),
+                "updated_contacts_count": 0,
+                "contacts_over_limit_count": 0,
+            }
+        return 200, {"id": import_id, "status": "started"}
+
+    def _contact_import(self, import_id: str, query: Any, data: Any) -> Response:
+        contact_import = self._contact_imports.get(int(import_id))
+        if contact_import is None:
+            return 404, {"error": "Not Found"}
+        return 200, contact_import
+
+    def _sandbox_messages_list(
+        self, inbox_id: str, query: dict[str, list[str]], data: Any
+    ) -> Response:
+        messages = [
+            _sandbox_message(int(inbox_id), index)
+            for index in range(self.sandbox_messages_count)
+        ]
+        if "last_id" in query:
+            last_id = int(query["last_id"][0])
+            messages = [message for message in messages if message["id"] < last_id]
+        elif "page" in query:
+            start = (int(query["page"][0]) - 1) * SANDBOX_MESSAGES_PAGE_SIZE
+            messages = messages[start:]
+        if "search" in query:
+            search = query["search"][0]
+            messages = [message for message in messages if search in message["subject"]]
+        return 200, messages[:SANDBOX_MESSAGES_PAGE_SIZE]
+
+    def _sandbox_message(
+        self, inbox_id: str, message_id: str, query: Any, data: Any
+    ) -> Response:
+        index = self._sandbox_message_index(int(inbox_id), int(message_id))
+        if index is None:
+            return 404, {"error": "Not Found"}
+        return 200, _sandbox_message(int(inbox_id), index)
+
+    def _sandbox_message_artifact(
+        self, inbox_id: str, message_id: str, artifact: str, query: Any, data: Any
+    ) -> Response:
+        index = self._sandbox_message_index(int(inbox_id), int(message_id))
+        if index is None:
+            return 404, {"error": "Not Found"}
+        message = _sandbox_message(int(inbox_id), index)
+        if artifact in _TEXT_ARTIFACTS:
+            return 200, _sandbox_message_body(message, artifact)
+        if artifact == "mail_headers":
+            return 200, {
+                "headers": {
+                    "date": message["sent_at"],
+                    "from": message["from_email"],
+                    "to": message["to_email"],
+                    "subject": message["subject"],
+                }
+            }
+        if artifact == "spam_report":
+            return 200, {
+                "report": {
+                    "ResponseCode": 2,
+                    "ResponseMessage": "Not spam",
+                    "ResponseVersion": "1.2",
+                    "Score": 0.1,
+                    "Spam": False,
+                    "Threshold": 5,
+                    "Details": [],
+                }
+            }
+        if artifact == "analyze":
+            return 200, {"report": {"status": "success", "errors": []}}
+        return 404, {"error": "Not Found"}
+
+    def _sandbox_message_index(self, inbox_id: int, message_id: int) -> Optional[int]:
+        index = _sandbox_message_id(inbox_id, 0) - message_id
+        return index if 0 <= index < self.sandbox_messages_count else None
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default of 5 drops connections when many clients connect at once; take
+    # the largest backlog the kernel allows.
+    request_queue_size = socket.SOMAXCONN
+    fake: FakeMailtrapServer
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep connections alive
+    disable_nagle_algorithm = True
+
+    def setup(self) -> None:
+        super().setup()
+        fake = self._fake
+        with fake._lock:
+            fake.connections += 1
+
+    def do_GET(self) -> None:
+        self._handle()
+
+    def do_HEAD(self) -> None:
+        self._handle()
+
+    def do_POST(self) -> None:
+        self._handle()
+
+    def do_PUT(self) -> None:
+        self._handle()
+
+    def do_PATCH(self) -> None:
+        self._handle()
+
+    def do_DELETE(self) -> None:
+        self._handle()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    @property
+    def _fake(self) -> FakeMailtrapServer:
+        return cast(_HTTPServer, self.server).fake
+
+    def _handle(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        (status, payload), extra_headers = self._fake.handle(
+            self.command, self.path, headers, body
+        )
+        if isinstance(payload, str):
+            content = payload.encode()
+            content_type = "text/plain; charset=utf-8"
+        else:
+            content = json.dumps(payload).encode()
+            content_type = "application/json"
+
+        with self._fake._lock:
+            self._fake.statuses[status] += 1
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        for name, value in extra_headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(content)
+
+
+def _mail_errors(mail: Any) -> list[str]:
+    if not isinstance(mail, dict):
+        return ["Invalid request body"]
+    errors = []
+    if not isinstance(mail.get("from"), dict) or not mail["from"].get("email"):
+        errors.append("'from' address is required")
+    if not (mail.get("to") or mail.get("cc") or mail.get("bcc")):
+        errors.append("'to', 'cc', or 'bcc' is required")
+    if not (mail.get("subject") or mail.get("template_uuid")):
+        errors.append("'subject' is required")
+    return errors
+
+
+def _email_log(index: int) -> dict[str, Any]:
+    delivered = index % 10 != 9
+    return {
+        "message_id": str(uuid.UUID(int=index + 1)),
+        "status": "delivered" if delivered else "not_delivered",
+        "subject": f"Message {index}",
+        "from": "sender@example.com",
+        "to": f"user{index}@example.com",
+        "sent_at": _timestamp(_BASE_TIME - timedelta(minutes=index)),
+        "client_ip": "203.0.113.10",
+        "category": ("Welcome Email", "Password Reset", "Newsletter")[index % 3],
+        "custom_variables": {"plan": ("free", "pro")[index % 2]},
+        "sending_stream": "bulk" if index % 3 == 2 else "transactional",
+        "sending_domain_id": 3938,
+        "template_id": None,
+        "template_variables": {},
+        "opens_count": index % 3 if delivered else 0,
+        "clicks_count": index % 2 if delivered else 0,
+        "raw_message_url": None,
+    }
+
+
+def _email_log_filters(query: dict[str, list[str]]) -> dict[str, dict[str, Any]]:
+    """Group `filters[field][operator]`/`filters[field][value][]` params by field."""
+    filters: dict[str, dict[str, Any]] = {}
+    for key, values in query.items():
+        match = _EMAIL_LOG_FILTER_PARAM.fullmatch(key)
+        if match is None:
+            continue
+        field, part = match.groups()
+        spec = filters.setdefault(field, {})
+        if part == "operator":
+            spec["operator"] = values[0]
+        elif part == "value":
+            spec["value"] = values
+        else:
+            spec["value"] = values[0]
+    return filters
+
+
+def _email_log_matches(
+    message: dict[str, Any], filters: dict[str, dict[str, Any]]
+) -> bool:
+    for field, spec in filters.items():
+        if field == "sent_after":
+            if _parse_timestamp(message["sent_at"]) <= _parse_timestamp(spec["value"]):
+                return False
+        elif field == "sent_before":
+            if _parse_timestamp(message["sent_at"]) >= _parse_timestamp(spec["value"]):
+                return False
+        elif not _email_log_spec_matches(
+            message.get(field), spec.get("operator"), spec.get("value", [])
+        ):
+            return False
+    return True
+
+
+def _email_log_spec_matches(actual: Any, operator: Any, values: list[str]) -> bool:
+    text = "" if actual is None else str(actual)
+    first = values[0] if values else ""
+    if operator == "empty":
+        return text == ""
+    if operator == "not_empty":
+        return text != ""
+    if operator == "equal":
+        return text in values
+    if operator == "not_equal":
+        return text not in values
+    if operator == "ci_equal":
+        return text.lower() in {value.lower() for value in values}
+    if operator == "ci_not_equal":
+        return text.lower() not in {value.lower() for value in values}
+    if operator == "ci_contain":
+        return first.lower() in text.lower()
+    if operator == "ci_not_contain":
+        return first.lower() not in text.lower()
+    if operator == "greater_than":
+        return actual is not None and float(actual) > float(first)
+    if operator == "less_than":
+        return actual is not None and float(actual) < float(first)
+    raise ValueError(f"operator {operator!r} is not supported")
+
+
+def _parse_timestamp(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def _email_log_events(message: dict[str, Any]) -> list[dict[str, Any]]:
+    sent_at = datetime.fromisoformat(message["sent_at"].replace("Z", "+00:00"))
+    if message["status"] == "not_delivered":
+        return [
+            {
+                "event_type": "bounce",
+                "created_at": _timestamp(sent_at + timedelta(seconds=5)),
+                "details": {
+                    "email_service_provider": "Google",
+                    "email_service_provider_status": "5.1.1",
+                    "email_service_provider_response": "User unknown",
+                    "bounce_category": "hard",
+                },
+            }
+        ]
+    events = [
+        {
+            "event_type": "delivery",
+            "created_at": _timestamp(sent_at + timedelta(seconds=5)),
+            "details": {
+                "sending_ip": "192.0.2.1",
+                "recipient_mx": "mx.example.com",
+                "email_service_provider": "Google",
+            },
+        }
+    ]
+    for count in range(message["opens_count"]):
+        events.append(
+            {
+                "event_type": "open",
+                "created_at": _timestamp(sent_at + timedelta(minutes=count + 1)),
+                "details": {"web_ip_address": "198.51.100.7"},
+            }
+        )
+    return events
+
+
+def _suppression(index: int) -> dict[str, Any]:
+    return {
+        "id": str(uuid.UUID(int=(1 << 64) + index)),
+        "type": ("hard bounce", "spam complaint", "unsubscription")[index % 3],
+        "created_at": _timestamp(_BASE_TIME - timedelta(days=index)),
+        "email": f"suppressed{index}@example.com",
+        "sending_stream": "transactional",
+        "domain_name": "example.com",
+        "message_bounce_category": "hard" if index % 3 == 0 else None,
+    }
+
+
+def _sandbox_message_id(inbox_id: int, index: int) -> int:
+    # Newest messages first, with ids unique across inboxes
+    return inbox_id * 1_000_000 + 999_999 - index
+
+
+def _sandbox_message(inbox_id: int, index: int) -> dict[str, Any]:
+    message_id = _sandbox_message_id(inbox_id, index)
+    created_at = _timestamp(_BASE_TIME - timedelta(minutes=index))
+    path = f"/api/accounts/1/inboxes/{inbox_id}/messages/{message_id}"
+    return {
+        "id": message_id,
+        "inbox_id": inbox_id,
+        "subject": f"Test message {index}",
+        "sent_at": created_at,
+        "from_email": "sender@example.com",
+        "from_name": "Sender",
+        "to_email": f"user{index}@example.com",
+        "to_name": f"User {index}",
+        "email_size": 1024,
+        "is_read": index % 2 == 1,
+        "created_at": created_at,
+        "updated_at": created_at,
+        "html_body_size": 512,
+        "text_body_size": 128,
+        "human_size": "1 KB",
+        "html_path": f"{path}/body.html",
+        "txt_path": f"{path}/body.txt",
+        "raw_path": f"{path}/body.raw",
+        "download_path": f"{path}/body.eml",
+        "html_source_path": f"{path}/body.htmlsource",
+        "blacklists_report_info": False,
+        "smtp_information": {
+            "ok": True,
+            "data": {"mail_from_addr": "sender@example.com", "client_ip": "127.0.0.1"},
+        },
+    }
+
+
+def _sandbox_message_body(message: dict[str, Any], artifact: str) -> str:
+    text = f"Hello {message['to_name']}!"
+    if artifact in ("body.html", "body.htmlsource"):
+        return f"<html><body><p>{text}</p></body></html>"
+    if artifact == "body.txt":
+        return text
+    return (
+        f"From: {message['from_name']} <{message['from_email']}>\r\n"
+        f"To: {message['to_name']} <{message['to_email']}>\r\n"
+        f"Subject: {message['subject']}\r\n"
+        "Content-Type: text/plain; charset=utf-8\r\n"
+        f"\r\n{text}\r\n"
+    )
+
+
+def _timestamp(value: datetime) -> str:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a local fake Mailtrap API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8025)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--latency-jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=int, default=1)
+    parser.add_argument("--token")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+
+    server = FakeMailtrapServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after=args.retry_after,
+        token=args.token,
+        seed=args.seed,
+    )
+    print(f"Fake Mailtrap API listening on {server.host}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,362 @@
+"""Record/replay transports for :class:`~mailtrap.http.HttpClient`.
+
+A transport is a ``requests`` transport adapter mounted on the client session.
+:class:`RecordingTransport` performs real requests and captures every
+request/response pair in a JSON cassette file; :class:`ReplayTransport` answers
+requests from such a cassette without any network I/O. Replayed responses are
+regular :class:`requests.Response` objects, so response handling, streaming and
+instrumentation behave exactly as with live traffic::
+
+    with RecordingTransport("email_logs.json") as transport:
+        client = mt.MailtrapClient(token=token, account_id="1", transport=transport)
+        client.email_logs_api.email_logs.get_list()
+
+    client = mt.MailtrapClient(
+        token="unused", account_id="1", transport=ReplayTransport("email_logs.json")
+    )
+
+Interactions are matched by method and path (including the query string), and
+optionally by request body; the host and headers are ignored, so cassettes
+recorded against production replay against any host and without credentials.
+
+Request headers are never stored, and by default :func:`scrub_secrets` masks
+credential-like response headers and JSON fields (tokens, passwords, secrets)
+before the cassette is written. Other personal data, such as recipient
+addresses, is kept unless a custom `redact` hook removes it::
+
+    def redact(interaction: Interaction) -> Interaction:
+        interaction = scrub_secrets(interaction)
+        ...  # e.g. replace addresses in interaction["request"]["body"]
+        return interaction
+
+    RecordingTransport("email_logs.json", redact=redact)
+"""
+
+import base64
+import json
+import os
+import re
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterator
+from datetime import timedelta
+from types import TracebackType
+from typing import Any
+from typing import Optional
+from typing import Union
+from typing import cast
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from mailtrap.exceptions import MailtrapError
+
+CASSETTE_VERSION = 1
+
+# Response headers that are connection-specific or may carry secrets
+_SKIPPED_RESPONSE_HEADERS = frozenset(
+    ("connection", "content-encoding", "keep-alive", "set-cookie", "transfer-encoding")
+)
+
+# Header and JSON field names whose values scrub_secrets() masks
+_SECRET_NAMES = re.compile(
+    r"token|secret|password|api[_-]?key|authorization|cookie", re.I
+)
+REDACTED = "[REDACTED]"
+
+Interaction = dict[str, Any]
+_Key = tuple[str, str, Optional[str]]
+
+
+class CassetteError(MailtrapError):
+    pass
+
+
+def scrub_secrets(interaction: Interaction) -> Interaction:
+    """
+    Default `redact` hook of :class:`RecordingTransport`: masks response
+    headers and JSON string fields named like credentials (tokens, API keys,
+    passwords, secrets, cookies) in request and response bodies.
+    """
+    request = interaction["request"]
+    response = interaction["response"]
+    scrubbed_response = {
+        **response,
+        "headers": {
+            name: REDACTED if _SECRET_NAMES.search(name) else value
+            for name, value in response.get("headers", {}).items()
+        },
+    }
+    if "body" in response:
+        scrubbed_response["body"] = _scrub_body(response["body"])
+    return {
+        **interaction,
+        "request": {**request, "body": _scrub_body(request.get("body"))},
+        "response": scrubbed_response,
+    }
+
+
+def _scrub_body(body: Optional[str]) -> Optional[str]:
+    if not body:
+        return body
+    try:
+        data = json.loads(body)
+    except ValueError:
+        return body
+    scrubbed = _scrub(data)
+    # Unchanged bodies keep their exact text, so match_body replays still match
+    return body if scrubbed == data else json.dumps(scrubbed)
+
+
+def _scrub(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {
+            key: (
+                REDACTED
+                if isinstance(item, str) and _SECRET_NAMES.search(str(key))
+                else _scrub(item)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_scrub(item) for item in value]
+    return value
+
+
+class RecordingTransport(BaseAdapter):
+    """
+    Sends requests through a real adapter and records them to `path`.
+
+    Response bodies are recorded as the client reads them, so streamed
+    downloads stay streamed; a body closed before the end is recorded as far
+    as it was read. The cassette is written by :meth:`save`, which is also
+    called on :meth:`close` (and when used as a context manager).
+
+    Args:
+        path (Union[str, os.PathLike[str]]): Cassette file to write.
+        adapter (Optional[BaseAdapter]): Adapter performing the requests;
+            a new `HTTPAdapter` by default.
+        redact (Optional[Callable[[Interaction], Interaction]]): Applied to
+            each interaction when the cassette is written. Defaults to
+            :func:`scrub_secrets`; None writes interactions as recorded.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        adapter: Optional[BaseAdapter] = None,
+        redact: Optional[Callable[[Interaction], Interaction]] = scrub_secrets,
+    ) -> None:
+        super().__init__()
+        self.path = path
+        self.interactions: list[Interaction] = []
+        self.redact = redact
+        self._adapter = adapter if adapter is not None else HTTPAdapter()
+        self._lock = threading.Lock()
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        response = self._adapter.send(request, **kwargs)
+        recorded_response = {
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _SKIPPED_RESPONSE_HEADERS
+            },
+            **_encode_body(b""),
+        }
+        interaction = {
+            "request": {
+                "method": request.method,
+                "path": _path(request),
+                "body": _text(request.body),
+            },
+            "response": recorded_response,
+        }
+        with self._lock:
+            self.interactions.append(interaction)
+
+        def record_body(content: bytes) -> None:
+            with self._lock:
+                recorded_response.pop("body", None)
+                recorded_response.update(_encode_body(content))
+
+        if response.raw is None:  # e.g. a ReplayTransport, which has no stream
+            record_body(response.content)
+        else:
+            response.raw = _RecordedBody(response.raw, record_body)
+        return response
+
+    def save(self) -> None:
+        with self._lock:
+            interactions = [
+                self.redact(item) if self.redact is not None else item
+                for item in self.interactions
+            ]
+            cassette = {"version": CASSETTE_VERSION, "interactions": interactions}
+            text = json.dumps(cassette, indent=2)
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.write("\n")
+
+    def close(self) -> None:
+        self.save()
+        self._adapter.close()
+
+    def __enter__(self) -> "RecordingTransport":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+
+class _RecordedBody:
+    """
+    Wraps `response.raw`, keeping a copy of the body as it is read and
+    passing it to `on_complete` once, at the end of the body or on close.
+    """
+
+    def __init__(self, raw: Any, on_complete: Callable[[bytes], None]) -> None:
+        self._raw = raw
+        self._chunks: list[bytes] = []
+        self._on_complete: Optional[Callable[[bytes], None]] = on_complete
+
+    def stream(self, *args: Any, **kwargs: Any) -> Iterator[bytes]:
+        for chunk in self._raw.stream(*args, **kwargs):
+            self._chunks.append(chunk)
+            yield chunk
+        self._complete()
+
+    def read(self, *args: Any, **kwargs: Any) -> bytes:
+        chunk = self._raw.read(*args, **kwargs)
+        if chunk:
+            self._chunks.append(chunk)
+        amount = args[0] if args else kwargs.get("amt")
+        if amount is None or not chunk:
+            self._complete()
+        return cast(bytes, chunk)
+
+    def close(self) -> None:
+        self._complete()
+        self._raw.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._raw, name)
+
+    def _complete(self) -> None:
+        on_complete, self._on_complete = self._on_complete, None
+        if on_complete is not None:
+            on_complete(b"".join(self._chunks))
+
+
+class ReplayTransport(BaseAdapter):
+    """
+    Serves responses recorded by :class:`RecordingTransport`.
+
+    Responses recorded for the same request are served in recorded order;
+    once exhausted, they are replayed again from the first one, so a
+    cassette can drive any number of benchmark rounds. Unrecorded requests
+    raise :class:`CassetteError`.
+
+    Args:
+        cassette (Union[str, os.PathLike[str], list[Interaction]]): Cassette
+            file, or the interactions themselves.
+        match_body (bool): Also match interactions on the request body.
+    """
+
+    def __init__(
+        self,
+        cassette: Union[str, "os.PathLike[str]", list[Interaction]],
+        match_body: bool = False,
+    ) -> None:
+        super().__init__()
+        if isinstance(cassette, (str, os.PathLike)):
+            cassette = _load(cassette)
+        self.match_body = match_body
+        self._responses: dict[_Key, list[dict[str, Any]]] = defaultdict(list)
+        for interaction in cassette:
+            request = interaction["request"]
+            key = self._key(request["method"], request["path"], request.get("body"))
+            self._responses[key].append(interaction["response"])
+        self._positions: dict[_Key, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        key = self._key(request.method or "GET", _path(request), _text(request.body))
+        recorded = self._responses.get(key)
+        if not recorded:
+            raise CassetteError(f"No recorded response for {key[0]} {key[1]}")
+        with self._lock:
+            position = self._positions[key]
+            self._positions[key] = (position + 1) % len(recorded)
+        return _build_response(request, recorded[position])
+
+    def close(self) -> None:
+        pass
+
+    def _key(self, method: str, path: str, body: Optional[str]) -> _Key:
+        return (method.upper(), path, body if self.match_body else None)
+
+
+def _build_response(request: PreparedRequest, recorded: dict[str, Any]) -> Response:
+    response = Response()
+    response.status_code = recorded["status"]
+    response.reason = recorded.get("reason") or ""
+    response.headers = CaseInsensitiveDict(recorded.get("headers", {}))
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url or ""
+    response.request = request
+    response.elapsed = timedelta(0)
+    response._content = _decode_body(recorded)
+    response._content_consumed = True  # type: ignore[attr-defined]
+    return response
+
+
+def _load(path: Union[str, "os.PathLike[str]"]) -> list[Interaction]:
+    with open(path, encoding="utf-8") as file:
+        cassette = json.load(file)
+    if cassette.get("version") != CASSETTE_VERSION:
+        raise CassetteError(
+            f"Unsupported cassette version {cassette.get('version')!r} in {path}"
+        )
+    return list(cassette["interactions"])
+
+
+def _path(request: PreparedRequest) -> str:
+    url = urlsplit(request.url or "")
+    return f"{url.path}?{url.query}" if url.query else url.path
+
+
+def _text(body: Union[bytes, str, None]) -> Optional[str]:
+    if isinstance(body, bytes):
+        return body.decode("utf-8", errors="replace")
+    return body
+
+
+def _encode_body(content: bytes) -> dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(recorded: dict[str, Any]) -> bytes:
+    if "body_base64" in recorded:
+        return base64.b64decode(recorded["body_base64"])
+    return str(recorded.get("body", "")).encode("utf-8")
@@ -0,0 +1,141 @@
+"""
+Benchmark fixtures.
+
+Benchmarks use the pytest-benchmark `benchmark(fn, *args)` fixture. When the
+plugin is not installed a minimal compatible fixture is provided here. It
+times the benchmarked call and, right after it, a fixed pure-Python
+reference workload, and records their ratio: the best time of the call in
+units of the reference. Ratios, unlike absolute timings, carry over between
+machines and survive a machine that is busy while the suite runs.
+
+* MAILTRAP_BENCHMARK_SAVE=1 stores the measured ratios in `baselines.json`.
+* MAILTRAP_BENCHMARK_CHECK=1 fails benchmarks whose ratio exceeds the stored
+  one by more than MAILTRAP_BENCHMARK_TOLERANCE (default 0.5 = 50%). The
+  check runs inside `benchmark(...)`, so a regression fails the test itself.
+
+With pytest-benchmark installed, use its own `--benchmark-save` and
+`--benchmark-compare-fail` options instead.
+"""
+
+import json
+import os
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mailtrap.testing import FakeMailtrapServer
+
+BASELINES_PATH = Path(__file__).with_name("baselines.json")
+MIN_ROUNDS = 5
+MIN_TIME = 0.05  # in seconds
+MAX_ROUNDS = 10_000
+ATTEMPTS = 3
+
+_REFERENCE_DATA = {
+    "items": [
+        {"id": index, "name": f"item-{index}", "tags": ["a", "b"]} for index in range(100)
+    ]
+}
+
+
+def _reference_workload() -> None:
+    """Interpreter-bound work (dicts, strings, JSON) the benchmarks are scaled by."""
+    json.loads(json.dumps(_REFERENCE_DATA))
+
+
+def _ratio(function: Callable[..., Any], *args: Any, **kwargs: Any) -> float:
+    """Best time of `function` over the best time of the reference, interleaved."""
+    timings: list[float] = []
+    reference: list[float] = []
+    started = time.perf_counter()
+    while len(timings) < MAX_ROUNDS and (
+        len(timings) < MIN_ROUNDS or time.perf_counter() - started < MIN_TIME
+    ):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        middle = time.perf_counter()
+        _reference_workload()
+        timings.append(middle - start)
+        reference.append(time.perf_counter() - middle)
+    return min(timings) / min(reference)
+
+
+class Baselines:
+    def __init__(self) -> None:
+        self.stored: dict[str, float] = (
+            json.loads(BASELINES_PATH.read_text()) if BASELINES_PATH.exists() else {}
+        )
+        self.measured: dict[str, float] = {}
+
+    def measure(self, name: str, measure: Callable[[], float]) -> None:
+        """
+        Record the ratio returned by `measure` and, when checking, compare it to
+        the baseline. Noise only ever slows a measurement down, so the best of
+        up to ATTEMPTS measurements is kept (saving always takes all of them).
+        """
+        baseline = self.stored.get(name)
+        check = bool(os.environ.get("MAILTRAP_BENCHMARK_CHECK")) and baseline is not None
+        tolerance = float(os.environ.get("MAILTRAP_BENCHMARK_TOLERANCE", "0.5"))
+        limit = (baseline or 0.0) * (1 + tolerance)
+        ratio = measure()
+        for _ in range(ATTEMPTS - 1):
+            if check and ratio <= limit:
+                break
+            if not check and not os.environ.get("MAILTRAP_BENCHMARK_SAVE"):
+                break
+            ratio = min(ratio, measure())
+        self.measured[name] = ratio
+        if check:
+            assert ratio <= limit, (
+                f"{name}: {ratio:.3f}x the reference workload is more than "
+                f"{tolerance:.0%} slower than the baseline {baseline:.3f}x"
+            )
+
+    def save(self) -> None:
+        if os.environ.get("MAILTRAP_BENCHMARK_SAVE") and self.measured:
+            baselines = {**self.stored, **self.measured}
+            BASELINES_PATH.write_text(
+                json.dumps(baselines, indent=2, sort_keys=True) + "\n"
+            )
+
+
+class FallbackBenchmark:
+    """Subset of the pytest-benchmark fixture: `benchmark(fn, *args, **kwargs)`."""
+
+    def __init__(self, name: str, baselines: Baselines) -> None:
+        self.name = name
+        self.extra_info: dict[str, Any] = {}
+        self._baselines = baselines
+
+    def __call__(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        result = function(*args, **kwargs)  # warm up
+        self._baselines.measure(self.name, lambda: _ratio(function, *args, **kwargs))
+        return result
+
+
+@pytest.fixture(scope="session")
+def benchmark_baselines() -> Iterator[Baselines]:
+    baselines = Baselines()
+    yield baselines
+    baselines.save()
+
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+
+    @pytest.fixture
+    def benchmark(
+        request: pytest.FixtureRequest, benchmark_baselines: Baselines
+    ) -> FallbackBenchmark:
+        return FallbackBenchmark(request.node.name, benchmark_baselines)
+
+
+@pytest.fixture(scope="session")
+def local_api() -> Iterator[FakeMailtrapServer]:
+    with FakeMailtrapServer(email_logs_count=0, seed=0) as server:
+        yield server
@@ -0,0 +1,107 @@
+"""
+Per-module import cost of the client: time and memory, each measured in a
+fresh interpreter after pydantic and requests are already imported, so the
+numbers cover the module's own code and schemas only.
+
+    python -m tests.benchmarks.import_cost           # import only
+    python -m tests.benchmarks.import_cost --build   # and build every schema
+
+`--build` also validates-or-builds every pydantic model of the module, which
+shows what deferred schema building saves in processes that never use them.
+"""
+
+import argparse
+import json
+import pkgutil
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+import mailtrap.api
+import mailtrap.models
+
+_MEASURE = """
+import json, sys, time, tracemalloc
+import pydantic, pydantic.dataclasses, requests
+import mailtrap.models.common  # shared base, measured on its own
+
+if sys.argv[3] == "trace":
+    tracemalloc.start()
+started = time.perf_counter()
+module = __import__(sys.argv[1], fromlist=["_"])
+imported = time.perf_counter()
+if sys.argv[2] == "build":
+    for value in list(vars(module).values()):
+        if not isinstance(value, type) or value.__module__ != module.__name__:
+            continue
+        if issubclass(value, pydantic.BaseModel):
+            value.model_rebuild()
+        elif pydantic.dataclasses.is_pydantic_dataclass(value):
+            pydantic.dataclasses.rebuild_dataclass(value)
+built = time.perf_counter()
+memory = tracemalloc.get_traced_memory()[0]
+print(json.dumps([imported - started, built - imported, memory]))
+"""
+
+
+@dataclass(frozen=True)
+class ImportCost:
+    module: str
+    import_seconds: float
+    build_seconds: float
+    memory_bytes: int
+
+
+def measure(module: str, build: bool = False) -> ImportCost:
+    # Timings and memory come from separate runs, as tracing slows imports down
+    import_seconds, build_seconds, _ = _run(module, build, trace=False)
+    memory_bytes = _run(module, build, trace=True)[2]
+    return ImportCost(module, import_seconds, build_seconds, int(memory_bytes))
+
+
+def _run(module: str, build: bool, trace: bool) -> list[float]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            _MEASURE,
+            module,
+            "build" if build else "import",
+            "trace" if trace else "time",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return list(json.loads(output))
+
+
+def client_modules() -> list[str]:
+    """`mailtrap.models.*` and `mailtrap.api.*` modules, plus the client itself."""
+    modules = ["mailtrap.client"]
+    for package in (mailtrap.models, mailtrap.api):
+        modules.extend(
+            info.name
+            for info in pkgutil.walk_packages(package.__path__, f"{package.__name__}.")
+        )
+    return modules
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--build", action="store_true", help="also build all schemas")
+    parser.add_argument("modules", nargs="*", help="modules to measure")
+    args = parser.parse_args(argv)
+
+    print(f"{'module':<48} {'import ms':>10} {'build ms':>10} {'memory KiB':>11}")
+    for module in args.modules or client_modules():
+        cost = measure(module, build=args.build)
+        print(
+            f"{cost.module:<48} {cost.import_seconds * 1000:>10.1f} "
+            f"{cost.build_seconds * 1000:>10.1f} {cost.memory_bytes / 1024:>11.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
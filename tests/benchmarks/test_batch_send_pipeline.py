@@ -0,0 +1,83 @@
+"""
+Sending many batches one `batch_send()` at a time versus `batch_send_many()`,
+with and without encoding the next bodies while a request is in flight, over a
+transport that answers after a fixed network latency.
+
+Encoding a batch of 500 recipients takes 1-2 ms, so all three modes are
+dominated by the latency and stay within a few percent of each other.
+"""
+
+import json
+import time
+from typing import Any
+
+import pytest
+from requests import PreparedRequest
+from requests import Response
+from requests.adapters import BaseAdapter
+
+import mailtrap as mt
+from mailtrap.api.sending import SendingApi
+from mailtrap.http import HttpClient
+
+BATCHES = 8
+BATCH_SIZE = 500
+LATENCY = 0.005  # in seconds
+
+
+class _LatencyTransport(BaseAdapter):
+    """Waits `LATENCY` (releasing the GIL, as a real request does) and succeeds."""
+
+    def send(  # type: ignore[override]
+        self, request: PreparedRequest, **kwargs: Any
+    ) -> Response:
+        time.sleep(LATENCY)
+        response = Response()
+        response.status_code = 200
+        response._content = json.dumps({"success": True, "responses": []}).encode()
+        response.request = request
+        return response
+
+    def close(self) -> None:
+        pass
+
+
+def _batch(index: int) -> mt.BatchSendEmailParams:
+    return mt.BatchSendEmailParams(
+        base=mt.BatchMail(
+            sender=mt.Address(email="sender@example.com", name="Sender"),
+            subject="Your monthly report",
+            text="Hello {{name}},\n\nyour report is ready.\n",
+            category="Reports",
+        ),
+        requests=[
+            mt.BatchEmailRequest(
+                to=[mt.Address(email=f"user{index}-{item}@example.com", name="User")],
+                custom_variables={"user_id": item, "plan": "pro", "batch": index},
+            )
+            for item in range(BATCH_SIZE)
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def batches() -> list[mt.BatchSendEmailParams]:
+    return [_batch(index) for index in range(BATCHES)]
+
+
+def _send_all(api: SendingApi, batches: list[Any], mode: str) -> int:
+    if mode == "batch_send":
+        return len([api.batch_send(batch) for batch in batches])
+    encode_ahead = 2 if mode == "pipelined" else 0
+    return len(list(api.batch_send_many(batches, encode_ahead=encode_ahead)))
+
+
+@pytest.mark.parametrize("mode", ["batch_send", "sequential", "pipelined"])
+def test_send_batches(
+    benchmark: Any, batches: list[mt.BatchSendEmailParams], mode: str
+) -> None:
+    api = SendingApi(HttpClient("mailtrap.io", transport=_LatencyTransport()))
+
+    sent = benchmark(_send_all, api, batches, mode)
+
+    assert sent == BATCHES
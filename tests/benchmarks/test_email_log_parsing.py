@@ -0,0 +1,111 @@
+"""Throughput of EmailLogMessage parsing: validated vs. fast paths."""
+
+from typing import Any
+
+import pytest
+
+from mailtrap.models.email_logs import EmailLogMessage
+
+ROWS = 2000
+
+
+def _summary(index: int) -> dict[str, Any]:
+    return {
+        "message_id": f"a1b2c3d4-e5f6-7890-abcd-{index:012d}",
+        "status": "delivered",
+        "subject": "Welcome",
+        "from": "sender@example.com",
+        "to": f"user{index}@example.com",
+        "sent_at": "2025-01-15T10:30:00Z",
+        "client_ip": "203.0.113.42",
+        "category": "Welcome Email",
+        "custom_variables": {"user_id": index},
+        "sending_stream": "transactional",
+        "sending_domain_id": 3938,
+        "template_id": 100,
+        "template_variables": {},
+        "opens_count": 2,
+        "clicks_count": 1,
+    }
+
+
+def _full(index: int) -> dict[str, Any]:
+    return {
+        **_summary(index),
+        "raw_message_url": "https://storage.example.com/signed/eml/...",
+        "events": [
+            {
+                "event_type": "delivery",
+                "created_at": "2025-01-15T10:30:05Z",
+                "details": {
+                    "sending_ip": "192.0.2.1",
+                    "recipient_mx": "mx.example.com",
+                    "email_service_provider": "Google",
+                },
+            },
+            {
+                "event_type": "open",
+                "created_at": "2025-01-15T10:35:00Z",
+                "details": {"web_ip_address": "198.51.100.50"},
+            },
+            {
+                "event_type": "click",
+                "created_at": "2025-01-15T10:36:00Z",
+                "details": {
+                    "click_url": "https://example.com/track/abc",
+                    "web_ip_address": "198.51.100.50",
+                },
+            },
+        ],
+    }
+
+
+@pytest.fixture(scope="module")
+def summaries() -> list[dict[str, Any]]:
+    return [_summary(index) for index in range(ROWS)]
+
+
+@pytest.fixture(scope="module")
+def full_messages() -> list[dict[str, Any]]:
+    return [_full(index) for index in range(ROWS)]
+
+
+def test_list_from_api(benchmark: Any, summaries: list[dict[str, Any]]) -> None:
+    messages = benchmark(lambda: [EmailLogMessage.from_api(item) for item in summaries])
+    assert len(messages) == ROWS
+
+
+def test_list_from_api_list(benchmark: Any, summaries: list[dict[str, Any]]) -> None:
+    messages = benchmark(EmailLogMessage.from_api_list, summaries)
+    assert messages[:10] == [EmailLogMessage.from_api(item) for item in summaries[:10]]
+
+
+def test_full_from_api(benchmark: Any, full_messages: list[dict[str, Any]]) -> None:
+    messages = benchmark(
+        lambda: [EmailLogMessage.from_api(item) for item in full_messages]
+    )
+    assert len(messages[0].events) == 3
+
+
+def test_full_from_api_trusted(
+    benchmark: Any, full_messages: list[dict[str, Any]]
+) -> None:
+    messages = benchmark(
+        lambda: [EmailLogMessage.from_api(item, trusted=True) for item in full_messages]
+    )
+    assert messages[:10] == [
+        EmailLogMessage.from_api(item) for item in full_messages[:10]
+    ]
+
+
+def test_full_from_api_lazy_events(
+    benchmark: Any, full_messages: list[dict[str, Any]]
+) -> None:
+    messages = benchmark(
+        lambda: [
+            EmailLogMessage.from_api(item, lazy_events=True) for item in full_messages
+        ]
+    )
+    assert messages[:10] == [
+        EmailLogMessage.from_api(item) for item in full_messages[:10]
+    ]
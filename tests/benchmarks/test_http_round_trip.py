@@ -0,0 +1,32 @@
+"""HttpClient round-trips against a local stand-in server over a kept-alive connection."""
+
+from typing import Any
+
+from mailtrap.http import HttpClient
+from mailtrap.testing import FakeMailtrapServer
+
+
+def test_get_round_trip(benchmark: Any, local_api: FakeMailtrapServer) -> None:
+    client = HttpClient(local_api.host)
+    connections = local_api.connections
+
+    response = benchmark(client.get, "/api/accounts/1/email_logs")
+
+    assert response == {"messages": [], "total_count": 0, "next_page_cursor": None}
+    assert local_api.connections == connections + 1
+
+
+def test_post_round_trip(benchmark: Any, local_api: FakeMailtrapServer) -> None:
+    client = HttpClient(local_api.host, headers={"Content-Type": "application/json"})
+    payload = {
+        "from": {"email": "sender@example.com"},
+        "to": [{"email": "user@example.com"}],
+        "subject": "Hello",
+        "text": "Hi",
+    }
+    connections = local_api.connections
+
+    response = benchmark(client.post, "/api/send", json=payload)
+
+    assert response["success"] is True
+    assert local_api.connections == connections + 1
@@ -0,0 +1,31 @@
+"""Cold-start cost of importing the client, measured in fresh interpreters."""
+
+import subprocess
+import sys
+from typing import Any
+
+import pytest
+
+from tests.benchmarks.import_cost import measure
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        pytest.param("pass", id="interpreter"),
+        pytest.param("from mailtrap import MailtrapClient, Mail", id="sending"),
+        pytest.param(
+            "import mailtrap; mailtrap.MailtrapClient(token='t').stats_api", id="stats"
+        ),
+    ],
+)
+def test_import_time(benchmark: Any, statement: str) -> None:
+    benchmark(subprocess.run, [sys.executable, "-c", statement], check=True)
+
+
+def test_model_schemas_are_built_on_first_use() -> None:
+    deferred = measure("mailtrap.models.messages")
+    built = measure("mailtrap.models.messages", build=True)
+
+    assert built.build_seconds > 0
+    assert built.memory_bytes > deferred.memory_bytes
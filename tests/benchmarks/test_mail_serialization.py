@@ -0,0 +1,76 @@
+"""Cost of building send/batch-send request bodies (`RequestParams.api_data`)."""
+
+import base64
+from typing import Any
+
+import pytest
+
+import mailtrap as mt
+
+BATCH_SIZE = 100
+
+
+def _attachments() -> list[mt.Attachment]:
+    return [
+        mt.Attachment(
+            content=base64.b64encode(bytes(range(256)) * 256),  # 64 KiB file
+            filename=f"report-{index}.pdf",
+            disposition=mt.Disposition.ATTACHMENT,
+            mimetype="application/pdf",
+        )
+        for index in range(2)
+    ]
+
+
+def _mail(attachments: bool) -> mt.Mail:
+    return mt.Mail(
+        sender=mt.Address(email="sender@example.com", name="Sender"),
+        to=[mt.Address(email=f"user{index}@example.com") for index in range(3)],
+        cc=[mt.Address(email="cc@example.com")],
+        subject="Your monthly report",
+        text="Hello,\n\nplease find the report attached.\n",
+        html="<p>Hello,</p><p>please find the report attached.</p>",
+        category="Reports",
+        headers={"X-Message-Source": "benchmarks"},
+        custom_variables={"user_id": 42, "plan": "pro"},
+        attachments=_attachments() if attachments else None,
+    )
+
+
+def _batch(attachments: bool) -> mt.BatchSendEmailParams:
+    return mt.BatchSendEmailParams(
+        base=mt.BatchMail(
+            sender=mt.Address(email="sender@example.com", name="Sender"),
+            subject="Your monthly report",
+            text="Hello,\n\nplease find the report attached.\n",
+            category="Reports",
+            attachments=_attachments() if attachments else None,
+        ),
+        requests=[
+            mt.BatchEmailRequest(
+                to=[mt.Address(email=f"user{index}@example.com")],
+                custom_variables={"user_id": index},
+            )
+            for index in range(BATCH_SIZE)
+        ],
+    )
+
+
+@pytest.mark.parametrize("attachments", [False, True], ids=["plain", "attachments"])
+def test_mail_api_data(benchmark: Any, attachments: bool) -> None:
+    mail = _mail(attachments)
+
+    data = benchmark(lambda: mail.api_data)
+
+    assert data["from"]["email"] == "sender@example.com"
+    assert ("attachments" in data) is attachments
+
+
+@pytest.mark.parametrize("attachments", [False, True], ids=["plain", "attachments"])
+def test_batch_send_api_data(benchmark: Any, attachments: bool) -> None:
+    params = _batch(attachments)
+
+    data = benchmark(lambda: params.api_data)
+
+    assert len(data["requests"]) == BATCH_SIZE
+    assert ("attachments" in data["base"]) is attachments
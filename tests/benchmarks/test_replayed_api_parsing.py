@@ -0,0 +1,88 @@
+"""API response parsing over replayed responses, isolated from network jitter."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.api.resources.messages import MessagesApi
+from mailtrap.api.resources.stats import StatsApi
+from mailtrap.http import HttpClient
+from mailtrap.models.stats import StatsFilterParams
+from mailtrap.testing import FakeMailtrapServer
+from mailtrap.transport import RecordingTransport
+from mailtrap.transport import ReplayTransport
+
+ACCOUNT_ID = 1
+INBOX_ID = 42
+STATS_PARAMS = StatsFilterParams(start_date="2026-01-01", end_date="2026-01-31")
+
+
+def _stats_by_date_interaction() -> dict[str, Any]:
+    stats = {
+        "delivery_count": 5,
+        "delivery_rate": 1.0,
+        "bounce_count": 0,
+        "bounce_rate": 0.0,
+        "open_count": 4,
+        "open_rate": 0.8,
+        "click_count": 2,
+        "click_rate": 0.5,
+        "spam_count": 0,
+        "spam_rate": 0.0,
+    }
+    body = [{"date": f"2026-01-{day:02d}", "stats": stats} for day in range(1, 32)]
+    return {
+        "request": {
+            "method": "GET",
+            "path": f"/api/accounts/{ACCOUNT_ID}/stats/date?"
+            "start_date=2026-01-01&end_date=2026-01-31",
+            "body": None,
+        },
+        "response": {
+            "status": 200,
+            "headers": {"Content-Type": "application/json"},
+            "body": json.dumps(body),
+        },
+    }
+
+
+@pytest.fixture(scope="module")
+def replay_client(tmp_path_factory: pytest.TempPathFactory) -> HttpClient:
+    path: Path = tmp_path_factory.mktemp("cassettes") / "api.json"
+    with FakeMailtrapServer(email_logs_count=500, email_logs_page_size=500) as server:
+        with RecordingTransport(path) as transport:
+            client = HttpClient(server.host, transport=transport)
+            EmailLogsApi(client, str(ACCOUNT_ID)).get_list()
+            MessagesApi(client, str(ACCOUNT_ID)).get_list(INBOX_ID)
+    cassette = json.loads(path.read_text())["interactions"]
+    return HttpClient(
+        "mailtrap.io",
+        transport=ReplayTransport([*cassette, _stats_by_date_interaction()]),
+    )
+
+
+def test_email_logs_get_list(benchmark: Any, replay_client: HttpClient) -> None:
+    api = EmailLogsApi(replay_client, str(ACCOUNT_ID))
+
+    page = benchmark(api.get_list)
+
+    assert len(page.messages) == 500
+
+
+def test_messages_get_list(benchmark: Any, replay_client: HttpClient) -> None:
+    api = MessagesApi(replay_client, str(ACCOUNT_ID))
+
+    messages = benchmark(api.get_list, INBOX_ID)
+
+    assert len(messages) == 30
+
+
+def test_stats_by_date(benchmark: Any, replay_client: HttpClient) -> None:
+    api = StatsApi(replay_client)
+
+    groups = benchmark(api.by_date, ACCOUNT_ID, STATS_PARAMS)
+
+    assert len(groups) == 31
@@ -0,0 +1,19 @@
+"""Cost of verifying webhook signatures for small and large payloads."""
+
+import hashlib
+import hmac
+from typing import Any
+
+import pytest
+
+from mailtrap import verify_signature
+
+SIGNING_SECRET = "a" * 64
+
+
+@pytest.mark.parametrize("size", [1024, 1024 * 1024], ids=["1KiB", "1MiB"])
+def test_verify_signature(benchmark: Any, size: int) -> None:
+    payload = b'{"events": [' + b"0" * size + b"]}"
+    signature = hmac.new(SIGNING_SECRET.encode(), payload, hashlib.sha256).hexdigest()
+
+    assert benchmark(verify_signature, payload, signature, SIGNING_SECRET) is True
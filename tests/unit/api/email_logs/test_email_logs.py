@@ -1,16 +1,24 @@
 """Unit tests for Email Logs API."""
 
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import pytest
 import responses
+from pydantic import ValidationError
 
+import mailtrap as mt
 from mailtrap.api.resources.email_logs import EmailLogsApi
 from mailtrap.config import GENERAL_HOST
 from mailtrap.exceptions import APIError
 from mailtrap.http import HttpClient
 from mailtrap.models.email_logs import EmailLogMessage
 from mailtrap.models.email_logs import EmailLogsListFilters
+from mailtrap.models.email_logs import EventDetailsClick
+from mailtrap.models.email_logs import LazyMessageEvent
 from tests import conftest
 
 ACCOUNT_ID = "321"
@@ -244,3 +252,229 @@ class TestEmailLogsApi:
             email_logs_api.get_by_id(MESSAGE_ID)
 
         assert expected_error_message in str(exc_info.value)
+
+    @responses.activate
+    def test_iter_messages_follows_next_page_cursor(
+        self,
+        email_logs_api: EmailLogsApi,
+        sample_message_dict: dict[str, Any],
+    ) -> None:
+        second_message = {**sample_message_dict, "message_id": "second"}
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={
+                "messages": [sample_message_dict],
+                "total_count": 2,
+                "next_page_cursor": "b2c3",
+            },
+            match=[responses.matchers.query_param_matcher({})],
+        )
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={
+                "messages": [second_message],
+                "total_count": 2,
+                "next_page_cursor": None,
+            },
+            match=[responses.matchers.query_param_matcher({"search_after": "b2c3"})],
+        )
+
+        messages = list(email_logs_api.iter_messages())
+
+        assert [message.message_id for message in messages] == [MESSAGE_ID, "second"]
+        assert len(responses.calls) == 2
+
+    @responses.activate
+    def test_iter_pages_reuses_filters_query_string(
+        self,
+        email_logs_api: EmailLogsApi,
+        sample_message_dict: dict[str, Any],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        filters = EmailLogsListFilters(
+            to={"operator": "ci_equal", "value": ["a@example.com", "b@example.com"]}
+        )
+        filter_params = {
+            "filters[to][operator]": "ci_equal",
+            "filters[to][value][]": ["a@example.com", "b@example.com"],
+        }
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={
+                "messages": [sample_message_dict],
+                "total_count": 2,
+                "next_page_cursor": "b2c3",
+            },
+            match=[responses.matchers.query_param_matcher(filter_params)],
+        )
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={"messages": [], "total_count": 2, "next_page_cursor": None},
+            match=[
+                responses.matchers.query_param_matcher(
+                    {**filter_params, "search_after": "b2c3"}
+                )
+            ],
+        )
+        to_params_calls = []
+        original_to_params = EmailLogsListFilters.to_params
+
+        def counting_to_params(self: EmailLogsListFilters) -> dict[str, Any]:
+            to_params_calls.append(self)
+            return original_to_params(self)
+
+        monkeypatch.setattr(EmailLogsListFilters, "to_params", counting_to_params)
+
+        pages = list(email_logs_api.iter_pages(filters=filters))
+
+        assert len(pages) == 2
+        assert len(to_params_calls) == 1
+
+    @responses.activate
+    def test_iter_pages_stops_on_empty_page(
+        self,
+        email_logs_api: EmailLogsApi,
+    ) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={"messages": [], "total_count": 0, "next_page_cursor": "b2c3"},
+        )
+
+        pages = list(email_logs_api.iter_pages())
+
+        assert len(pages) == 1
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_hydrate_yields_full_messages_in_input_order(
+        self,
+        email_logs_api: EmailLogsApi,
+        sample_message_dict: dict[str, Any],
+        sample_message_detail: dict[str, Any],
+    ) -> None:
+        ids = [f"message-{index}" for index in range(10)]
+        for message_id in ids:
+            responses.get(
+                f"{BASE_EMAIL_LOGS_URL}/{message_id}",
+                json={**sample_message_detail, "message_id": message_id},
+            )
+        summaries = [
+            EmailLogMessage.from_api({**sample_message_dict, "message_id": message_id})
+            for message_id in ids[:5]
+        ]
+
+        results = list(email_logs_api.hydrate(summaries + ids[5:], max_workers=3))
+
+        assert [result.message_id for result in results] == ids
+        assert all(result.error is None for result in results)
+        assert [result.message.message_id for result in results] == ids
+        assert len(results[0].message.events) == len(sample_message_detail["events"])
+
+    @responses.activate
+    def test_hydrate_cancels_queued_requests_when_closed_early(
+        self,
+        email_logs_api: EmailLogsApi,
+        sample_message_detail: dict[str, Any],
+    ) -> None:
+        started, release = threading.Event(), threading.Event()
+
+        def slow_detail(request: Any) -> tuple[int, dict, str]:
+            started.set()
+            release.wait(5)
+            return 200, {}, json.dumps(sample_message_detail)
+
+        responses.get(f"{BASE_EMAIL_LOGS_URL}/message-0", json=sample_message_detail)
+        responses.add_callback(
+            responses.GET, f"{BASE_EMAIL_LOGS_URL}/message-1", callback=slow_detail
+        )
+        ids = [f"message-{index}" for index in range(10)]
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = email_logs_api.hydrate(ids, max_workers=3, executor=executor)
+            assert next(results).message_id == "message-0"
+            assert started.wait(5)
+
+            started = time.perf_counter()
+            results.close()
+            closed_in = time.perf_counter() - started
+            release.set()
+
+        assert closed_in < 1  # does not wait for the request in flight
+        assert len(responses.calls) == 2  # message-2 was cancelled
+
+    @responses.activate
+    def test_hydrate_captures_errors_per_message(
+        self,
+        email_logs_api: EmailLogsApi,
+        sample_list_response: dict[str, Any],
+        sample_message_detail: dict[str, Any],
+    ) -> None:
+        responses.get(
+            f"{BASE_EMAIL_LOGS_URL}/{MESSAGE_ID}",
+            json=sample_message_detail,
+        )
+        responses.get(
+            f"{BASE_EMAIL_LOGS_URL}/missing",
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+        responses.get(BASE_EMAIL_LOGS_URL, json=sample_list_response)
+        page = email_logs_api.get_list()
+        page.messages.append(
+            EmailLogMessage.from_api(
+                {**sample_list_response["messages"][0], "message_id": "missing"}
+            )
+        )
+
+        results = list(email_logs_api.hydrate(page))
+
+        assert results[0].message is not None
+        assert results[0].message.raw_message_url is not None
+        assert results[1].message_id == "missing"
+        assert results[1].message is None
+        assert isinstance(results[1].error, APIError)
+        assert results[1].error.status == conftest.NOT_FOUND_STATUS_CODE
+
+
+class TestEmailLogsThroughClient:
+    @responses.activate
+    def test_trusted_parsing_is_passed_from_client(
+        self, sample_message_detail: dict[str, Any]
+    ) -> None:
+        sample_message_detail["events"][0]["details"]["click_url"] = 5
+        responses.get(f"{BASE_EMAIL_LOGS_URL}/{MESSAGE_ID}", json=sample_message_detail)
+
+        client = mt.MailtrapClient(
+            token="fake_token", account_id=ACCOUNT_ID, email_logs_trusted_parsing=True
+        )
+        msg = client.email_logs_api.email_logs.get_by_id(MESSAGE_ID)
+
+        assert msg.events[0].details.click_url == 5  # type: ignore[union-attr]
+
+    @responses.activate
+    def test_client_validates_events_by_default(
+        self, sample_message_detail: dict[str, Any]
+    ) -> None:
+        sample_message_detail["events"][0]["details"]["click_url"] = 5
+        responses.get(f"{BASE_EMAIL_LOGS_URL}/{MESSAGE_ID}", json=sample_message_detail)
+
+        client = mt.MailtrapClient(token="fake_token", account_id=ACCOUNT_ID)
+
+        with pytest.raises(ValidationError):
+            client.email_logs_api.email_logs.get_by_id(MESSAGE_ID)
+
+    @responses.activate
+    def test_lazy_events_is_passed_from_client(
+        self, sample_message_detail: dict[str, Any]
+    ) -> None:
+        responses.get(f"{BASE_EMAIL_LOGS_URL}/{MESSAGE_ID}", json=sample_message_detail)
+
+        client = mt.MailtrapClient(
+            token="fake_token", account_id=ACCOUNT_ID, email_logs_lazy_events=True
+        )
+        msg = client.email_logs_api.email_logs.get_by_id(MESSAGE_ID)
+
+        event = msg.events[0]
+        assert isinstance(event, LazyMessageEvent)
+        assert not event.is_parsed
+        assert isinstance(event.details, EventDetailsClick)
+        assert event.is_parsed
@@ -1,4 +1,5 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import responses
@@ -189,3 +190,52 @@ class TestSendingApi:
         assert result.responses[0].message_ids == ["12345"]
         assert result.responses[1].success is False
         assert result.responses[1].errors == ["Invalid email address"]
+
+    @responses.activate
+    @pytest.mark.parametrize("use_default_executor", [True, False])
+    def test_batch_send_many_should_send_batches_in_order(
+        self, use_default_executor: bool
+    ) -> None:
+        batches = [
+            BatchSendEmailParams(
+                base=DUMMY_BATCH_MAIL,
+                requests=[
+                    BatchEmailRequest(to=[DUMMY_ADDRESS], subject=f"Batch {index}")
+                ],
+            )
+            for index in range(5)
+        ]
+        responses.post(
+            BATCH_SEND_FULL_URL,
+            json={"success": True, "responses": [{"success": True}]},
+        )
+
+        api = get_sending_api()
+        if use_default_executor:
+            results = list(api.batch_send_many(batches))
+        else:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                results = list(api.batch_send_many(batches, executor=executor))
+
+        assert [result.success for result in results] == [True] * 5
+        bodies = [call.request.body for call in responses.calls]  # type: ignore
+        assert bodies == [batch.api_json for batch in batches]
+        assert [json.loads(body) for body in bodies] == [
+            batch.api_data for batch in batches
+        ]
+        request = responses.calls[0].request  # type: ignore
+        assert request.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    def test_batch_send_many_should_stop_on_api_error(self) -> None:
+        responses.post(BATCH_SEND_FULL_URL, status=500, json={"errors": ["Error"]})
+
+        api = get_sending_api()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            results = api.batch_send_many(
+                (DUMMY_BATCH_PARAMS for _ in range(10)), executor=executor
+            )
+            with pytest.raises(mt.APIError):
+                next(results)
+
+        assert len(responses.calls) == 1
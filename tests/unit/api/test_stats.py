@@ -1,14 +1,20 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
+from unittest.mock import Mock
 
 import pytest
 import responses
 
 from mailtrap.api.resources.stats import StatsApi
+from mailtrap.cache import ResponseCache
 from mailtrap.config import GENERAL_HOST
 from mailtrap.exceptions import APIError
 from mailtrap.http import HttpClient
 from mailtrap.models.stats import SendingStatGroup
 from mailtrap.models.stats import SendingStats
+from mailtrap.models.stats import SendingStatsColumns
+from mailtrap.models.stats import SendingStatsSnapshot
 from mailtrap.models.stats import StatsFilterParams
 from tests import conftest
 
@@ -287,3 +293,169 @@ class TestStatsApi:
         assert result[0].name == "date"
         assert result[0].value == "2026-01-01"
         assert result[0].stats.delivery_count == 5
+
+    @responses.activate
+    def test_cached_queries_should_hit_api_once_per_ttl(
+        self, sample_stats_dict: dict, sample_grouped_stats_response: list
+    ) -> None:
+        client = StatsApi(client=HttpClient(GENERAL_HOST), cache=ResponseCache(ttl=60))
+        total = responses.get(BASE_STATS_URL, json=sample_stats_dict, status=200)
+        domains = responses.get(
+            f"{BASE_STATS_URL}/domains",
+            json=sample_grouped_stats_response,
+            status=200,
+        )
+
+        for _ in range(3):
+            assert client.get(ACCOUNT_ID, _default_params()).delivery_count == 150
+            assert len(client.by_domain(ACCOUNT_ID, _default_params())) == 2
+
+        assert total.call_count == 1
+        assert domains.call_count == 1
+
+    @responses.activate
+    def test_cache_key_should_ignore_filter_list_order(
+        self, sample_stats_dict: dict
+    ) -> None:
+        client = StatsApi(client=HttpClient(GENERAL_HOST), cache=ResponseCache(ttl=60))
+        total = responses.get(BASE_STATS_URL, json=sample_stats_dict, status=200)
+        other_account = responses.get(
+            f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID + 1}/stats",
+            json=sample_stats_dict,
+            status=200,
+        )
+
+        client.get(ACCOUNT_ID, StatsFilterParams(sending_domain_ids=[1, 2]))
+        client.get(ACCOUNT_ID, StatsFilterParams(sending_domain_ids=[2, 1]))
+        client.get(ACCOUNT_ID, StatsFilterParams(sending_domain_ids=[3]))
+        client.get(ACCOUNT_ID + 1, StatsFilterParams(sending_domain_ids=[3]))
+
+        assert total.call_count == 2
+        assert other_account.call_count == 1
+
+    @responses.activate
+    def test_snapshot_should_return_stats_and_all_groupings(
+        self, client: StatsApi, sample_stats_dict: dict
+    ) -> None:
+        responses.get(BASE_STATS_URL, json=sample_stats_dict, status=200)
+        for group, key, value in [
+            ("domains", "sending_domain_id", 1),
+            ("categories", "category", "Welcome email"),
+            ("email_service_providers", "email_service_provider", "Gmail"),
+            ("date", "date", "2026-01-01"),
+        ]:
+            responses.get(
+                f"{BASE_STATS_URL}/{group}",
+                json=[{key: value, "stats": sample_stats_dict}],
+                status=200,
+            )
+
+        snapshot = client.snapshot(ACCOUNT_ID, _default_params())
+
+        assert isinstance(snapshot, SendingStatsSnapshot)
+        assert len(responses.calls) == 5
+        assert snapshot.stats.delivery_count == 150
+        assert snapshot.domains[0].value == 1
+        assert snapshot.categories[0].value == "Welcome email"
+        assert snapshot.email_service_providers[0].value == "Gmail"
+        assert snapshot.date[0].value == "2026-01-01"
+        assert all(
+            call.request.params == {"start_date": "2026-01-01", "end_date": "2026-01-31"}
+            for call in responses.calls
+        )
+
+    @responses.activate
+    def test_snapshot_should_run_on_given_executor(
+        self, client: StatsApi, sample_stats_dict: dict
+    ) -> None:
+        responses.get(BASE_STATS_URL, json=sample_stats_dict, status=200)
+        for group in ("domains", "categories", "email_service_providers", "date"):
+            responses.get(f"{BASE_STATS_URL}/{group}", json=[], status=200)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            executor = Mock(wraps=pool)
+            snapshot = client.snapshot(ACCOUNT_ID, _default_params(), executor=executor)
+
+        assert executor.submit.call_count == 5
+        assert snapshot.stats.delivery_count == 150
+        assert snapshot.date == []
+
+    @responses.activate
+    def test_snapshot_should_raise_api_errors(
+        self, client: StatsApi, sample_stats_dict: dict
+    ) -> None:
+        responses.get(BASE_STATS_URL, json=sample_stats_dict, status=200)
+        for group in ("domains", "categories", "email_service_providers"):
+            responses.get(f"{BASE_STATS_URL}/{group}", json=[], status=200)
+        responses.get(
+            f"{BASE_STATS_URL}/date",
+            status=conftest.FORBIDDEN_STATUS_CODE,
+            json=conftest.FORBIDDEN_RESPONSE,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.snapshot(ACCOUNT_ID, _default_params())
+
+        assert conftest.FORBIDDEN_ERROR_MESSAGE in str(exc_info.value)
+
+    @responses.activate
+    def test_grouped_columns_should_return_typed_arrays(
+        self, client: StatsApi, sample_grouped_stats_response: list
+    ) -> None:
+        responses.get(
+            f"{BASE_STATS_URL}/domains",
+            json=sample_grouped_stats_response,
+            status=200,
+        )
+
+        columns = client.grouped_columns(
+            ACCOUNT_ID, "domains", _default_params(), use_numpy=False
+        )
+
+        assert isinstance(columns, SendingStatsColumns)
+        assert columns.name == "sending_domain_id"
+        assert columns.values == [1, 2]
+        assert len(columns) == 2
+        assert len(columns.columns) == 10
+        assert columns["delivery_count"] == array("q", [100, 50])
+        assert columns["delivery_rate"] == array("d", [0.96, 0.93])
+        assert columns.row(2) == SendingStats(**sample_grouped_stats_response[1]["stats"])
+
+    @responses.activate
+    def test_grouped_columns_should_use_numpy_when_available(
+        self, client: StatsApi, sample_grouped_stats_response: list
+    ) -> None:
+        numpy = pytest.importorskip("numpy")
+        responses.get(
+            f"{BASE_STATS_URL}/domains",
+            json=sample_grouped_stats_response,
+            status=200,
+        )
+
+        columns = client.grouped_columns(ACCOUNT_ID, "domains", _default_params())
+
+        assert columns["open_count"].dtype == numpy.int64
+        assert columns["open_rate"].dtype == numpy.float64
+        assert columns["open_count"].tolist() == [80, 40]
+        assert columns.row(1) == SendingStats(**sample_grouped_stats_response[0]["stats"])
+
+    def test_sending_stats_columns_from_groups_should_match_from_api(
+        self, sample_grouped_stats_response: list
+    ) -> None:
+        groups = [
+            SendingStatGroup(
+                name="sending_domain_id",
+                value=item["sending_domain_id"],
+                stats=SendingStats(**item["stats"]),
+            )
+            for item in sample_grouped_stats_response
+        ]
+
+        columns = SendingStatsColumns.from_groups(groups, use_numpy=False)
+
+        assert (
+            columns.to_dict()
+            == SendingStatsColumns.from_api(
+                "sending_domain_id", sample_grouped_stats_response, use_numpy=False
+            ).to_dict()
+        )
@@ -1,3 +1,6 @@
+import io
+import re
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -157,3 +160,157 @@ class TestProjectsApi:
 
         assert isinstance(attachment, Attachment)
         assert attachment.id == ATTACHMENT_ID
+
+    @responses.activate
+    def test_stream_should_yield_attachment_content(self, client: AttachmentsApi) -> None:
+        responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            body=b"a,b,c\n1,2,3\n",
+            status=200,
+        )
+
+        chunks = list(client.stream(INBOX_ID, MESSAGE_ID, ATTACHMENT_ID, chunk_size=4))
+
+        assert b"".join(chunks) == b"a,b,c\n1,2,3\n"
+
+    @responses.activate
+    def test_download_should_write_to_file_object(self, client: AttachmentsApi) -> None:
+        responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            body=b"a,b,c\n",
+            status=200,
+        )
+        buffer = io.BytesIO()
+
+        written = client.download(INBOX_ID, MESSAGE_ID, ATTACHMENT_ID, buffer)
+
+        assert written == 6
+        assert buffer.getvalue() == b"a,b,c\n"
+
+    @responses.activate
+    def test_download_should_raise_api_errors(self, client: AttachmentsApi) -> None:
+        responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.download(INBOX_ID, MESSAGE_ID, ATTACHMENT_ID, io.BytesIO())
+
+        assert conftest.NOT_FOUND_ERROR_MESSAGE in str(exc_info.value)
+
+    @responses.activate
+    def test_download_all_should_store_attachments_by_id(
+        self,
+        client: AttachmentsApi,
+        sample_attachment_dict: dict,
+        tmp_path: Path,
+    ) -> None:
+        other_attachment = {
+            **sample_attachment_dict,
+            "id": ATTACHMENT_ID + 1,
+            "filename": "../logo.png",
+            "attachment_size": 4,
+        }
+        first_attachment = {**sample_attachment_dict, "attachment_size": 6}
+        responses.get(
+            BASE_ATTACHMENTS_URL,
+            json=[first_attachment, other_attachment],
+            status=200,
+        )
+        responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            body=b"a,b,c\n",
+            status=200,
+        )
+        responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID + 1}/download",
+            body=b"\x89PNG",
+            status=200,
+        )
+
+        paths = client.download_all(INBOX_ID, MESSAGE_ID, tmp_path)
+
+        assert paths == {
+            ATTACHMENT_ID: tmp_path / str(ATTACHMENT_ID) / "test.csv",
+            ATTACHMENT_ID + 1: tmp_path / str(ATTACHMENT_ID + 1) / "logo.png",
+        }
+        assert paths[ATTACHMENT_ID].read_bytes() == b"a,b,c\n"
+        assert paths[ATTACHMENT_ID + 1].read_bytes() == b"\x89PNG"
+
+    @pytest.mark.parametrize("filename", ["", ".", "..", "reports/..", "..\\.."])
+    def test_cached_path_should_replace_unusable_filenames(
+        self, sample_attachment_dict: dict, tmp_path: Path, filename: str
+    ) -> None:
+        attachment = Attachment(**{**sample_attachment_dict, "filename": filename})
+
+        path = AttachmentsApi._cached_path(tmp_path, attachment)
+
+        assert path == tmp_path / str(ATTACHMENT_ID) / f"attachment_{ATTACHMENT_ID}"
+
+    @responses.activate
+    def test_download_all_should_not_refetch_cached_attachments(
+        self,
+        client: AttachmentsApi,
+        sample_attachment_dict: dict,
+        tmp_path: Path,
+    ) -> None:
+        attachment = {**sample_attachment_dict, "attachment_size": 6}
+        responses.get(BASE_ATTACHMENTS_URL, json=[attachment], status=200)
+        download = responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            body=b"a,b,c\n",
+            status=200,
+        )
+
+        client.download_all(INBOX_ID, MESSAGE_ID, tmp_path)
+        paths = client.download_all(INBOX_ID, MESSAGE_ID, tmp_path)
+
+        assert download.call_count == 1
+        assert paths[ATTACHMENT_ID].read_bytes() == b"a,b,c\n"
+
+    @responses.activate
+    def test_download_all_should_refetch_incomplete_files(
+        self,
+        client: AttachmentsApi,
+        sample_attachment_dict: dict,
+        tmp_path: Path,
+    ) -> None:
+        attachment = {**sample_attachment_dict, "attachment_size": 6}
+        responses.get(BASE_ATTACHMENTS_URL, json=[attachment], status=200)
+        download = responses.get(
+            f"{BASE_ATTACHMENTS_URL}/{ATTACHMENT_ID}/download",
+            body=b"a,b,c\n",
+            status=200,
+        )
+        stale = tmp_path / str(ATTACHMENT_ID) / "test.csv"
+        stale.parent.mkdir()
+        stale.write_bytes(b"a,")
+
+        paths = client.download_all(INBOX_ID, MESSAGE_ID, tmp_path)
+
+        assert download.call_count == 1
+        assert paths[ATTACHMENT_ID].read_bytes() == b"a,b,c\n"
+
+    @responses.activate
+    def test_download_all_should_stop_on_first_error(
+        self,
+        client: AttachmentsApi,
+        sample_attachment_dict: dict,
+        tmp_path: Path,
+    ) -> None:
+        attachments = [
+            {**sample_attachment_dict, "id": ATTACHMENT_ID + index} for index in range(20)
+        ]
+        responses.get(BASE_ATTACHMENTS_URL, json=attachments, status=200)
+        download = responses.get(
+            re.compile(rf"{BASE_ATTACHMENTS_URL}/\d+/download"),
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError):
+            client.download_all(INBOX_ID, MESSAGE_ID, tmp_path, max_workers=2)
+
+        assert download.call_count <= 2
@@ -1,13 +1,19 @@
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Any
 
 import pytest
 import responses
 
 from mailtrap.api.resources.messages import MessagesApi
+from mailtrap.cache import MessageCache
 from mailtrap.config import GENERAL_HOST
 from mailtrap.exceptions import APIError
 from mailtrap.http import HttpClient
 from mailtrap.models.messages import EmailMessage
+from mailtrap.models.messages import SpamReport
 from mailtrap.models.messages import UpdateEmailMessageParams
 from tests import conftest
 
@@ -873,3 +879,215 @@ class TestMessagesApi:
         result = client.get_mail_headers(INBOX_ID, MESSAGE_ID)
 
         assert result == sample_mail_headers_dict["headers"]
+
+    @responses.activate
+    def test_get_bulk_should_fetch_all_artifacts_for_all_messages(
+        self, client: MessagesApi, sample_spam_report_dict: dict
+    ) -> None:
+        other_message_id = MESSAGE_ID + 1
+        for message_id in (MESSAGE_ID, other_message_id):
+            responses.get(
+                f"{BASE_MESSAGES_URL}/{message_id}/body.txt",
+                body=f"Text {message_id}",
+                status=200,
+                content_type="text/plain",
+            )
+            responses.get(
+                f"{BASE_MESSAGES_URL}/{message_id}/spam_report",
+                json=sample_spam_report_dict,
+                status=200,
+            )
+
+        result = client.get_bulk(
+            [(INBOX_ID, MESSAGE_ID), (INBOX_ID, other_message_id)],
+            artifacts=["text", "spam_report"],
+            max_workers=4,
+        )
+
+        assert len(responses.calls) == 4
+        assert list(result) == [(INBOX_ID, MESSAGE_ID), (INBOX_ID, other_message_id)]
+        assert result[(INBOX_ID, MESSAGE_ID)]["text"] == f"Text {MESSAGE_ID}"
+        assert result[(INBOX_ID, other_message_id)]["text"] == f"Text {other_message_id}"
+        assert isinstance(result[(INBOX_ID, MESSAGE_ID)]["spam_report"], SpamReport)
+
+    def test_get_bulk_should_reject_unknown_artifacts(self, client: MessagesApi) -> None:
+        with pytest.raises(ValueError, match="Unknown message artifacts: attachments"):
+            client.get_bulk([(INBOX_ID, MESSAGE_ID)], artifacts=["attachments"])
+
+    @responses.activate
+    def test_get_bulk_should_raise_api_errors(self, client: MessagesApi) -> None:
+        responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.html",
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.get_bulk([(INBOX_ID, MESSAGE_ID)], artifacts=["html"])
+
+        assert conftest.NOT_FOUND_ERROR_MESSAGE in str(exc_info.value)
+
+    @responses.activate
+    def test_get_bulk_should_stop_on_first_error(self, client: MessagesApi) -> None:
+        responses.get(
+            re.compile(rf"{BASE_MESSAGES_URL}/\d+/body.html"),
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError):
+            client.get_bulk(
+                [(INBOX_ID, MESSAGE_ID + index) for index in range(50)],
+                artifacts=["html"],
+                max_workers=2,
+            )
+
+        assert len(responses.calls) <= 2
+
+    @responses.activate
+    def test_get_bulk_should_use_given_executor(self, client: MessagesApi) -> None:
+        responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.txt",
+            body="Text",
+            status=200,
+            content_type="text/plain",
+        )
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="custom") as executor:
+            result = client.get_bulk(
+                [(INBOX_ID, MESSAGE_ID)], artifacts=["text"], executor=executor
+            )
+
+        assert result == {(INBOX_ID, MESSAGE_ID): {"text": "Text"}}
+
+    @responses.activate
+    def test_stream_raw_message_should_yield_raw_bytes(self, client: MessagesApi) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw"
+        raw_content = "Subject: Test\n\nBody content ✓".encode()
+        responses.get(url, body=raw_content, status=200, content_type="text/plain")
+
+        chunks = list(client.stream_raw_message(INBOX_ID, MESSAGE_ID, chunk_size=8))
+
+        assert b"".join(chunks) == raw_content
+        assert all(len(chunk) <= 8 for chunk in chunks)
+
+    @responses.activate
+    def test_download_raw_message_should_write_to_file_object(
+        self, client: MessagesApi
+    ) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw"
+        raw_content = b"Subject: Test\n\nBody content"
+        responses.get(url, body=raw_content, status=200, content_type="text/plain")
+        buffer = io.BytesIO()
+
+        written = client.download_raw_message(INBOX_ID, MESSAGE_ID, buffer)
+
+        assert written == len(raw_content)
+        assert buffer.getvalue() == raw_content
+
+    @responses.activate
+    def test_download_message_as_eml_should_write_to_path(
+        self, client: MessagesApi, tmp_path: Path
+    ) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml"
+        eml_content = b"From: test@example.com\nSubject: Test\n\nBody content\n"
+        responses.get(url, body=eml_content, status=200, content_type="message/rfc822")
+        destination = tmp_path / "message.eml"
+
+        written = client.download_message_as_eml(INBOX_ID, MESSAGE_ID, destination)
+
+        assert written == len(eml_content)
+        assert destination.read_bytes() == eml_content
+
+    @responses.activate
+    def test_download_message_as_eml_should_raise_api_errors(
+        self, client: MessagesApi, tmp_path: Path
+    ) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.eml"
+        responses.get(
+            url,
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            client.download_message_as_eml(INBOX_ID, MESSAGE_ID, tmp_path / "m.eml")
+
+        assert conftest.NOT_FOUND_ERROR_MESSAGE in str(exc_info.value)
+        assert list(tmp_path.iterdir()) == []
+
+    @responses.activate
+    def test_parse_raw_message_should_return_parsed_email(
+        self, client: MessagesApi
+    ) -> None:
+        url = f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.raw"
+        raw_content = (
+            b"From: test@example.com\r\n"
+            b"To: recipient@example.com\r\n"
+            b"Subject: Test\r\n"
+            b"\r\n"
+            b"Body content\r\n"
+        )
+        responses.get(url, body=raw_content, status=200, content_type="text/plain")
+
+        message = client.parse_raw_message(INBOX_ID, MESSAGE_ID, chunk_size=5)
+
+        assert message["Subject"] == "Test"
+        assert message["To"] == "recipient@example.com"
+        assert message.get_payload() == "Body content\r\n"
+
+    @responses.activate
+    def test_cached_artifacts_should_be_fetched_once(
+        self, sample_spam_report_dict: dict, sample_mail_headers_dict: dict
+    ) -> None:
+        cache = MessageCache()
+        client = MessagesApi(
+            account_id=ACCOUNT_ID, client=HttpClient(GENERAL_HOST), cache=cache
+        )
+        html = responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.html",
+            body="<p>Hi</p>",
+            status=200,
+            content_type="text/html",
+        )
+        spam_report = responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/spam_report",
+            json=sample_spam_report_dict,
+            status=200,
+        )
+        headers = responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/mail_headers",
+            json=sample_mail_headers_dict,
+            status=200,
+        )
+
+        for _ in range(2):
+            assert client.get_html_message(INBOX_ID, MESSAGE_ID) == "<p>Hi</p>"
+            assert client.get_spam_report(INBOX_ID, MESSAGE_ID).score == 1.2
+            assert (
+                client.get_mail_headers(INBOX_ID, MESSAGE_ID)
+                == sample_mail_headers_dict["headers"]
+            )
+
+        assert html.call_count == 1
+        assert spam_report.call_count == 1
+        assert headers.call_count == 1
+        assert cache.stats.hits == 3
+        assert cache.stats.misses == 3
+
+    @responses.activate
+    def test_cache_should_not_store_failed_responses(self) -> None:
+        cache = MessageCache()
+        client = MessagesApi(
+            account_id=ACCOUNT_ID, client=HttpClient(GENERAL_HOST), cache=cache
+        )
+        responses.get(
+            f"{BASE_MESSAGES_URL}/{MESSAGE_ID}/body.txt",
+            status=conftest.NOT_FOUND_STATUS_CODE,
+            json=conftest.NOT_FOUND_RESPONSE,
+        )
+
+        with pytest.raises(APIError):
+            client.get_text_message(INBOX_ID, MESSAGE_ID)
+
+        assert cache.get(ACCOUNT_ID, INBOX_ID, MESSAGE_ID, "text") is None
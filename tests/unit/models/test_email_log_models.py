@@ -2,6 +2,8 @@
 
 from typing import Any
 
+import pytest
+
 from mailtrap.models.email_logs import EmailLogMessage
 from mailtrap.models.email_logs import EmailLogsListFilters
 from mailtrap.models.email_logs import EventDetailsBounce
@@ -9,6 +11,7 @@ from mailtrap.models.email_logs import EventDetailsClick
 from mailtrap.models.email_logs import EventDetailsDelivery
 from mailtrap.models.email_logs import EventDetailsOpen
 from mailtrap.models.email_logs import EventDetailsUnsubscribe
+from mailtrap.models.email_logs import LazyMessageEvent
 from mailtrap.models.email_logs import MessageEvent
 from mailtrap.models.email_logs import filter_ci_equal
 from mailtrap.models.email_logs import filter_sending_domain_id_equal
@@ -191,6 +194,135 @@ class TestEmailLogMessage:
         assert isinstance(msg.events[0].details, EventDetailsDelivery)
         assert msg.events[0].details.email_service_provider == "Google"
 
+    def test_from_api_trusted_matches_validated_parsing(self) -> None:
+        data: dict[str, Any] = {
+            "message_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+            "status": "delivered",
+            "subject": "Welcome",
+            "from": "sender@example.com",
+            "to": "recipient@example.com",
+            "sent_at": "2025-01-15T10:30:00Z",
+            "client_ip": None,
+            "category": None,
+            "custom_variables": None,
+            "sending_stream": "transactional",
+            "sending_domain_id": 3938,
+            "template_id": None,
+            "template_variables": None,
+            "opens_count": 1,
+            "clicks_count": 0,
+            "raw_message_url": None,
+            "events": [
+                {
+                    "event_type": "delivery",
+                    "created_at": "2025-01-15T10:31:00Z",
+                    "details": {"sending_ip": "192.0.2.1", "unknown_field": "x"},
+                },
+                {
+                    "event_type": "open",
+                    "created_at": "2025-01-15T10:35:00Z",
+                    "details": None,
+                },
+            ],
+        }
+
+        trusted = EmailLogMessage.from_api(data, trusted=True)
+
+        assert trusted == EmailLogMessage.from_api(data)
+        assert isinstance(trusted.events[0].details, EventDetailsDelivery)
+        assert trusted.events[0].details.recipient_mx is None
+        assert not hasattr(trusted.events[0].details, "unknown_field")
+        assert trusted.events[1].details is None
+        assert trusted.custom_variables == {}
+
+    def test_from_api_trusted_keeps_unknown_event_details_as_dict(self) -> None:
+        data: dict[str, Any] = {
+            "message_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+            "status": "delivered",
+            "from": "sender@example.com",
+            "to": "recipient@example.com",
+            "sent_at": "2025-01-15T10:30:00Z",
+            "sending_stream": "transactional",
+            "sending_domain_id": 3938,
+            "opens_count": 0,
+            "clicks_count": 0,
+            "events": [
+                {
+                    "event_type": "custom",
+                    "created_at": "2025-01-15T10:40:00Z",
+                    "details": {"foo": "bar"},
+                },
+            ],
+        }
+
+        trusted = EmailLogMessage.from_api(data, trusted=True)
+
+        assert trusted.events[0].details == {"foo": "bar"}
+
+    def test_from_api_lazy_events_parse_details_on_access(self) -> None:
+        data: dict[str, Any] = {
+            "message_id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+            "status": "delivered",
+            "from": "sender@example.com",
+            "to": "recipient@example.com",
+            "sent_at": "2025-01-15T10:30:00Z",
+            "sending_stream": "transactional",
+            "sending_domain_id": 3938,
+            "opens_count": 1,
+            "clicks_count": 1,
+            "events": [
+                {
+                    "event_type": "click",
+                    "created_at": "2025-01-15T10:36:00Z",
+                    "details": {
+                        "click_url": "https://example.com/track/abc",
+                        "web_ip_address": "198.51.100.50",
+                    },
+                },
+                {
+                    "event_type": "open",
+                    "created_at": "2025-01-15T10:35:00Z",
+                    "details": None,
+                },
+            ],
+        }
+
+        msg = EmailLogMessage.from_api(data, lazy_events=True)
+
+        event = msg.events[0]
+        assert isinstance(event, LazyMessageEvent)
+        assert event.event_type == "click"
+        assert not event.is_parsed
+        assert isinstance(event.details, EventDetailsClick)
+        assert event.details.click_url == "https://example.com/track/abc"
+        assert event.is_parsed
+        assert msg == EmailLogMessage.from_api(data)
+        assert msg.model_dump(by_alias=True) == (
+            EmailLogMessage.from_api(data).model_dump(by_alias=True)
+        )
+
+    def test_from_api_list_matches_from_api(self) -> None:
+        items: list[dict[str, Any]] = [
+            {
+                "message_id": f"message-{index}",
+                "status": "delivered",
+                "subject": None,
+                "from": "sender@example.com",
+                "to": "recipient@example.com",
+                "sent_at": "2025-01-15T10:30:00Z",
+                "sending_stream": "bulk",
+                "sending_domain_id": 3938,
+                "opens_count": 0,
+                "clicks_count": 0,
+            }
+            for index in range(3)
+        ]
+
+        messages = EmailLogMessage.from_api_list(items)
+
+        assert messages == [EmailLogMessage.from_api(item) for item in items]
+        assert messages[2].from_ == "sender@example.com"
+
 
 class TestEmailLogsListFilters:
     def test_to_params_date_range(self) -> None:
@@ -212,3 +344,64 @@ class TestEmailLogsListFilters:
         assert params["filters[to][value]"] == "recipient@example.com"
         assert params["filters[sending_domain_id][operator]"] == "equal"
         assert params["filters[sending_domain_id][value][]"] == [3938, 3939]
+
+    def test_filters_are_immutable_and_copy_specs(self) -> None:
+        spec = filter_ci_equal(["a@example.com", "b@example.com"])
+        f = EmailLogsListFilters(to=spec)
+        spec["value"].append("c@example.com")
+
+        with pytest.raises(AttributeError, match="immutable"):
+            f.to = filter_ci_equal("d@example.com")  # type: ignore[misc]
+        assert f.to == {
+            "operator": "ci_equal",
+            "value": ("a@example.com", "b@example.com"),
+        }
+
+    def test_filter_specs_are_deeply_immutable(self) -> None:
+        f = EmailLogsListFilters(to=filter_ci_equal(["a@example.com"]))
+        query_string = f.query_string
+
+        assert f.to is not None
+        with pytest.raises(TypeError):
+            f.to["value"] = "b@example.com"  # type: ignore[index]
+        with pytest.raises(AttributeError):
+            f.to["value"].append("b@example.com")
+        assert f.query_string == query_string
+        assert f == EmailLogsListFilters(to=filter_ci_equal(["a@example.com"]))
+
+    def test_filters_are_hashable_and_compare_by_value(self) -> None:
+        first = EmailLogsListFilters(
+            sent_after="2025-01-01T00:00:00Z",
+            sending_domain_id=filter_sending_domain_id_equal([3938, 3939]),
+        )
+        second = EmailLogsListFilters(
+            sending_domain_id={"value": [3938, 3939], "operator": "equal"},
+            sent_after="2025-01-01T00:00:00Z",
+        )
+
+        assert first == second
+        assert hash(first) == hash(second)
+        assert len({first, second, EmailLogsListFilters()}) == 2
+
+    def test_replace_returns_new_filters(self) -> None:
+        f = EmailLogsListFilters(to=filter_ci_equal("recipient@example.com"))
+
+        replaced = f.replace(sent_after="2025-01-01T00:00:00Z")
+
+        assert f.sent_after is None
+        assert replaced.sent_after == "2025-01-01T00:00:00Z"
+        assert replaced.to == f.to
+
+    def test_query_string_is_encoded_once(self) -> None:
+        f = EmailLogsListFilters(
+            sent_after="2025-01-01T00:00:00Z",
+            sending_domain_id=filter_sending_domain_id_equal([3938, 3939]),
+        )
+
+        assert f.query_string == (
+            "filters%5Bsent_after%5D=2025-01-01T00%3A00%3A00Z"
+            "&filters%5Bsending_domain_id%5D%5Boperator%5D=equal"
+            "&filters%5Bsending_domain_id%5D%5Bvalue%5D%5B%5D=3938"
+            "&filters%5Bsending_domain_id%5D%5Bvalue%5D%5B%5D=3939"
+        )
+        assert f.query_string is f.query_string
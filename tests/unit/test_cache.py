@@ -0,0 +1,215 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from mailtrap.cache import DiskCache
+from mailtrap.cache import MemoryCache
+from mailtrap.cache import MessageCache
+from mailtrap.cache import ResponseCache
+
+
+class TestMemoryCache:
+    def test_get_should_return_stored_value(self) -> None:
+        cache = MemoryCache()
+        cache.set("key", b"value")
+
+        assert cache.get("key") == b"value"
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_set_should_evict_least_recently_used_entries(self) -> None:
+        cache = MemoryCache(max_bytes=10)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"1234"
+        assert cache.size == 8
+        assert cache.stats.evictions == 1
+
+    def test_set_should_skip_values_larger_than_cache(self) -> None:
+        cache = MemoryCache(max_bytes=3)
+        cache.set("key", b"1234")
+
+        assert cache.get("key") is None
+        assert len(cache) == 0
+
+    def test_get_should_drop_expired_entries(self) -> None:
+        cache = MemoryCache()
+        cache.set("key", b"value", ttl=-1)
+
+        assert cache.get("key") is None
+        assert cache.size == 0
+
+
+class TestDiskCache:
+    def test_get_should_return_value_stored_by_another_instance(
+        self, tmp_path: Path
+    ) -> None:
+        DiskCache(tmp_path).set("key", b"value")
+
+        cache = DiskCache(tmp_path)
+
+        assert cache.get("key") == b"value"
+        assert cache.get("missing") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+
+    def test_set_should_evict_least_recently_used_entries(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path, max_bytes=30)
+        cache.set("a", b"1234")
+        cache.set("b", b"1234")
+        past = time.time() - 60
+        for path in tmp_path.iterdir():
+            os.utime(path, (past, past))
+        cache.get("a")
+        cache.set("c", b"1234")
+
+        assert cache.get("a") == b"1234"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"1234"
+        assert cache.stats.evictions == 1
+        assert len(list(tmp_path.iterdir())) == 2
+
+    def test_get_should_drop_expired_entries(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        cache.set("key", b"value", ttl=-1)
+
+        assert cache.get("key") is None
+        assert list(tmp_path.iterdir()) == []
+        assert cache.size == 0
+
+    def test_clear_should_remove_all_entries(self, tmp_path: Path) -> None:
+        cache = DiskCache(tmp_path)
+        cache.set("a", b"1")
+        cache.set("b", b"2")
+
+        cache.clear()
+
+        assert cache.get("a") is None
+        assert cache.size == 0
+
+
+class TestMessageCache:
+    def test_get_should_fall_back_to_disk_and_promote_to_memory(
+        self, tmp_path: Path
+    ) -> None:
+        MessageCache(directory=tmp_path).set("1", 2, 3, "html", b"<p>Hi</p>")
+
+        cache = MessageCache(directory=tmp_path)
+
+        assert cache.get("1", 2, 3, "html") == b"<p>Hi</p>"
+        assert cache.get("1", 2, 3, "html") == b"<p>Hi</p>"
+        assert cache.disk is not None
+        assert cache.disk.stats.hits == 1
+        assert cache.memory.stats.hits == 1
+        assert cache.stats.hits == 2
+
+    def test_get_should_key_by_account_inbox_message_and_artifact(self) -> None:
+        cache = MessageCache()
+        cache.set("1", 2, 3, "html", b"html")
+
+        assert cache.get("1", 2, 3, "html") == b"html"
+        assert cache.get("1", 2, 3, "text") is None
+        assert cache.get("1", 2, 4, "html") is None
+        assert cache.get("1", 5, 3, "html") is None
+        assert cache.get("6", 2, 3, "html") is None
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 4
+
+
+class TestResponseCache:
+    def test_get_or_fetch_should_reuse_value_within_ttl(self) -> None:
+        cache = ResponseCache(ttl=60)
+        calls = []
+
+        def fetch() -> bytes:
+            calls.append(1)
+            return b"value"
+
+        assert cache.get_or_fetch("key", fetch) == b"value"
+        assert cache.get_or_fetch("key", fetch) == b"value"
+        assert len(calls) == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hits == 1
+
+    def test_get_or_fetch_should_refetch_after_ttl(self) -> None:
+        cache = ResponseCache(ttl=0)
+        values = iter([b"first", b"second"])
+
+        assert cache.get_or_fetch("key", lambda: next(values)) == b"first"
+        assert cache.get_or_fetch("key", lambda: next(values)) == b"second"
+
+    def test_get_or_fetch_should_coalesce_concurrent_requests(self) -> None:
+        cache = ResponseCache(ttl=60)
+        release = threading.Event()
+        calls = []
+
+        def fetch() -> bytes:
+            calls.append(1)
+            release.wait(timeout=5)
+            return b"value"
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(cache.get_or_fetch, "key", fetch) for _ in range(8)
+            ]
+            while cache.stats.misses + cache.stats.coalesced < 8:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == [b"value"] * 8
+        assert len(calls) == 1
+        assert cache.stats.coalesced == 7
+
+    def test_get_or_fetch_should_not_refetch_value_stored_by_finished_leader(
+        self,
+    ) -> None:
+        class LateBackend(MemoryCache):
+            """Misses the first lookup, as if a leader stored the value just after."""
+
+            lookups = 0
+
+            def get(self, key: str) -> Optional[bytes]:
+                self.lookups += 1
+                if self.lookups == 1:
+                    self.set(key, b"stored by leader")
+                    return None
+                return super().get(key)
+
+        cache = ResponseCache(backend=LateBackend())
+
+        assert cache.get_or_fetch("key", lambda: b"refetched") == b"stored by leader"
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 0
+
+    def test_get_or_fetch_should_not_cache_errors(self) -> None:
+        cache = ResponseCache(ttl=60)
+
+        def fail() -> bytes:
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_fetch("key", fail)
+
+        assert cache.get_or_fetch("key", lambda: b"value") == b"value"
+
+    def test_get_or_fetch_should_share_entries_through_backend(
+        self, tmp_path: Path
+    ) -> None:
+        ResponseCache(backend=DiskCache(tmp_path)).get_or_fetch("key", lambda: b"1")
+
+        cache = ResponseCache(backend=DiskCache(tmp_path))
+
+        assert cache.get_or_fetch("key", lambda: b"2") == b"1"
@@ -3,6 +3,7 @@ from typing import Any
 import pytest
 
 import mailtrap as mt
+from mailtrap.testing import FakeMailtrapServer
 
 DUMMY_ADDRESS = mt.Address(email="joe@mail.com")
 DUMMY_MAIL = mt.Mail(
@@ -63,6 +64,12 @@ class TestMailtrapClient:
 
         assert "`account_id` is required for Webhooks API" in str(exc_info.value)
 
+    def test_testing_api_should_share_message_cache(self) -> None:
+        cache = mt.MessageCache()
+        client = self.get_client(account_id="12345", message_cache=cache)
+
+        assert client.testing_api.messages._cache is cache
+
     @pytest.mark.parametrize(
         "arguments, expected_url",
         [
@@ -110,3 +117,74 @@ class TestMailtrapClient:
         client = self.get_client(user_agent=custom_ua)
 
         assert client.headers["User-Agent"] == custom_ua
+
+    def test_apis_should_share_http_client_per_host(self) -> None:
+        client = self.get_client(account_id="12345")
+
+        assert client.contacts_api._client is client.email_logs_api._client
+        assert client.sending_api._client is client.sending_api._client
+        assert client.sending_api._client is not client.contacts_api._client
+
+    def test_changed_token_should_apply_to_existing_apis(self) -> None:
+        with FakeMailtrapServer(token="new_token") as server:
+            client = self.get_client(api_host=server.host)
+            sending_api = client.sending_api
+            with pytest.raises(mt.AuthorizationError):
+                sending_api.send(DUMMY_MAIL)
+
+            client.token = "new_token"
+
+            assert sending_api.send(DUMMY_MAIL).success is True
+
+    def test_changed_user_agent_should_apply_to_existing_apis(self) -> None:
+        client = self.get_client(account_id="12345")
+        http_client = client.email_logs_api._client
+
+        client.user_agent = "MyApp/2.0"
+
+        assert client.headers["User-Agent"] == "MyApp/2.0"
+        assert http_client._headers["User-Agent"] == "MyApp/2.0"
+
+    def test_general_api_host_should_be_used_by_account_apis(self) -> None:
+        client = self.get_client(
+            account_id="12345", general_api_host="http://127.0.0.1:8025"
+        )
+
+        assert client.email_logs_api._client._host == "http://127.0.0.1:8025"
+        assert client.stats_api._client is client.contacts_api._client
+        assert client.sending_api._client is not client.contacts_api._client
+
+    def test_positional_arguments_should_keep_their_order(self) -> None:
+        client = mt.MailtrapClient(
+            "fake_token", "example.send.com", 543, True, False, "12345"
+        )
+
+        assert client.api_host == "example.send.com"
+        assert client.api_port == 543
+        assert client.bulk is True
+        assert client.sandbox is False
+        assert client.account_id == "12345"
+        assert client.general_api_host is None
+
+    def test_warmup_should_open_connection_reused_by_send(self) -> None:
+        with FakeMailtrapServer() as server:
+            client = self.get_client(api_host=server.host)
+
+            report = client.warmup()
+            client.send(DUMMY_MAIL)
+
+            assert server.connections == 1
+            assert server.requests == 2  # the warmup HEAD and the send
+        assert [warmup.host for warmup in report.hosts] == [server.host]
+        assert report.hosts[0].addresses == ("127.0.0.1",)
+        assert report.hosts[0].connect_seconds is not None
+        assert report.serializers_seconds > 0
+
+    def test_warmup_should_skip_connections_for_replay_transport(self) -> None:
+        client = self.get_client(transport=mt.ReplayTransport([]))
+
+        report = client.warmup()
+
+        assert report.hosts[0].host == "send.api.mailtrap.io"
+        assert report.hosts[0].dns_seconds is None
+        assert report.hosts[0].connect_seconds is None
@@ -0,0 +1,54 @@
+import threading
+import time
+from functools import partial
+
+import pytest
+
+from mailtrap._concurrency import run_concurrently
+from mailtrap._concurrency import shared_executor
+
+
+def _sleep_and_return(value: int) -> int:
+    time.sleep(0.001 * (5 - value))
+    return value
+
+
+class TestRunConcurrently:
+    def test_returns_results_in_order(self) -> None:
+        calls = [partial(_sleep_and_return, value) for value in range(5)]
+
+        assert run_concurrently(calls, max_workers=5) == [0, 1, 2, 3, 4]
+
+    def test_limits_calls_in_flight(self) -> None:
+        in_flight = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def call() -> None:
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.002)
+            with lock:
+                in_flight -= 1
+
+        run_concurrently([call] * 20, max_workers=3)
+
+        assert peak <= 3
+
+    def test_stops_submitting_after_first_error(self) -> None:
+        started = []
+
+        def call(index: int) -> None:
+            started.append(index)
+            if index == 0:
+                raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_concurrently((partial(call, index) for index in range(100)), 1)
+
+        assert started == [0]
+
+    def test_reuses_shared_executor(self) -> None:
+        assert shared_executor() is shared_executor()
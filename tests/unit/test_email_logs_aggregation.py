@@ -0,0 +1,151 @@
+from array import array
+from typing import Any
+from typing import Optional
+
+import pytest
+
+from mailtrap import email_logs_aggregation
+from mailtrap.email_logs_aggregation import EmailLogsAggregator
+from mailtrap.email_logs_aggregation import aggregate_email_logs
+from mailtrap.models.email_logs import EmailLogMessage
+from mailtrap.models.stats import SendingStats
+
+
+def _message(index: int, **overrides: Any) -> EmailLogMessage:
+    return EmailLogMessage.from_api(
+        {
+            "message_id": f"message-{index}",
+            "status": "delivered",
+            "from": "sender@example.com",
+            "to": f"user{index}@example.com",
+            "sent_at": f"2025-01-{15 + index % 2}T10:00:00Z",
+            "category": "Welcome Email",
+            "custom_variables": {},
+            "sending_stream": "transactional",
+            "sending_domain_id": 3938,
+            "opens_count": 0,
+            "clicks_count": 0,
+            **overrides,
+        }
+    )
+
+
+def _messages() -> list[EmailLogMessage]:
+    return [
+        _message(0, custom_variables={"plan": "pro"}, opens_count=2, clicks_count=1),
+        _message(1, custom_variables={"plan": "pro"}, opens_count=1),
+        _message(2, custom_variables={"plan": "pro"}, status="not_delivered"),
+        _message(3, custom_variables={"plan": "free"}),
+        _message(4, category="Reset", custom_variables={"plan": "free"}),
+        _message(
+            5,
+            category="Reset",
+            events=[
+                {
+                    "event_type": "spam",
+                    "created_at": "2025-01-16T11:00:00Z",
+                    "details": {"spam_feedback_type": "abuse"},
+                }
+            ],
+        ),
+    ]
+
+
+class TestAggregateEmailLogs:
+    @pytest.mark.parametrize("use_numpy", [None, False])
+    def test_groups_by_message_field_and_custom_variable(
+        self, use_numpy: Optional[bool]
+    ) -> None:
+        result = aggregate_email_logs(
+            _messages(),
+            group_by=["category", "custom_variables.plan"],
+            use_numpy=use_numpy,
+            batch_size=4,
+        )
+
+        assert result.keys == [
+            ("Welcome Email", "pro"),
+            ("Welcome Email", "free"),
+            ("Reset", "free"),
+            ("Reset", None),
+        ]
+        assert list(result["messages_count"]) == [3, 1, 1, 1]
+        assert result.stats("Welcome Email", "pro") == SendingStats(
+            delivery_count=2,
+            delivery_rate=2 / 3,
+            bounce_count=1,
+            bounce_rate=1 / 3,
+            open_count=2,
+            open_rate=1.0,
+            click_count=1,
+            click_rate=0.5,
+            spam_count=0,
+            spam_rate=0.0,
+        )
+        assert result.stats("Reset", None).spam_count == 1
+
+    def test_numpy_and_python_accumulation_agree(self) -> None:
+        pytest.importorskip("numpy")
+        messages = _messages() * 50
+
+        with_numpy = aggregate_email_logs(
+            messages, ["sent_date"], use_numpy=True, batch_size=7
+        )
+        without_numpy = aggregate_email_logs(
+            messages, ["sent_date"], use_numpy=False, batch_size=7
+        )
+
+        assert with_numpy.rows() == without_numpy.rows()
+        assert isinstance(without_numpy["delivery_rate"], array)
+
+    def test_rows(self) -> None:
+        result = aggregate_email_logs(_messages(), group_by=["status"])
+
+        rows = result.rows()
+
+        assert rows[1]["status"] == "not_delivered"
+        assert rows[1]["messages_count"] == 1
+        assert rows[1]["bounce_rate"] == 1.0
+        assert rows[1]["open_rate"] == 0.0
+
+    def test_groups_by_email_service_provider(self) -> None:
+        messages = [
+            _message(
+                0,
+                events=[
+                    {
+                        "event_type": "delivery",
+                        "created_at": "2025-01-15T10:00:05Z",
+                        "details": {"email_service_provider": "Google"},
+                    }
+                ],
+            ),
+            _message(1),
+        ]
+
+        result = aggregate_email_logs(messages, group_by=["email_service_provider"])
+
+        assert result.keys == [("Google",), (None,)]
+
+    def test_raises_on_unknown_field(self) -> None:
+        with pytest.raises(ValueError, match="Cannot group email logs by 'events'"):
+            aggregate_email_logs([], group_by=["events"])
+
+    def test_use_numpy_requires_numpy(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(email_logs_aggregation, "optional_numpy", lambda: None)
+
+        with pytest.raises(ImportError, match="NumPy is required"):
+            aggregate_email_logs([], group_by=["status"], use_numpy=True)
+
+
+class TestEmailLogsAggregator:
+    def test_update_accumulates_across_calls(self) -> None:
+        aggregator = EmailLogsAggregator(group_by=["category"])
+        messages = _messages()
+
+        aggregator.update(messages[:3]).update(messages[3:])
+        result = aggregator.result()
+
+        assert len(result) == 2
+        assert list(result["messages_count"]) == [4, 2]
+        assert result.stats("Reset").delivery_count == 2
@@ -0,0 +1,191 @@
+import csv
+import io
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+import responses
+
+from mailtrap import email_logs_export
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.email_logs_export import CsvEmailLogsWriter
+from mailtrap.email_logs_export import EmailLogsWriter
+from mailtrap.email_logs_export import NdjsonEmailLogsWriter
+from mailtrap.email_logs_export import export_email_logs
+from mailtrap.http import HttpClient
+from mailtrap.models.email_logs import EmailLogMessage
+
+ACCOUNT_ID = "321"
+BASE_EMAIL_LOGS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/email_logs"
+
+
+def _message(index: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        "message_id": f"message-{index}",
+        "status": "delivered",
+        "subject": f"Subject {index}",
+        "from": "sender@example.com",
+        "to": f"user{index}@example.com",
+        "sent_at": f"2025-01-15T10:{index:02d}:00Z",
+        "client_ip": None,
+        "category": "Welcome Email",
+        "custom_variables": {"user_id": index, "plan": "pro"},
+        "sending_stream": "transactional",
+        "sending_domain_id": 3938,
+        "template_id": None,
+        "template_variables": {},
+        "opens_count": index,
+        "clicks_count": 0,
+        **overrides,
+    }
+
+
+def _messages(count: int) -> list[EmailLogMessage]:
+    return [EmailLogMessage.from_api(_message(index)) for index in range(count)]
+
+
+class TestEmailLogsWriter:
+    def test_base_writer_requires_write_rows(self) -> None:
+        with pytest.raises(TypeError, match="write_rows"):
+            EmailLogsWriter()  # type: ignore[abstract]
+
+    def test_row_flattens_custom_variables_and_events(self) -> None:
+        message = EmailLogMessage.from_api(
+            _message(
+                1,
+                events=[
+                    {
+                        "event_type": "delivery",
+                        "created_at": "2025-01-15T10:01:05Z",
+                        "details": {"sending_ip": "192.0.2.1"},
+                    },
+                    {
+                        "event_type": "open",
+                        "created_at": "2025-01-15T10:05:00Z",
+                        "details": None,
+                    },
+                    {
+                        "event_type": "open",
+                        "created_at": "2025-01-15T10:09:00Z",
+                        "details": None,
+                    },
+                ],
+            )
+        )
+        writer = NdjsonEmailLogsWriter(io.StringIO(), custom_variable_keys=["user_id"])
+
+        row = writer.row(message)
+
+        assert list(row) == writer.columns
+        assert row["from"] == "sender@example.com"
+        assert row["custom_variables.user_id"] == "1"
+        assert row["custom_variables"] == '{"plan":"pro"}'
+        assert row["template_variables"] is None
+        assert row["events_count"] == 3
+        assert row["last_event_type"] == "open"
+        assert row["last_event_at"] == "2025-01-15T10:09:00Z"
+        assert row["delivery_at"] == "2025-01-15T10:01:05Z"
+        assert row["open_at"] == "2025-01-15T10:05:00Z"
+        assert row["click_at"] is None
+
+    def test_write_flushes_in_batches(self) -> None:
+        batches: list[int] = []
+
+        class RecordingWriter(NdjsonEmailLogsWriter):
+            def write_rows(self, rows: list[dict[str, Any]]) -> None:
+                batches.append(len(rows))
+                super().write_rows(rows)
+
+        writer = RecordingWriter(io.StringIO())
+
+        written = writer.write(iter(_messages(5)), batch_size=2)
+
+        assert written == 5
+        assert batches == [2, 2, 1]
+
+
+class TestExportEmailLogs:
+    def test_ndjson(self) -> None:
+        output = io.StringIO()
+
+        count = export_email_logs(_messages(3), output, custom_variable_keys=["plan"])
+
+        rows = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert count == 3
+        assert [row["message_id"] for row in rows] == [
+            "message-0",
+            "message-1",
+            "message-2",
+        ]
+        assert rows[0]["custom_variables.plan"] == "pro"
+        assert rows[0]["custom_variables"] == '{"user_id":0}'
+
+    def test_csv_to_path(self, tmp_path: Path) -> None:
+        path = tmp_path / "logs.csv"
+
+        count = export_email_logs(_messages(2), path, output_format="csv")
+
+        with open(path, newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file)
+            rows = list(reader)
+        assert count == 2
+        assert reader.fieldnames == CsvEmailLogsWriter(io.StringIO()).columns
+        assert rows[1]["to"] == "user1@example.com"
+        assert rows[1]["opens_count"] == "1"
+        assert rows[1]["client_ip"] == ""
+
+    @responses.activate
+    def test_streams_pages_from_api(self) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={
+                "messages": [_message(0), _message(1)],
+                "total_count": 3,
+                "next_page_cursor": "cursor-1",
+            },
+            match=[responses.matchers.query_param_matcher({})],
+        )
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json={"messages": [_message(2)], "total_count": 3, "next_page_cursor": None},
+            match=[responses.matchers.query_param_matcher({"search_after": "cursor-1"})],
+        )
+        api = EmailLogsApi(client=HttpClient(GENERAL_HOST), account_id=ACCOUNT_ID)
+        output = io.StringIO()
+
+        count = export_email_logs(api.iter_messages(), output, output_format="csv")
+
+        assert count == 3
+        assert len(output.getvalue().splitlines()) == 4
+
+    def test_raises_on_unknown_format(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported export format 'xml'"):
+            export_email_logs(
+                [], io.StringIO(), output_format="xml"  # type: ignore[arg-type]
+            )
+
+    def test_parquet_requires_pyarrow(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        monkeypatch.setattr(email_logs_export, "optional_module", lambda name: None)
+
+        with pytest.raises(ImportError, match="pyarrow is required"):
+            export_email_logs(
+                _messages(1), tmp_path / "logs.parquet", output_format="parquet"
+            )
+
+    def test_parquet(self, tmp_path: Path) -> None:
+        parquet = pytest.importorskip("pyarrow.parquet")
+        path = tmp_path / "logs.parquet"
+
+        count = export_email_logs(
+            _messages(5), path, output_format="parquet", batch_size=2
+        )
+
+        file = parquet.ParquetFile(path)
+        assert count == 5
+        assert file.metadata.num_row_groups == 3
+        assert file.schema_arrow.names == NdjsonEmailLogsWriter(io.StringIO()).columns
+        assert file.read().column("opens_count").to_pylist() == [0, 1, 2, 3, 4]
@@ -0,0 +1,190 @@
+from typing import Any
+
+import pytest
+import responses
+
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.email_logs_index import EmailLogsIndex
+from mailtrap.exceptions import APIError
+from mailtrap.http import HttpClient
+from mailtrap.models.email_logs import EmailLogsListFilters
+from mailtrap.models.email_logs import filter_ci_contain
+from mailtrap.models.email_logs import filter_ci_equal
+from mailtrap.models.email_logs import filter_events_include
+from mailtrap.models.email_logs import filter_numeric
+from mailtrap.models.email_logs import filter_sending_domain_id_equal
+from mailtrap.models.email_logs import filter_status_equal
+from mailtrap.models.email_logs import filter_string_not_empty
+from mailtrap.models.email_logs import filter_string_not_equal
+
+ACCOUNT_ID = "321"
+BASE_EMAIL_LOGS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/email_logs"
+
+
+def _message(index: int, **overrides: Any) -> dict[str, Any]:
+    return {
+        "message_id": f"message-{index}",
+        "status": "delivered",
+        "subject": f"Subject {index}",
+        "from": "sender@example.com",
+        "to": f"user{index}@example.com",
+        "sent_at": f"2025-01-15T10:{index:02d}:00Z",
+        "client_ip": None,
+        "category": "Welcome Email",
+        "custom_variables": {},
+        "sending_stream": "transactional",
+        "sending_domain_id": 3938,
+        "template_id": None,
+        "template_variables": {},
+        "opens_count": index,
+        "clicks_count": 0,
+        **overrides,
+    }
+
+
+def _page(messages: list[dict[str, Any]], cursor: Any = None) -> dict[str, Any]:
+    return {"messages": messages, "total_count": 10, "next_page_cursor": cursor}
+
+
+@pytest.fixture
+def email_logs_api() -> EmailLogsApi:
+    return EmailLogsApi(client=HttpClient(GENERAL_HOST), account_id=ACCOUNT_ID)
+
+
+@pytest.fixture
+def index(email_logs_api: EmailLogsApi) -> EmailLogsIndex:
+    return EmailLogsIndex(email_logs_api)
+
+
+class TestEmailLogsIndex:
+    @responses.activate
+    def test_sync_should_store_all_pages(self, index: EmailLogsIndex) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json=_page([_message(3), _message(2)], cursor="c1"),
+            match=[responses.matchers.query_param_matcher({})],
+        )
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json=_page([_message(1)]),
+            match=[responses.matchers.query_param_matcher({"search_after": "c1"})],
+        )
+
+        assert index.sync() == 3
+        assert len(index) == 3
+        assert [m.message_id for m in index.query()] == [
+            "message-3",
+            "message-2",
+            "message-1",
+        ]
+
+    @responses.activate
+    def test_sync_should_resume_from_latest_sent_at(self, index: EmailLogsIndex) -> None:
+        responses.get(BASE_EMAIL_LOGS_URL, json=_page([_message(5), _message(4)]))
+        index.sync()
+        responses.calls.reset()
+
+        assert index.sync() == 2
+
+        assert responses.calls[0].request.params == {
+            "filters[sent_after]": "2025-01-15T09:05:00Z"
+        }
+        assert len(index) == 2
+
+    @responses.activate
+    def test_sync_should_resume_interrupted_run_from_cursor(
+        self, index: EmailLogsIndex
+    ) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json=_page([_message(3)], cursor="c1"),
+            match=[responses.matchers.query_param_matcher({})],
+        )
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            status=500,
+            json={"error": "Internal server error"},
+            match=[responses.matchers.query_param_matcher({"search_after": "c1"})],
+        )
+        with pytest.raises(APIError):
+            index.sync()
+
+        responses.replace(
+            responses.GET,
+            BASE_EMAIL_LOGS_URL,
+            json=_page([_message(2)]),
+            match=[responses.matchers.query_param_matcher({"search_after": "c1"})],
+        )
+
+        assert index.sync() == 1
+        assert len(index) == 2
+
+    @responses.activate
+    def test_query_should_apply_filters_locally(self, index: EmailLogsIndex) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json=_page(
+                [
+                    _message(4, status="not_delivered", category=None),
+                    _message(3, to="Alice@Example.com", sending_domain_id=1),
+                    _message(2, subject="50%_off"),
+                    _message(1),
+                ]
+            ),
+        )
+        index.sync()
+
+        def ids(**filters: Any) -> list[str]:
+            result = index.query(EmailLogsListFilters(**filters))
+            return [message.message_id for message in result]
+
+        assert ids(status=filter_status_equal("not_delivered")) == ["message-4"]
+        assert ids(to=filter_ci_equal("alice@example.com")) == ["message-3"]
+        assert ids(to=filter_ci_contain("ALICE")) == ["message-3"]
+        assert ids(subject=filter_ci_contain("%_")) == ["message-2"]
+        assert ids(sending_domain_id=filter_sending_domain_id_equal([1])) == ["message-3"]
+        assert ids(category=filter_string_not_empty()) == [
+            "message-3",
+            "message-2",
+            "message-1",
+        ]
+        assert ids(category=filter_string_not_equal("Welcome Email")) == ["message-4"]
+        assert ids(opens_count=filter_numeric("greater_than", 2)) == [
+            "message-4",
+            "message-3",
+        ]
+        assert ids(
+            sent_after="2025-01-15T10:01:00Z", sent_before="2025-01-15T10:04:00Z"
+        ) == ["message-3", "message-2"]
+        assert len(index.query(limit=2)) == 2
+
+    @responses.activate
+    def test_query_should_order_and_filter_by_time_across_precisions(
+        self, index: EmailLogsIndex
+    ) -> None:
+        responses.get(
+            BASE_EMAIL_LOGS_URL,
+            json=_page(
+                [
+                    _message(1, sent_at="2025-01-15T10:00:00.500Z"),
+                    _message(2, sent_at="2025-01-15T10:00:00Z"),
+                    _message(3, sent_at="2025-01-15T12:00:00.25+02:00"),
+                ]
+            ),
+        )
+        index.sync()
+
+        def ids(**filters: Any) -> list[str]:
+            result = index.query(EmailLogsListFilters(**filters))
+            return [message.message_id for message in result]
+
+        # 12:00:00.25+02:00 is 10:00:00.250 UTC
+        assert ids() == ["message-1", "message-3", "message-2"]
+        assert ids(sent_after="2025-01-15T10:00:00Z") == ["message-1", "message-3"]
+        assert ids(sent_before="2025-01-15T10:00:00.3Z") == ["message-3", "message-2"]
+        assert index.query()[0].sent_at == "2025-01-15T10:00:00.500Z"
+
+    def test_query_should_reject_detail_only_fields(self, index: EmailLogsIndex) -> None:
+        with pytest.raises(ValueError, match="'events' is not supported locally"):
+            index.query(EmailLogsListFilters(events=filter_events_include("open")))
@@ -0,0 +1,229 @@
+from collections.abc import Iterator
+
+import pytest
+import requests
+
+import mailtrap as mt
+from mailtrap.api.resources.contact_imports import ContactImportsApi
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.api.resources.messages import MessagesApi
+from mailtrap.api.resources.suppressions import SuppressionsApi
+from mailtrap.exceptions import APIError
+from mailtrap.exceptions import AuthorizationError
+from mailtrap.http import HttpClient
+from mailtrap.models.contacts import ImportContactParams
+from mailtrap.testing import FakeMailtrapServer
+
+ACCOUNT_ID = "1"
+INBOX_ID = 42
+
+
+@pytest.fixture
+def server() -> Iterator[FakeMailtrapServer]:
+    with FakeMailtrapServer(email_logs_count=25, email_logs_page_size=10, seed=0) as fake:
+        yield fake
+
+
+def _mail() -> mt.Mail:
+    return mt.Mail(
+        sender=mt.Address(email="sender@example.com"),
+        to=[mt.Address(email="a@example.com"), mt.Address(email="b@example.com")],
+        subject="Hello",
+        text="Hi",
+    )
+
+
+class TestSending:
+    def test_send(self, server: FakeMailtrapServer) -> None:
+        client = mt.MailtrapClient(token="test", api_host=server.host)
+
+        response = client.send(_mail())
+
+        assert response["success"] is True
+        assert len(response["message_ids"]) == 2
+        assert server.sent_count == 1
+        assert server.sent_messages[0]["subject"] == "Hello"
+
+    def test_batch_send_reports_invalid_requests(
+        self, server: FakeMailtrapServer
+    ) -> None:
+        client = mt.MailtrapClient(token="test", api_host=server.host)
+
+        response = client.batch_send(
+            mt.BatchSendEmailParams(
+                base=mt.BatchMail(
+                    sender=mt.Address(email="sender@example.com"), subject="Hello"
+                ),
+                requests=[
+                    mt.BatchEmailRequest(to=[mt.Address(email="a@example.com")]),
+                    mt.BatchEmailRequest(to=[]),
+                ],
+            )
+        )
+
+        assert [item["success"] for item in response["responses"]] == [True, False]
+        assert server.sent_count == 1
+
+    def test_send_rejects_mail_without_sender(self, server: FakeMailtrapServer) -> None:
+        client = HttpClient(server.host)
+
+        with pytest.raises(APIError, match="'from' address is required"):
+            client.post("/api/send", json={"to": [{"email": "a@example.com"}]})
+
+
+class TestEmailLogs:
+    def test_iter_pages_follows_cursor(self, server: FakeMailtrapServer) -> None:
+        api = EmailLogsApi(HttpClient(server.host), ACCOUNT_ID)
+
+        pages = list(api.iter_pages())
+
+        assert [len(page.messages) for page in pages] == [10, 10, 5]
+        assert pages[0].total_count == 25
+        assert pages[-1].next_page_cursor is None
+        message_ids = [message.message_id for page in pages for message in page.messages]
+        assert len(set(message_ids)) == 25
+
+    def test_get_by_id_includes_events(self, server: FakeMailtrapServer) -> None:
+        api = EmailLogsApi(HttpClient(server.host), ACCOUNT_ID)
+        message = api.get_list().messages[2]
+
+        details = api.get_by_id(message.message_id)
+
+        assert details.message_id == message.message_id
+        assert [event.event_type for event in details.events] == [
+            "delivery",
+            "open",
+            "open",
+        ]
+
+    def test_get_list_applies_filters(self, server: FakeMailtrapServer) -> None:
+        client = mt.MailtrapClient(
+            token="test", account_id=ACCOUNT_ID, general_api_host=server.host
+        )
+        filters = mt.EmailLogsListFilters(
+            status={"operator": "equal", "value": ["not_delivered"]},
+            subject={"operator": "ci_contain", "value": "message 1"},
+        )
+
+        response = client.email_logs_api.email_logs.get_list(filters=filters)
+
+        assert [message.subject for message in response.messages] == ["Message 19"]
+        assert response.total_count == 1
+
+    def test_iter_pages_applies_sent_at_range(self, server: FakeMailtrapServer) -> None:
+        api = EmailLogsApi(HttpClient(server.host), ACCOUNT_ID)
+        filters = mt.EmailLogsListFilters(
+            sent_after="2025-01-15T09:40:00Z", sent_before="2025-01-15T09:58:00+00:00"
+        )
+
+        pages = list(api.iter_pages(filters=filters))
+
+        assert [len(page.messages) for page in pages] == [10, 7]
+        assert pages[0].total_count == 17
+        assert pages[0].messages[0].subject == "Message 3"
+        assert pages[-1].messages[-1].subject == "Message 19"
+
+    def test_get_list_rejects_unsupported_filter(
+        self, server: FakeMailtrapServer
+    ) -> None:
+        api = EmailLogsApi(HttpClient(server.host), ACCOUNT_ID)
+        filters = mt.EmailLogsListFilters(events={"operator": "include_event"})
+
+        with pytest.raises(APIError, match="events is not supported"):
+            api.get_list(filters=filters)
+
+
+class TestAccountResources:
+    def test_suppressions(self, server: FakeMailtrapServer) -> None:
+        api = SuppressionsApi(HttpClient(server.host), ACCOUNT_ID)
+
+        suppressions = api.get_list(email="suppressed3@example.com")
+        deleted = api.delete(suppressions[0].id)
+
+        assert deleted.email == "suppressed3@example.com"
+        assert api.get_list(email="suppressed3@example.com") == []
+
+    def test_contact_imports(self, server: FakeMailtrapServer) -> None:
+        api = ContactImportsApi(HttpClient(server.host), ACCOUNT_ID)
+
+        created = api.import_contacts(
+            [ImportContactParams(email=f"user{i}@example.com") for i in range(3)]
+        )
+        contact_import = api.get_by_id(created.id)
+
+        assert created.status == "started"
+        assert contact_import.status == "finished"
+        assert contact_import.created_contacts_count == 3
+
+    def test_sandbox_messages(self, server: FakeMailtrapServer) -> None:
+        api = MessagesApi(HttpClient(server.host), ACCOUNT_ID)
+
+        first_page = api.get_list(INBOX_ID)
+        second_page = api.get_list(INBOX_ID, last_id=first_page[-1].id)
+        message = api.show_message(INBOX_ID, second_page[0].id)
+
+        assert len(first_page) == 30
+        assert second_page[0].id < first_page[-1].id
+        assert message.inbox_id == INBOX_ID
+        assert "Subject: " in api.get_raw_message(INBOX_ID, message.id)
+        assert api.get_mail_headers(INBOX_ID, message.id)["subject"] == message.subject
+        assert api.get_spam_report(INBOX_ID, message.id).spam is False
+
+
+class TestFaultInjection:
+    def test_rate_limit_injection(self) -> None:
+        with FakeMailtrapServer(rate_limit_rate=1.0, retry_after=7) as server:
+            client = HttpClient(server.host)
+
+            with pytest.raises(APIError) as exc_info:
+                client.get(f"/api/accounts/{ACCOUNT_ID}/email_logs")
+
+            assert exc_info.value.status == 429
+            response = requests.get(f"{server.host}/api/accounts/1/email_logs")
+            assert response.headers["Retry-After"] == "7"
+            assert server.statuses[429] == 2
+
+    def test_error_rate_is_seeded(self) -> None:
+        def statuses() -> list[int]:
+            with FakeMailtrapServer(error_rate=0.5, seed=1) as server:
+                client = HttpClient(server.host)
+                for _ in range(20):
+                    try:
+                        client.get("/api/accounts/1/suppressions")
+                    except APIError:
+                        pass
+                return [server.statuses[200], server.statuses[500]]
+
+        first = statuses()
+
+        assert first == statuses()
+        assert 0 < first[1] < 20
+
+    def test_latency(self) -> None:
+        with FakeMailtrapServer(latency=0.05) as server:
+            response = requests.get(f"{server.host}/api/accounts/1/suppressions")
+
+        assert response.elapsed.total_seconds() >= 0.05
+
+    def test_token_is_checked(self) -> None:
+        with FakeMailtrapServer(token="secret") as server:
+            with pytest.raises(AuthorizationError):
+                HttpClient(server.host).get("/api/accounts/1/suppressions")
+
+            client = HttpClient(server.host, headers={"Authorization": "Bearer secret"})
+            assert client.get("/api/accounts/1/suppressions")
+
+    def test_connections_are_kept_alive(self, server: FakeMailtrapServer) -> None:
+        client = HttpClient(server.host)
+
+        for _ in range(5):
+            client.get("/api/accounts/1/suppressions")
+
+        assert server.connections == 1
+        assert server.requests == 5
+
+    def test_unknown_route(self, server: FakeMailtrapServer) -> None:
+        with pytest.raises(APIError) as exc_info:
+            HttpClient(server.host).get("/api/unknown")
+
+        assert exc_info.value.status == 404
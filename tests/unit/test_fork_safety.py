@@ -0,0 +1,93 @@
+import multiprocessing
+import os
+from concurrent.futures import Future
+from typing import Any
+
+import pytest
+
+import mailtrap as mt
+from mailtrap.cache import MemoryCache
+from mailtrap.cache import ResponseCache
+from mailtrap.http import HttpClient
+from mailtrap.testing import FakeMailtrapServer
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(os, "fork"), reason="fork is not available on this platform"
+)
+
+WORKERS = 4
+
+# Created before the pool forks, as a prefork server would at import time
+_client: Any = None
+_cache: Any = None
+
+
+def _mail(index: int) -> mt.Mail:
+    return mt.Mail(
+        sender=mt.Address(email="sender@example.com"),
+        to=[mt.Address(email=f"user{index}@example.com")],
+        subject=f"Message {index}",
+        text="Hi",
+    )
+
+
+def _send(index: int) -> tuple[int, bool]:
+    response = _client.send(_mail(index))
+    return os.getpid(), response["success"] is True
+
+
+def _inherited_pools(_: int) -> int:
+    adapter = _client._session.get_adapter("https://mailtrap.io")
+    return len(adapter.poolmanager.pools)
+
+
+def _get_or_fetch(_: int) -> bytes:
+    return bytes(_cache.get_or_fetch("key", lambda: b"child"))
+
+
+class TestForkSafety:
+    def test_child_starts_with_empty_pools(self) -> None:
+        global _client
+        with FakeMailtrapServer() as server:
+            _client = HttpClient(server.host)
+            _client.get("/api/accounts/1/suppressions")
+            context = multiprocessing.get_context("fork")
+
+            with context.Pool(1) as pool:
+                assert pool.map(_inherited_pools, [0]) == [0]
+
+            adapter = _client._session.get_adapter("https://mailtrap.io")
+            assert len(adapter.poolmanager.pools) == 1
+
+    def test_global_client_sends_from_forked_workers(self) -> None:
+        global _client
+        with FakeMailtrapServer() as server:
+            _client = mt.MailtrapClient(token="test", api_host=server.host)
+            assert _client.send(_mail(0))["success"] is True
+            context = multiprocessing.get_context("fork")
+
+            with context.Pool(WORKERS) as pool:
+                results = pool.map(_send, range(1, 41))
+
+            assert all(success for _, success in results)
+            assert os.getpid() not in {pid for pid, _ in results}
+            assert server.sent_count == 41
+            # The parent still uses its own, untouched connection
+            connections = server.connections
+            assert _client.send(_mail(41))["success"] is True
+            assert server.connections == connections
+
+    def test_child_resets_cache_locks_and_flights(self) -> None:
+        global _cache
+        backend = MemoryCache()
+        _cache = ResponseCache(backend=backend)
+        # Another thread of the parent is fetching "key" and holds the locks
+        _cache._in_flight["key"] = Future()
+        context = multiprocessing.get_context("fork")
+
+        with _cache._lock, backend._lock:
+            pool = context.Pool(1)
+
+        with pool:
+            assert pool.map_async(_get_or_fetch, [0]).get(timeout=10) == [b"child"]
+        assert "key" in _cache._in_flight
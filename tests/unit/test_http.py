@@ -1,7 +1,11 @@
+import gc
+import io
 import json
+from pathlib import Path
 from unittest.mock import Mock
 
 import pytest
+import responses
 
 from mailtrap.exceptions import APIError
 from mailtrap.exceptions import AuthorizationError
@@ -102,3 +106,101 @@ class TestHttpClient:
 
         assert exc_info.value.status == 500
         assert "Internal server error" in exc_info.value.errors
+
+    @pytest.mark.parametrize(
+        "host, expected",
+        [
+            ("test.mailtrap.com", "https://test.mailtrap.com/api/send"),
+            ("http://127.0.0.1:8080", "http://127.0.0.1:8080/api/send"),
+            ("http://127.0.0.1:8080/", "http://127.0.0.1:8080/api/send"),
+        ],
+    )
+    def test_url_should_default_to_https_and_keep_explicit_scheme(
+        self, host: str, expected: str
+    ) -> None:
+        assert HttpClient(host)._url("/api/send") == expected
+
+    @responses.activate
+    def test_stream_should_yield_body_in_chunks(self) -> None:
+        responses.get("https://test.mailtrap.com/body.raw", body=b"0123456789")
+        client = HttpClient("test.mailtrap.com")
+
+        chunks = list(client.stream("/body.raw", chunk_size=4))
+
+        assert chunks == [b"0123", b"4567", b"89"]
+
+    @responses.activate
+    def test_stream_should_raise_api_errors_eagerly(self) -> None:
+        responses.get(
+            "https://test.mailtrap.com/body.raw",
+            status=404,
+            json={"error": "Not Found"},
+        )
+        client = HttpClient("test.mailtrap.com")
+
+        with pytest.raises(APIError) as exc_info:
+            client.stream("/body.raw")
+
+        assert exc_info.value.status == 404
+
+    @responses.activate
+    def test_stream_should_release_connection_when_dropped_unread(self) -> None:
+        responses.get("https://test.mailtrap.com/body.raw", body=b"0123456789")
+        client = HttpClient("test.mailtrap.com")
+
+        chunks = client.stream("/body.raw")
+        raw = chunks._response.raw
+        del chunks
+        gc.collect()
+
+        assert raw.closed
+
+    @responses.activate
+    def test_stream_should_release_connection_on_close(self) -> None:
+        responses.get("https://test.mailtrap.com/body.raw", body=b"0123456789")
+        client = HttpClient("test.mailtrap.com")
+
+        with client.stream("/body.raw", chunk_size=4) as chunks:
+            assert next(chunks) == b"0123"
+
+        assert chunks._response.raw.closed
+        assert list(chunks) == []
+
+    @responses.activate
+    def test_download_should_write_body_to_file_object(self) -> None:
+        responses.get("https://test.mailtrap.com/body.raw", body=b"raw body")
+        client = HttpClient("test.mailtrap.com")
+        buffer = io.BytesIO()
+
+        written = client.download("/body.raw", buffer)
+
+        assert written == 8
+        assert buffer.getvalue() == b"raw body"
+
+    @responses.activate
+    def test_download_should_write_body_to_path(self, tmp_path: Path) -> None:
+        responses.get("https://test.mailtrap.com/body.raw", body=b"raw body")
+        client = HttpClient("test.mailtrap.com")
+        destination = tmp_path / "message.eml"
+
+        written = client.download("/body.raw", destination)
+
+        assert written == 8
+        assert destination.read_bytes() == b"raw body"
+        assert list(tmp_path.iterdir()) == [destination]
+
+    @responses.activate
+    def test_download_should_not_leave_partial_file_on_error(
+        self, tmp_path: Path
+    ) -> None:
+        responses.get(
+            "https://test.mailtrap.com/body.raw",
+            status=500,
+            json={"error": "Internal server error"},
+        )
+        client = HttpClient("test.mailtrap.com")
+
+        with pytest.raises(APIError):
+            client.download("/body.raw", tmp_path / "message.eml")
+
+        assert list(tmp_path.iterdir()) == []
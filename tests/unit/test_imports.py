@@ -0,0 +1,79 @@
+import subprocess
+import sys
+
+import pytest
+
+import mailtrap
+
+
+def _imported_modules(code: str) -> set[str]:
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import sys\n{code}\nprint(*sorted(sys.modules))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(output.split())
+
+
+class TestLazyImports:
+    def test_sending_imports_only_sending_models(self) -> None:
+        modules = _imported_modules(
+            "import mailtrap as mt\n"
+            "client = mt.MailtrapClient(token='test')\n"
+            "mail = mt.Mail(sender=mt.Address(email='a@example.com'), "
+            "to=[mt.Address(email='b@example.com')], subject='Hi', text='Hi')\n"
+            "mail.api_data"
+        )
+
+        assert "mailtrap.api.sending" in modules
+        assert "mailtrap.models.mail" in modules
+        assert "mailtrap.api.contacts" not in modules
+        assert "mailtrap.models.contacts" not in modules
+        assert "mailtrap.models.email_logs" not in modules
+
+    def test_api_facades_are_imported_on_access(self) -> None:
+        modules = _imported_modules(
+            "import mailtrap as mt\n"
+            "mt.MailtrapClient(token='test', account_id='1').contacts_api"
+        )
+
+        assert "mailtrap.api.contacts" in modules
+        assert "mailtrap.api.email_logs" not in modules
+
+    @pytest.mark.parametrize("name", mailtrap.__all__)
+    def test_public_names_resolve(self, name: str) -> None:
+        assert getattr(mailtrap, name) is not None
+        assert name in dir(mailtrap)
+
+    def test_submodules_are_attributes(self) -> None:
+        assert mailtrap.models.mail.Mail is mailtrap.Mail
+
+    def test_unknown_attribute(self) -> None:
+        with pytest.raises(AttributeError, match="has no attribute 'Unknown'"):
+            mailtrap.Unknown
+
+
+class TestDeferredSchemas:
+    def test_model_schemas_are_built_on_first_use(self) -> None:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "from mailtrap.models.messages import AnalysisReportResponse\n"
+                "from mailtrap.models.messages import SpamReport\n"
+                "print(SpamReport.__pydantic_complete__)\n"
+                "AnalysisReportResponse(report={'status': 'success', 'errors': []})\n"
+                "print(SpamReport.__pydantic_complete__, "
+                "AnalysisReportResponse.__pydantic_complete__)",
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+
+        assert output.split() == ["False", "False", "True"]
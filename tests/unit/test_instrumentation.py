@@ -0,0 +1,218 @@
+from typing import Any
+
+import pytest
+import requests
+import responses
+
+import mailtrap as mt
+from mailtrap import instrumentation
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import HttpClient
+from mailtrap.instrumentation import Instrumentation
+from mailtrap.instrumentation import OpenTelemetryInstrumentation
+from mailtrap.instrumentation import PrometheusInstrumentation
+from mailtrap.instrumentation import RequestEnd
+from mailtrap.instrumentation import RequestStart
+from mailtrap.instrumentation import template_path
+
+MESSAGE_ID = "a1b2c3d4-e5f6-7890-abcd-ef1234567890"
+EMAIL_LOGS_URL = f"https://{GENERAL_HOST}/api/accounts/321/email_logs"
+
+
+class RecordingInstrumentation(Instrumentation):
+    def __init__(self) -> None:
+        self.events: list[Any] = []
+
+    def on_request_start(self, event: RequestStart) -> Any:
+        self.events.append(event)
+        return f"context-{len(self.events)}"
+
+    def on_request_end(self, event: RequestEnd, context: Any) -> None:
+        self.events.append((event, context))
+
+
+class FakeMetric:
+    def __init__(self) -> None:
+        self.observations: list[tuple[tuple[str, ...], float]] = []
+        self._labels: tuple[str, ...] = ()
+
+    def labels(self, *labels: str) -> "FakeMetric":
+        self._labels = labels
+        return self
+
+    def observe(self, value: float) -> None:
+        self.observations.append((self._labels, value))
+
+    def inc(self) -> None:
+        self.observations.append((self._labels, 1))
+
+
+class FakeSpan:
+    def __init__(self, name: str, attributes: dict[str, Any]) -> None:
+        self.name = name
+        self.attributes = dict(attributes)
+        self.exceptions: list[BaseException] = []
+        self.ended = False
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException) -> None:
+        self.exceptions.append(exception)
+
+    def end(self) -> None:
+        self.ended = True
+
+
+class FakeTracer:
+    def __init__(self) -> None:
+        self.spans: list[FakeSpan] = []
+
+    def start_span(
+        self, name: str, attributes: dict[str, Any], **kwargs: Any
+    ) -> FakeSpan:
+        span = FakeSpan(name, attributes)
+        self.spans.append(span)
+        return span
+
+
+class TestTemplatePath:
+    @pytest.mark.parametrize(
+        "path, expected",
+        [
+            ("/api/accounts/321/email_logs", "/api/accounts/{id}/email_logs"),
+            (
+                f"/api/accounts/321/email_logs/{MESSAGE_ID}",
+                "/api/accounts/{id}/email_logs/{id}",
+            ),
+            ("/api/send/42?x=1", "/api/send/{id}"),
+            ("/api/accounts", "/api/accounts"),
+        ],
+    )
+    def test_replaces_id_segments(self, path: str, expected: str) -> None:
+        assert template_path(path) == expected
+
+
+class TestHttpClientInstrumentation:
+    @responses.activate
+    def test_emits_start_and_end_events(self) -> None:
+        responses.post(EMAIL_LOGS_URL, json={"ok": True}, status=201)
+        hooks = RecordingInstrumentation()
+        client = HttpClient(GENERAL_HOST, instrumentation=hooks)
+
+        client.post("/api/accounts/321/email_logs", json={"a": 1})
+
+        start, (end, context) = hooks.events
+        assert start.method == "POST"
+        assert start.host == GENERAL_HOST
+        assert start.path == "/api/accounts/{id}/email_logs"
+        assert context == "context-1"
+        assert end.status == 201
+        assert end.bytes_out == len(b'{"a": 1}')
+        assert end.bytes_in == len(b'{"ok": true}')
+        assert end.duration >= 0
+        assert end.error_class is None
+
+    @responses.activate
+    def test_reports_http_errors(self) -> None:
+        responses.get(EMAIL_LOGS_URL, json={"error": "Not found"}, status=404)
+        hooks = RecordingInstrumentation()
+        client = HttpClient(GENERAL_HOST, instrumentation=[hooks])
+
+        with pytest.raises(APIError):
+            client.get("/api/accounts/321/email_logs")
+
+        end, _ = hooks.events[1]
+        assert end.status == 404
+        assert end.error_class == "http_404"
+
+    @responses.activate
+    def test_reports_connection_errors(self) -> None:
+        responses.get(EMAIL_LOGS_URL, body=requests.ConnectionError("refused"))
+        hooks = RecordingInstrumentation()
+        client = HttpClient(GENERAL_HOST, instrumentation=hooks)
+
+        with pytest.raises(requests.ConnectionError):
+            client.get("/api/accounts/321/email_logs")
+
+        end, _ = hooks.events[1]
+        assert end.status is None
+        assert end.error_class == "ConnectionError"
+
+    @responses.activate
+    def test_stream_ends_after_body_is_consumed(self) -> None:
+        responses.get(EMAIL_LOGS_URL, body=b"x" * 10)
+        hooks = RecordingInstrumentation()
+        client = HttpClient(GENERAL_HOST, instrumentation=hooks)
+
+        chunks = client.stream("/api/accounts/321/email_logs", chunk_size=4)
+        assert len(hooks.events) == 1
+        b"".join(chunks)
+
+        end, _ = hooks.events[1]
+        assert end.bytes_in == 10
+
+    @responses.activate
+    def test_mailtrap_client_passes_instrumentation(self) -> None:
+        responses.get(f"https://{GENERAL_HOST}/api/accounts", json=[])
+        hooks = RecordingInstrumentation()
+        client = mt.MailtrapClient(token="token", instrumentation=hooks)
+
+        client.general_api.accounts.get_list()
+
+        assert hooks.events[0].path == "/api/accounts"
+
+
+class TestPrometheusInstrumentation:
+    @responses.activate
+    def test_observes_duration_size_and_errors(self) -> None:
+        responses.get(EMAIL_LOGS_URL, json={"error": "Forbidden"}, status=403)
+        duration, size, errors = FakeMetric(), FakeMetric(), FakeMetric()
+        client = HttpClient(
+            GENERAL_HOST,
+            instrumentation=PrometheusInstrumentation(
+                duration_histogram=duration, size_histogram=size, error_counter=errors
+            ),
+        )
+
+        with pytest.raises(APIError):
+            client.get("/api/accounts/321/email_logs")
+
+        labels = ("GET", "/api/accounts/{id}/email_logs", "403")
+        assert duration.observations[0][0] == labels
+        assert size.observations == [(labels, len(b'{"error": "Forbidden"}'))]
+        assert errors.observations == [
+            (("GET", "/api/accounts/{id}/email_logs", "http_403"), 1)
+        ]
+
+    def test_requires_prometheus_client(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(instrumentation, "optional_module", lambda name: None)
+
+        with pytest.raises(ImportError, match="prometheus_client is required"):
+            PrometheusInstrumentation()
+
+
+class TestOpenTelemetryInstrumentation:
+    @responses.activate
+    def test_wraps_requests_in_spans(self) -> None:
+        responses.get(f"{EMAIL_LOGS_URL}/{MESSAGE_ID}", json={}, status=200)
+        tracer = FakeTracer()
+        client = HttpClient(
+            GENERAL_HOST, instrumentation=OpenTelemetryInstrumentation(tracer=tracer)
+        )
+
+        client.get(f"/api/accounts/321/email_logs/{MESSAGE_ID}")
+
+        (span,) = tracer.spans
+        assert span.name == "GET /api/accounts/{id}/email_logs/{id}"
+        assert span.attributes["http.request.method"] == "GET"
+        assert span.attributes["http.response.status_code"] == 200
+        assert "error.type" not in span.attributes
+        assert span.ended
+
+    def test_requires_opentelemetry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(instrumentation, "optional_module", lambda name: None)
+
+        with pytest.raises(ImportError, match="opentelemetry-api is required"):
+            OpenTelemetryInstrumentation()
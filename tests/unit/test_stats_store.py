@@ -0,0 +1,151 @@
+import json
+from datetime import date
+from datetime import timedelta
+from pathlib import Path
+from typing import Any
+
+import pytest
+import responses
+from requests import PreparedRequest
+
+from mailtrap.api.resources.stats import StatsApi
+from mailtrap.config import GENERAL_HOST
+from mailtrap.exceptions import APIError
+from mailtrap.http import HttpClient
+from mailtrap.models.stats import DailySendingStatGroup
+from mailtrap.stats_store import StatsStore
+
+ACCOUNT_ID = 26730
+BASE_STATS_URL = f"https://{GENERAL_HOST}/api/accounts/{ACCOUNT_ID}/stats"
+
+
+def _stats(delivery_count: int) -> dict[str, Any]:
+    return {
+        "delivery_count": delivery_count,
+        "delivery_rate": 0.95,
+        "bounce_count": 1,
+        "bounce_rate": 0.05,
+        "open_count": 2,
+        "open_rate": 0.8,
+        "click_count": 3,
+        "click_rate": 0.5,
+        "spam_count": 0,
+        "spam_rate": 0.0,
+    }
+
+
+def _by_date_callback(request: PreparedRequest) -> tuple[int, dict, str]:
+    params = request.params  # type: ignore[attr-defined]
+    start = date.fromisoformat(params["start_date"])
+    end = date.fromisoformat(params["end_date"])
+    body = [
+        {"date": (start + timedelta(days=offset)).isoformat(), "stats": _stats(offset)}
+        for offset in range((end - start).days + 1)
+    ]
+    return 200, {}, json.dumps(body)
+
+
+def _by_domain_callback(request: PreparedRequest) -> tuple[int, dict, str]:
+    day = request.params["start_date"]  # type: ignore[attr-defined]
+    body = [
+        {"sending_domain_id": 1, "stats": _stats(int(day[-2:]))},
+        {"sending_domain_id": 2, "stats": _stats(100)},
+    ]
+    return 200, {}, json.dumps(body)
+
+
+@pytest.fixture
+def stats_api() -> StatsApi:
+    return StatsApi(client=HttpClient(GENERAL_HOST))
+
+
+class TestStatsStore:
+    @responses.activate
+    def test_sync_should_backfill_dates_in_chunks(self, stats_api: StatsApi) -> None:
+        responses.add_callback(
+            responses.GET, f"{BASE_STATS_URL}/date", callback=_by_date_callback
+        )
+        store = StatsStore(stats_api, ACCOUNT_ID, chunk_days=10)
+
+        fetched = store.sync("2026-01-01", "2026-01-31")
+
+        assert fetched == 31
+        assert len(responses.calls) == 4
+        rows = store.query("2026-01-01", "2026-01-31")
+        assert len(rows) == 31
+        assert isinstance(rows[0], DailySendingStatGroup)
+        assert rows[0].date == "2026-01-01"
+        assert rows[0].value == "2026-01-01"
+        assert rows[0].name == "date"
+        assert rows[10].stats.delivery_count == 0
+
+    @responses.activate
+    def test_sync_should_only_fetch_missing_days(
+        self, stats_api: StatsApi, tmp_path: Path
+    ) -> None:
+        responses.add_callback(
+            responses.GET, f"{BASE_STATS_URL}/date", callback=_by_date_callback
+        )
+        path = tmp_path / "stats.sqlite"
+        StatsStore(stats_api, ACCOUNT_ID, path=path).sync("2026-01-10", "2026-01-20")
+
+        store = StatsStore(stats_api, ACCOUNT_ID, path=path)
+        fetched = store.sync("2026-01-01", "2026-01-31")
+
+        assert fetched == 20
+        # Ranges are fetched concurrently, so their requests arrive in any order
+        params = [call.request.params for call in responses.calls[1:]]
+        assert sorted(params, key=lambda item: item["start_date"]) == [
+            {"start_date": "2026-01-01", "end_date": "2026-01-09"},
+            {"start_date": "2026-01-21", "end_date": "2026-01-31"},
+        ]
+        assert len(store.query("2026-01-01", "2026-01-31")) == 31
+        assert store.sync("2026-01-01", "2026-01-31") == 0
+
+    @responses.activate
+    def test_sync_should_cancel_remaining_chunks_on_error(
+        self, stats_api: StatsApi
+    ) -> None:
+        responses.get(f"{BASE_STATS_URL}/date", status=500, json={"errors": ["Error"]})
+        store = StatsStore(stats_api, ACCOUNT_ID, chunk_days=1, max_workers=1)
+
+        with pytest.raises(APIError):
+            store.sync("2026-01-01", "2026-01-10")
+
+        assert len(responses.calls) == 1
+        assert store.query("2026-01-01", "2026-01-10") == []
+
+    @responses.activate
+    def test_sync_should_refetch_mutable_days(self, stats_api: StatsApi) -> None:
+        responses.add_callback(
+            responses.GET, f"{BASE_STATS_URL}/date", callback=_by_date_callback
+        )
+        today = date(2026, 1, 31)
+        start = (today - timedelta(days=9)).isoformat()
+        store = StatsStore(stats_api, ACCOUNT_ID, mutable_days=2, today=lambda: today)
+
+        assert store.sync(start, today.isoformat()) == 10
+        assert store.sync(start, today.isoformat()) == 3
+        assert len(store.query(start, today.isoformat())) == 10
+
+    @responses.activate
+    def test_sync_should_store_groups_per_day(self, stats_api: StatsApi) -> None:
+        responses.add_callback(
+            responses.GET, f"{BASE_STATS_URL}/domains", callback=_by_domain_callback
+        )
+        store = StatsStore(stats_api, ACCOUNT_ID)
+
+        fetched = store.sync("2026-01-01", "2026-01-03", groups=["domains"])
+
+        assert fetched == 3
+        assert len(responses.calls) == 3
+        rows = store.query("2026-01-01", "2026-01-03", group="domains", value=1)
+        assert [(row.date, row.value) for row in rows] == [
+            ("2026-01-01", 1),
+            ("2026-01-02", 1),
+            ("2026-01-03", 1),
+        ]
+        assert [row.stats.delivery_count for row in rows] == [1, 2, 3]
+        assert rows[0].name == "sending_domain_id"
+        assert len(store.query("2026-01-01", "2026-01-03", group="domains")) == 6
+        assert store.query("2026-01-01", "2026-01-03", group="categories") == []
@@ -0,0 +1,79 @@
+import gc
+import logging
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import mailtrap as mt
+from mailtrap.http import HttpClient
+from mailtrap.testing import FakeMailtrapServer
+
+THREADS = 64
+SENDS_PER_THREAD = 10
+
+
+def _mail(index: int) -> mt.Mail:
+    return mt.Mail(
+        sender=mt.Address(email="sender@example.com"),
+        to=[mt.Address(email=f"user{index}@example.com")],
+        subject=f"Message {index}",
+        text="Hi",
+    )
+
+
+class TestThreadSafety:
+    def test_sessions_are_per_thread_and_share_the_pool(self) -> None:
+        client = HttpClient("mailtrap.io")
+        sessions = []
+
+        thread = threading.Thread(target=lambda: sessions.append(client._session))
+        thread.start()
+        thread.join()
+
+        assert sessions[0] is not client._session
+        assert sessions[0].get_adapter("https://mailtrap.io") is (
+            client._session.get_adapter("https://mailtrap.io")
+        )
+
+    def test_sessions_of_finished_threads_are_released(self) -> None:
+        client = HttpClient("mailtrap.io")
+        sessions = []
+
+        for _ in range(3):
+            thread = threading.Thread(
+                target=lambda: sessions.append(weakref.ref(client._session))
+            )
+            thread.start()
+            thread.join()
+        gc.collect()
+
+        assert [session() for session in sessions] == [None, None, None]
+
+    def test_send_from_many_threads(self, caplog: pytest.LogCaptureFixture) -> None:
+        with FakeMailtrapServer(latency=0.001) as server:
+            client = mt.MailtrapClient(
+                token="test", api_host=server.host, pool_maxsize=THREADS
+            )
+            barrier = threading.Barrier(THREADS)
+
+            def send(thread_index: int) -> list[bool]:
+                barrier.wait(timeout=10)  # start all threads at once
+                results = []
+                for index in range(SENDS_PER_THREAD):
+                    response = client.send(_mail(thread_index * SENDS_PER_THREAD + index))
+                    results.append(response["success"] is True)
+                return results
+
+            with caplog.at_level(logging.WARNING, logger="urllib3"):
+                with ThreadPoolExecutor(max_workers=THREADS) as executor:
+                    results = list(executor.map(send, range(THREADS)))
+
+            assert all(all(thread_results) for thread_results in results)
+            assert server.sent_count == THREADS * SENDS_PER_THREAD
+            assert server.statuses[200] == THREADS * SENDS_PER_THREAD
+            assert server.connections <= THREADS
+            subjects = {mail["subject"] for mail in server.sent_messages}
+            assert len(subjects) == THREADS * SENDS_PER_THREAD
+        assert "Connection pool is full" not in caplog.text
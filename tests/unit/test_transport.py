@@ -0,0 +1,205 @@
+import json
+from pathlib import Path
+
+import pytest
+import responses
+
+import mailtrap as mt
+from mailtrap.api.resources.email_logs import EmailLogsApi
+from mailtrap.exceptions import APIError
+from mailtrap.http import HttpClient
+from mailtrap.testing import FakeMailtrapServer
+from mailtrap.transport import REDACTED
+from mailtrap.transport import CassetteError
+from mailtrap.transport import Interaction
+from mailtrap.transport import RecordingTransport
+from mailtrap.transport import ReplayTransport
+
+ACCOUNT_ID = "1"
+SUPPRESSIONS_PATH = f"/api/accounts/{ACCOUNT_ID}/suppressions"
+BODY_PATH = f"/api/accounts/{ACCOUNT_ID}/inboxes/42/messages/42999999/body.txt"
+
+
+@pytest.fixture
+def cassette(tmp_path: Path) -> Path:
+    """Cassette with two email log pages, suppressions and a 404."""
+    path = tmp_path / "cassette.json"
+    with FakeMailtrapServer(email_logs_count=15, email_logs_page_size=10) as server:
+        with RecordingTransport(path) as transport:
+            client = HttpClient(server.host, transport=transport)
+            list(EmailLogsApi(client, ACCOUNT_ID).iter_pages())
+            client.get(SUPPRESSIONS_PATH)
+            with pytest.raises(APIError):
+                client.get("/api/unknown")
+    return path
+
+
+class TestRecordingTransport:
+    def test_records_interactions(self, cassette: Path) -> None:
+        interactions = json.loads(cassette.read_text())["interactions"]
+
+        paths = [item["request"]["path"] for item in interactions]
+        assert paths[0] == f"/api/accounts/{ACCOUNT_ID}/email_logs"
+        assert paths[1].startswith(f"{paths[0]}?search_after=")
+        assert paths[2:] == [SUPPRESSIONS_PATH, "/api/unknown"]
+        assert [item["response"]["status"] for item in interactions] == [
+            200,
+            200,
+            200,
+            404,
+        ]
+
+    def test_does_not_store_request_headers(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.json"
+        with FakeMailtrapServer() as server, RecordingTransport(path) as transport:
+            client = mt.MailtrapClient(
+                token="secret-token", api_host=server.host, transport=transport
+            )
+            client.send(
+                mt.Mail(
+                    sender=mt.Address(email="sender@example.com"),
+                    to=[mt.Address(email="user@example.com")],
+                    subject="Hello",
+                    text="Hi",
+                )
+            )
+
+        assert "secret-token" not in path.read_text()
+
+    def test_records_streamed_body_as_it_is_read(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.json"
+        with FakeMailtrapServer() as server, RecordingTransport(path) as transport:
+            client = HttpClient(server.host, transport=transport)
+            with client.stream(BODY_PATH, chunk_size=4) as chunks:
+                first = next(chunks)
+                assert transport.interactions[0]["response"]["body"] == ""
+                body = first + b"".join(chunks)
+
+        assert body.startswith(b"Hello")
+        interaction = json.loads(path.read_text())["interactions"][0]
+        assert interaction["response"]["body"] == body.decode()
+
+    def test_records_partially_read_body_on_close(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.json"
+        with FakeMailtrapServer() as server, RecordingTransport(path) as transport:
+            client = HttpClient(server.host, transport=transport)
+            with client.stream(BODY_PATH, chunk_size=4) as chunks:
+                first = next(chunks)
+
+        assert transport.interactions[0]["response"]["body"] == first.decode()
+
+    @responses.activate
+    def test_scrubs_secrets_by_default(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.json"
+        responses.post(
+            "https://mailtrap.io/api/tokens",
+            json={"name": "CI", "token": "token-value", "owner": {"api_key": "key"}},
+            headers={"X-Api-Key": "header-value"},
+        )
+        with RecordingTransport(path) as transport:
+            client = HttpClient("mailtrap.io", transport=transport)
+            client.post("/api/tokens", json={"name": "CI", "password": "hunter2"})
+
+        text = path.read_text()
+        for secret in ("token-value", "key", "header-value", "hunter2"):
+            assert f'"{secret}"' not in text
+        interaction = json.loads(text)["interactions"][0]
+        assert json.loads(interaction["request"]["body"]) == {
+            "name": "CI",
+            "password": REDACTED,
+        }
+        assert json.loads(interaction["response"]["body"])["name"] == "CI"
+        assert interaction["response"]["headers"]["X-Api-Key"] == REDACTED
+
+    def test_applies_redact_hook(self, tmp_path: Path) -> None:
+        def redact(interaction: Interaction) -> Interaction:
+            return {**interaction, "request": {**interaction["request"], "body": None}}
+
+        path = tmp_path / "cassette.json"
+        with FakeMailtrapServer() as server:
+            with RecordingTransport(path, redact=redact) as transport:
+                client = mt.MailtrapClient(
+                    token="test", api_host=server.host, transport=transport
+                )
+                client.send(
+                    mt.Mail(
+                        sender=mt.Address(email="sender@example.com"),
+                        to=[mt.Address(email="user@example.com")],
+                        subject="Hello",
+                        text="Hi",
+                    )
+                )
+
+        assert "user@example.com" not in path.read_text()
+        assert transport.interactions[0]["request"]["body"] is not None
+
+
+class TestReplayTransport:
+    @responses.activate  # any real request would fail
+    def test_replays_without_network(self, cassette: Path) -> None:
+        client = HttpClient("mailtrap.io", transport=ReplayTransport(cassette))
+
+        pages = list(EmailLogsApi(client, ACCOUNT_ID).iter_pages())
+        suppressions = client.get(SUPPRESSIONS_PATH)
+
+        assert [len(page.messages) for page in pages] == [10, 5]
+        assert len(suppressions) == 20
+        with pytest.raises(APIError) as exc_info:
+            client.get("/api/unknown")
+        assert exc_info.value.status == 404
+
+    def test_repeats_responses_in_recorded_order(self) -> None:
+        interactions = [
+            {
+                "request": {"method": "GET", "path": "/api/value", "body": None},
+                "response": {"status": 200, "headers": {}, "body": body},
+            }
+            for body in ("1", "2")
+        ]
+        client = HttpClient("mailtrap.io", transport=ReplayTransport(interactions))
+
+        assert [client.get("/api/value") for _ in range(5)] == [1, 2, 1, 2, 1]
+
+    def test_matches_body_when_requested(self) -> None:
+        interactions = [
+            {
+                "request": {
+                    "method": "POST",
+                    "path": "/api/echo",
+                    "body": f'{{"n": {n}}}',
+                },
+                "response": {"status": 200, "headers": {}, "body": str(n)},
+            }
+            for n in (1, 2)
+        ]
+        client = HttpClient(
+            "mailtrap.io", transport=ReplayTransport(interactions, match_body=True)
+        )
+
+        assert client.post("/api/echo", json={"n": 2}) == 2
+        with pytest.raises(CassetteError, match="No recorded response for POST"):
+            client.post("/api/echo", json={"n": 3})
+
+    def test_replays_binary_bodies_for_streaming(self) -> None:
+        interactions = [
+            {
+                "request": {"method": "GET", "path": "/api/file", "body": None},
+                "response": {"status": 200, "headers": {}, "body_base64": "AP8A/w=="},
+            }
+        ]
+        client = HttpClient("mailtrap.io", transport=ReplayTransport(interactions))
+
+        assert b"".join(client.stream("/api/file", chunk_size=1)) == b"\x00\xff\x00\xff"
+
+    def test_raises_on_unknown_request(self, cassette: Path) -> None:
+        client = HttpClient("mailtrap.io", transport=ReplayTransport(cassette))
+
+        with pytest.raises(CassetteError, match="No recorded response for GET /api/x"):
+            client.get("/api/x")
+
+    def test_rejects_unknown_cassette_version(self, tmp_path: Path) -> None:
+        path = tmp_path / "cassette.json"
+        path.write_text(json.dumps({"version": 99, "interactions": []}))
+
+        with pytest.raises(CassetteError, match="Unsupported cassette version 99"):
+            ReplayTransport(path)